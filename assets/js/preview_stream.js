@@ -0,0 +1,65 @@
+// Cast previews: one WebSocket (/ws/previews) for all <img data-preview="cast name"> of the page.
+// The server only encodes the previews that are subscribed here, so hidden or paused images cost nothing.
+// Binary message: [1 byte name length][name utf-8][JPEG data]
+(() => {
+    if (window.wvsPreview) {
+        return;
+    }
+
+    const decoder = new TextDecoder();
+    const state = { ws: null, last: '', urls: {} };
+    window.wvsPreview = state;
+
+    // names of the preview images visible on the page and not paused
+    function visibleNames() {
+        const names = new Set();
+        document.querySelectorAll('img[data-preview]').forEach((img) => {
+            if (img.offsetParent !== null && !img.hasAttribute('data-paused')) {
+                names.add(img.dataset.preview);
+            }
+        });
+        return Array.from(names).sort();
+    }
+
+    function syncNames() {
+        if (!state.ws || state.ws.readyState !== WebSocket.OPEN) {
+            return;
+        }
+        const names = JSON.stringify(visibleNames());
+        if (names !== state.last) {
+            state.last = names;
+            state.ws.send(names);
+        }
+    }
+
+    function showFrame(data) {
+        const bytes = new Uint8Array(data);
+        const name = decoder.decode(bytes.subarray(1, 1 + bytes[0]));
+        const url = URL.createObjectURL(new Blob([bytes.subarray(1 + bytes[0])], { type: 'image/jpeg' }));
+        document.querySelectorAll('img[data-preview]').forEach((img) => {
+            if (img.dataset.preview === name && !img.hasAttribute('data-paused')) {
+                img.src = url;
+            }
+        });
+        if (state.urls[name]) {
+            URL.revokeObjectURL(state.urls[name]);
+        }
+        state.urls[name] = url;
+    }
+
+    function connect() {
+        const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        const ws = new WebSocket(`${protocol}//${window.location.host}/ws/previews`);
+        ws.binaryType = 'arraybuffer';
+        ws.onopen = () => {
+            state.last = '';
+            syncNames();
+        };
+        ws.onmessage = (event) => showFrame(event.data);
+        ws.onclose = () => setTimeout(connect, 2000);
+        state.ws = ws;
+    }
+
+    connect();
+    setInterval(syncNames, 1000);
+})();
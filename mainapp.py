@@ -36,7 +36,7 @@ Key Architectural Components:
 5.  **Application Lifecycle Management**:
     -   `init_actions()`: This `async` function is registered with `app.on_startup`. It handles all necessary
         initialization tasks, such as creating the inter-process communication file, applying presets, and starting
-        the scheduler.
+        the scheduler and the worker pool (pre-started processes for preview windows and Coldtype scripts).
     -   `cleanup_on_shutdown()`: Registered with `app.on_shutdown`, this function ensures a graceful exit by stopping
         all background threads, processes, and services (like the scheduler and `RUNColdtype` processes) before the
         main application terminates.
@@ -92,6 +92,9 @@ from src.gui import niceutils as nice
 from src.gui.castcenter import CastCenter
 from src.gui.schedulergui import SchedulerGUI
 from src.txt.coldtypemp import RUNColdtype
+from src.utl.workerpool import WorkerPool
+from src.utl.mediacatalog import MediaCatalog
+from src.utl.mosaic import MosaicRenderer
 from src.gui.pyeditor import PythonEditor
 from src.gui.videoplayer import VideoPlayer
 from src.utl.webviewmanager import WebviewManager
@@ -190,6 +193,8 @@ async def cleanup_on_shutdown():
         scheduler_app.scheduler.stop()
 
     RUNColdtype.stop_all()
+    WorkerPool.stop()
+    MediaCatalog.stop()
 
     # Give a brief moment for processes to terminate
     await asyncio.sleep(0.2)
@@ -247,6 +252,9 @@ async def init_actions():
     # Initial, non-blocking call to psutil to establish a baseline for cpu_percent
     psutil.cpu_percent(interval=None, percpu=False)
 
+    # pre-start helper processes for preview windows and Coldtype scripts
+    WorkerPool.start(int(cfg_mgr.app_config.get('worker_pool', 1)))
+
     #
     main_logger.info(f'Main running {current_thread().name}')
     main_logger.info(f'Root page : {root_page}')
@@ -1467,16 +1475,20 @@ async def grid_view_page(wid: int = -1):
             ui.icon('fullscreen').classes('cursor-pointer ml-4').tooltip('Toggle Fullscreen').on('click',
                 fullscreen.toggle)
 
-    #
-    # niceGUI placeholder for background task
-    #
-    grid_container = ui.card().tight().classes('self-center w-full').props('flat no-border')
-    # grid columns come from config
-    columns = cfg_mgr.app_config['grid_view_columns']
-    # Set a timer to refresh the grid view periodically
-    timer = ui.timer(float(cfg_mgr.app_config['grid_view_refresh_interval']),callback='', active=False)
-    # run preview on its own thread
-    await run.io_bound(nice.run_preview_grid, grid_container, columns, timer, True)
+    async def open_tile_preview(e):
+        """Open the preview window of the cast under the click."""
+        if name := MosaicRenderer.tile_at(*e.args):
+            class_name = 'Desktop' if 'desktop' in name.lower() else 'Media'
+            await action_to_casts(class_name=class_name, cast_name=name, action='open-preview',
+                                  params='', clear=False, execute=True)
+
+    # One server side mosaic of all casts (see mosaic.py), streamed as MJPEG: only changed tiles are re-composited
+    mosaic = ui.element('img').props('src="/api/mosaic/mjpeg"').classes('self-center max-w-full cursor-pointer')
+    mosaic.tooltip('Click on a cast to open its preview window')
+    # click position in mosaic pixels
+    mosaic.on('click', open_tile_preview,
+              js_handler='(e) => emit(Math.floor(e.offsetX * e.target.naturalWidth / e.target.clientWidth), '
+                         'Math.floor(e.offsetY * e.target.naturalHeight / e.target.clientHeight))')
 
 """
 helpers /Commons main app pages
@@ -45,6 +45,7 @@ This is the primary mechanism for remote configuration.
 •Allows external clients to query the number of captured frames.
 •Provides a way to retrieve a specific captured frame as a base64 encoded image, which is excellent for remote previews.
 •Includes endpoints to save a frame to disk, either as a standard image or as a creative ASCII art text file.
+•Frame archives (long captures written to a memory-mapped file) can be listed and loaded back for replay.
 
 •Casting Control (/api/.../run_cast, /api/util/casts_info, /api/.../cast_actions):
 •run_cast: A simple trigger to start the casting process for a class.
@@ -59,6 +60,8 @@ control over individual casts (e.g., stopping a specific stream, taking a snapsh
 •Exposes many of the helper functions from utils.py and winutil.py through the API.
 •This includes getting window titles, listing media devices, triggering a network scan, downloading YouTube videos,
 and a critical blackout function to immediately stop all activity.
+•Media files can be baked into LED native clips (/api/util/bake, /api/util/clips), played by Media without any
+decoding or image processing.
 
 
 •Presets (/api/config/presets/...):
@@ -79,10 +82,23 @@ security practice.
 •Error Handling: It correctly handles disconnects and sends detailed error messages back to the client over the
 WebSocket if something goes wrong.
 
+4. Cast Previews (/ws/previews, /api/preview/{cast_name}/...)
+
+•/ws/previews: one WebSocket per page for all the preview images (grid view, control panel), JPEG sent as binary
+messages only when a new image exists. Casts encode preview images only while someone subscribes to them.
+•mjpeg / jpeg: MJPEG stream or single image of one cast, for external viewers.
+•/api/mosaic/...: one server side mosaic of all casts (see mosaic.py), used by the grid view page.
+
 
 """
 
 import ast
+import asyncio
+import contextlib
+import copy
+import json
+import os
+import threading
 import traceback
 
 from nicegui import app
@@ -90,6 +106,7 @@ from str2bool import str2bool
 from fastapi import Path as PathAPI
 from fastapi import HTTPException
 from fastapi import WebSocket
+from fastapi.responses import Response, StreamingResponse
 from starlette.websockets import WebSocketDisconnect
 from starlette.concurrency import run_in_threadpool
 from queue import Empty
@@ -99,9 +116,15 @@ from src.net.ddp_queue import DDPDevice
 from src.utl.multicast import MultiUtils as Multi
 from src.gui.presets import load_filter_preset, load_cast_preset
 from src.utl.utils import CASTUtils as Utils
+from src.utl.utils import CastAPI
 from src.utl.cv2utils import ImageUtils
 from src.utl.cv2utils import CV2Utils
 from src.utl.actionutils import ActionExecutor
+from src.utl.capturehub import CaptureHub
+from src.utl.mosaic import MosaicRenderer
+from src.utl.framestore import FrameArchive
+from src.utl.bakeclip import BakedClip, CLIP_EXT, COMPRESSIONS
+from src.utl.mediaclock import MediaClock
 
 from src.utl.winutil import *
 
@@ -286,7 +309,37 @@ async def buffer_count(class_name: str = PathAPI(description=f'Class name, shoul
     if validate_class(class_name):
         class_obj = get_class(class_name)
 
-    return {"buffer_count": len(class_obj.frame_buffer)}
+    return {"buffer_count": len(class_obj.frame_buffer), "buffer_store": class_obj.frame_buffer.get_stats()}
+
+
+@app.get("/api/util/archives", tags=["buffer"])
+async def util_archives():
+    """
+        List frame archive files (buffer_archive = True), newest first
+    """
+    return {"archives": FrameArchive.list_archives()}
+
+
+@app.get("/api/{class_name}/buffer/archive/{file_name}", tags=["buffer"])
+async def buffer_load_archive(class_name: str = PathAPI(description=f'Class name, should be in: {class_to_test}'),
+                              file_name: str = PathAPI(description='Archive file name, see /api/util/archives')):
+    """
+        Replace the frame buffer of a class by a frame archive (read only), to replay it
+        (buffer endpoints and 'cast_image' action read frames directly from the archive file)
+    """
+    class_obj = None
+    if validate_class(class_name):
+        class_obj = get_class(class_name)
+
+    if file_name not in FrameArchive.list_archives():
+        raise HTTPException(status_code=404, detail=f"Archive {file_name} does not exist")
+
+    try:
+        class_obj.frame_buffer = FrameArchive.open(cfg_mgr.app_root_path(f'tmp/archive/{file_name}'))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Archive {file_name} provide this error : {e}") from e
+
+    return {"buffer_count": len(class_obj.frame_buffer), "buffer_store": class_obj.frame_buffer.get_stats()}
 
 
 @app.get("/api/{class_name}/buffer/{number}", tags=["buffer"])
@@ -444,6 +497,62 @@ async def util_download_yt(yt_url: str):
     return {"youtube": "ok"}
 
 
+@app.get("/api/util/clips", tags=["media"])
+async def util_clips():
+    """
+        List baked clips (media/clips/*.wvsc), newest first, and the bake jobs progress
+    """
+    return {"clips": BakedClip.list_clips(), "jobs": BakedClip.jobs}
+
+
+@app.get("/api/util/bake", tags=["media"])
+async def util_bake(source: str,
+                    name: str = None,
+                    filter_preset: str = None,
+                    cast_preset: str = None,
+                    compression: str = None):
+    """
+        Bake a media file into an LED native clip, in background (progress: /api/util/clips)
+        Settings are the Media ones, with the filter / cast presets applied if given.
+        Cast the clip with Media, viinput = media/clips/<name>.wvsc
+    """
+    if not os.path.isfile(source):
+        raise HTTPException(status_code=404, detail=f"Media {source} does not exist")
+    if compression is not None and compression not in COMPRESSIONS:
+        raise HTTPException(status_code=400, detail=f"Compression {compression} not in {COMPRESSIONS}")
+
+    # work on a copy, running Media settings stay as they are
+    cast = copy.copy(get_class('Media'))
+    if filter_preset is not None and not await load_filter_preset(class_name='Media', class_obj=cast,
+                                                                  interactive=False, file_name=filter_preset):
+        raise HTTPException(status_code=400, detail=f"Not able to apply filter preset {filter_preset}")
+    if cast_preset is not None and not await load_cast_preset(class_name='Media', class_obj=cast,
+                                                              interactive=False, file_name=cast_preset):
+        raise HTTPException(status_code=400, detail=f"Not able to apply cast preset {cast_preset}")
+
+    try:
+        name = BakedClip.clip_name(name or os.path.splitext(os.path.basename(source))[0])
+    except ValueError as er:
+        raise HTTPException(status_code=400, detail=str(er)) from er
+
+    def bake_job():
+        # errors are logged and reported in jobs
+        with contextlib.suppress(Exception):
+            BakedClip.bake(cast, source, name=name, compression=compression)
+
+    threading.Thread(target=bake_job, daemon=True, name=f'Bake-{name}').start()
+
+    return {"bake": f'{name}{CLIP_EXT}'}
+
+
+@app.get("/api/util/media_clock", tags=["casts"])
+async def util_media_clock():
+    """
+        Master media clock status (followed by Media casts with master_clock)
+    """
+    return {"media_clock": MediaClock.get_stats()}
+
+
 @app.get("/api/util/device_net_scan", tags=["network"])
 async def util_device_net_scan():
     """
@@ -556,6 +665,89 @@ async def util_casts_info(img: bool = False):
     return {"t_info": sort_child_info_data}
 
 
+@app.get("/api/util/capture_hub", tags=["desktop"])
+async def util_capture_hub():
+    """
+        Get shared desktop capture sources, with number of casts using them and number of grabs
+    """
+    return {"capture_hub": CaptureHub.get_stats()}
+
+
+@app.get("/api/preview/{cast_name}/jpeg", tags=["casts"])
+async def preview_jpeg(cast_name: str):
+    """
+        Get the last preview image (JPEG) of a running cast
+        Image is only refreshed while the cast preview has subscribers
+    """
+    if (preview := CastAPI.previews.get(cast_name)) is None:
+        raise HTTPException(status_code=404, detail=f"No preview for cast: {cast_name}")
+    preview.subscribe()
+    try:
+        jpeg, _ = preview.get_jpeg()
+        if jpeg is None:
+            # first subscriber: wait for one frame to be encoded
+            for _ in range(20):
+                await asyncio.sleep(.05)
+                jpeg, _ = preview.get_jpeg()
+                if jpeg is not None:
+                    break
+    finally:
+        preview.unsubscribe()
+    if jpeg is None:
+        raise HTTPException(status_code=404, detail=f"No image available for cast: {cast_name}")
+    return Response(content=jpeg, media_type='image/jpeg')
+
+
+@app.get("/api/preview/{cast_name}/mjpeg", tags=["casts"])
+async def preview_mjpeg(cast_name: str):
+    """
+        MJPEG stream (multipart/x-mixed-replace) of a running cast preview, usable into an <img> tag or a player
+        Cast encodes preview images only while at least one client is connected
+    """
+    if (preview := CastAPI.previews.get(cast_name)) is None:
+        raise HTTPException(status_code=404, detail=f"No preview for cast: {cast_name}")
+
+    return StreamingResponse(mjpeg_stream(preview, lambda: CastAPI.previews.get(cast_name) is preview),
+                             media_type='multipart/x-mixed-replace; boundary=frame')
+
+
+@app.get("/api/mosaic/jpeg", tags=["casts"])
+async def mosaic_jpeg():
+    """
+        Get the last mosaic image (JPEG) of all running casts, as displayed by the grid view page
+    """
+    MosaicRenderer.subscribe()
+    try:
+        jpeg, _ = MosaicRenderer.get_jpeg()
+        for _ in range(20):
+            if jpeg is not None:
+                break
+            await asyncio.sleep(.05)
+            jpeg, _ = MosaicRenderer.get_jpeg()
+    finally:
+        MosaicRenderer.unsubscribe()
+    if jpeg is None:
+        raise HTTPException(status_code=404, detail="No mosaic image available")
+    return Response(content=jpeg, media_type='image/jpeg')
+
+
+@app.get("/api/mosaic/mjpeg", tags=["casts"])
+async def mosaic_mjpeg():
+    """
+        MJPEG stream of the mosaic of all running casts (grid view), rendered only while at least one client is connected
+    """
+    return StreamingResponse(mjpeg_stream(MosaicRenderer, lambda: True),
+                             media_type='multipart/x-mixed-replace; boundary=frame')
+
+
+@app.get("/api/mosaic/stats", tags=["casts"])
+async def mosaic_stats():
+    """
+        Get mosaic renderer counters (viewers, casts, renders, re-composited tiles, layouts)
+    """
+    return {"mosaic": MosaicRenderer.get_stats()}
+
+
 @app.get("/api/util/sl", tags=["casts"])
 async def list_cast_sl():
     """
@@ -826,9 +1018,81 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.close()
 
 
+@app.websocket("/ws/previews")
+async def websocket_previews(websocket: WebSocket):
+    """
+    WS cast previews: one connection for all the preview images of a page (grid, control panel)
+    Client sends the JSON list of cast names it displays, e.g. ["t-1234", "t-5678"], again each time it changes.
+    Server sends a binary message for each new image: [1 byte name length][name utf-8][JPEG data]
+    Only subscribed casts encode preview images.
+    """
+    await websocket.accept()
+
+    refresh_interval = float(cfg_mgr.app_config.get('preview_refresh_interval', 1.0))
+    subscribed = {}  # cast name -> (publisher, last seq sent)
+
+    async def receive_names():
+        while True:
+            names = json.loads(await websocket.receive_text())
+            wanted = {str(name) for name in names} if isinstance(names, list) else set()
+            for name in list(subscribed):
+                if name not in wanted:
+                    subscribed.pop(name)[0].unsubscribe()
+            for name in wanted - subscribed.keys():
+                if preview := CastAPI.previews.get(name):
+                    preview.subscribe()
+                    subscribed[name] = (preview, -1)
+
+    receiver = asyncio.create_task(receive_names())
+    try:
+        while not receiver.done():
+            for name, (preview, last_seq) in list(subscribed.items()):
+                current = CastAPI.previews.get(name)
+                if current is not preview:
+                    # cast stopped (or restarted with a new publisher)
+                    preview.unsubscribe()
+                    subscribed.pop(name)
+                    if current is not None:
+                        current.subscribe()
+                        subscribed[name] = (current, -1)
+                    continue
+                jpeg, seq = preview.get_jpeg()
+                if jpeg is not None and seq != last_seq:
+                    subscribed[name] = (preview, seq)
+                    name_bytes = name.encode()[:255]
+                    await websocket.send_bytes(bytes([len(name_bytes)]) + name_bytes + jpeg)
+            await asyncio.sleep(refresh_interval)
+        receiver.result()
+
+    except WebSocketDisconnect:
+        api_logger.debug('previews ws closed')
+    except Exception as e:
+        api_logger.error(f'previews ws error: {e}')
+    finally:
+        receiver.cancel()
+        for preview, _ in subscribed.values():
+            preview.unsubscribe()
+
+
 """
 helpers
 """
+async def mjpeg_stream(source, alive):
+    """MJPEG parts of source (get_jpeg / subscribe / unsubscribe) while alive() is True, subscribed meanwhile."""
+    refresh_interval = float(cfg_mgr.app_config.get('preview_refresh_interval', 1.0))
+    source.subscribe()
+    last_seq = -1
+    try:
+        while alive():
+            jpeg, seq = source.get_jpeg()
+            if jpeg is not None and seq != last_seq:
+                last_seq = seq
+                yield (b'--frame\r\nContent-Type: image/jpeg\r\n'
+                       b'Content-Length: ' + str(len(jpeg)).encode() + b'\r\n\r\n' + jpeg + b'\r\n')
+            await asyncio.sleep(refresh_interval)
+    finally:
+        source.unsubscribe()
+
 def validate_class(class_name):
     if class_name not in class_to_test:
         raise HTTPException(status_code=400, detail=f"Class name: {class_name} not in {class_to_test}")
@@ -84,7 +84,7 @@ Threaded Sending: Uses thread pools to synchronize frame delivery across devices
 Preview Handling:
 Uses OpenCV for preview windows.
 On non-Windows platforms, can run preview in a separate process for stability.
-Shared memory (ShareableList) is used for inter-process communication.
+Shared memory (PreviewChannel) is used for inter-process communication.
 
 5. Action/Event Handling
 ActionExecutor: Integrates with an action utility to process runtime commands (e.g., stop, update preview).
@@ -105,21 +105,21 @@ Purpose: Demonstrates how to instantiate and run a simple desktop cast using the
 
 
 """
-import errno
 import ast
 import os
 import time
 import imageio.v3 as iio
-import concurrent.futures
 import contextlib
 import threading
 import cv2
 import numpy as np
 
-from multiprocessing.shared_memory import ShareableList
 from asyncio import run as as_run
 
-from src.utl.multicast import IPSwapper
+from src.utl.multicast import IPSwapper, MulticastSender
+from src.utl.capturehub import CaptureHub
+from src.utl.motion import ChangeDetector, AdaptiveRate
+from src.utl.pacer import FramePacer
 from src.utl.multicast import MultiUtils as Multi
 from src.net.ddp_queue import DDPDevice
 from src.net.e131_queue import E131Device
@@ -127,6 +127,10 @@ from src.net.artnet_queue import ArtNetDevice
 from src.utl.winutil import get_window_rect, get_window_handle
 from src.utl.sharedlistclient import SharedListClient
 from src.utl.sharedlistmanager import SharedListManager
+from src.utl.previewchannel import PreviewChannel
+from src.utl.framestore import FrameStore
+from src.utl.cv2utils import PreviewWindow
+from src.utl.workerpool import WorkerPool
 from src.utl.text_utils import TextAnimatorMixin
 
 from src.utl.actionutils import *
@@ -192,6 +196,9 @@ class CASTDesktop(TextAnimatorMixin):
         else:
             self.capture_methode = 'av'
         self.rate: int = 25
+        self.adaptive_rate: bool = False  # content adaptive rate, between rate_min and rate_max
+        self.rate_min: int = 5
+        self.rate_max: int = 0  # 0 = rate
         self.stopcast: bool = True
         self.scale_width: int = 128
         self.scale_height: int = 128
@@ -218,6 +225,7 @@ class CASTDesktop(TextAnimatorMixin):
         self.preview_top: bool = False
         self.preview_w: int = 640
         self.preview_h: int = 360
+        self.preview_fps: int = 10  # max rate of the UI preview (grid / control panel), independent of cast rate
         self.preview_text = str2bool(cfg_mgr.app_config['preview_text']) if cfg_mgr.app_config is not None else False
         self.custom_text: str = ""
         self.overlay_text = str2bool(cfg_mgr.text_config['overlay_text']) if cfg_mgr.app_config is not None else False
@@ -229,7 +237,7 @@ class CASTDesktop(TextAnimatorMixin):
         self.vo_codec: str = 'h264'
         self.vooutput: str = 'udp://127.0.0.1:12345?pkt_size=1316'
         self.put_to_buffer: bool = False
-        self.frame_buffer: list = []
+        self.frame_buffer = FrameStore()  # see framestore.py, capacity is frame_max
         self.frame_max: int = 8
         self.multicast: bool = False
         self.cast_x: int = 1
@@ -319,7 +327,8 @@ class CASTDesktop(TextAnimatorMixin):
 
         desktop_logger.debug(f'Child thread: {t_name}')
 
-        t_send_frame = threading.Event()  # thread listen event to send frame via ddp, for multicast synchro
+        # frame_max may have been updated since last cast, or frames go to an archive file (see framestore.py)
+        self.frame_buffer = FrameStore.renew(self.frame_buffer, self.frame_max, t_name, self.rate)
 
         t_preview = self.preview
         t_scale_width = self.scale_width
@@ -370,10 +379,8 @@ class CASTDesktop(TextAnimatorMixin):
 
         """
         """
-        # Calculate the interval between frames in seconds (fps)
-        if self.rate != 0:
-            interval: float = 1.0 / self.rate
-        else:
+        # frame interval is computed by the FramePacer, rate only needs to be valid
+        if self.rate == 0:
             desktop_logger.error(f'{t_name} Rate could not be zero')
             return False
 
@@ -381,50 +388,33 @@ class CASTDesktop(TextAnimatorMixin):
         MultiCast inner function protected from what happens outside.
         """
 
-        def send_multicast_image(ip, image):
-            """
-            This sends an image to an IP address
-            :param ip:
-            :param image:
-            :return:
-            """
-            if t_protocol == 'ddp':
-                # timeout provided to not have thread waiting infinitely
-                if t_send_frame.wait(timeout=.5):
-                    # send ddp data, we select DDPDevice based on the IP
-                    for ddp_dev in t_ddp_multi_names:
-                        if ip == ddp_dev._destination:
-                            ddp_dev.send_to_queue(image, self.retry_number)
-                            CASTDesktop.total_packets += ddp_dev.frame_count
-                            break
-                else:
-                    desktop_logger.warning(f'{t_name} Multicast frame dropped')
-
         def send_multicast_images_to_ips(images_buffer, to_ip_addresses):
             """
-            Create a thread for each image , IP pair and wait for all to finish
-            Very simple synchro process
-            :param images_buffer:
-            :param to_ip_addresses:
-            :return:
+            Send images to multiple IP addresses for multicast feature:
+            a unique image to each address (grid/matrix mode) or the same image to all addresses.
+            Persistent per-device workers (MulticastSender) release all devices at the same time.
+
+            Args:
+                images_buffer (list): List of images to send.
+                to_ip_addresses (list): List of IP addresses to send images to.
+
+            Returns:
+                None
             """
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                if t_multicast and (t_cast_x != 1 or t_cast_y != 1):
-                    # Submit a thread for each image and IP pair
-                    multicast = [executor.submit(send_multicast_image, ip, image)
-                                 for ip, image in zip(to_ip_addresses, images_buffer)]
-                else:
-                    # Submit a thread for each IP with same image
-                    multicast = [executor.submit(send_multicast_image, ip, images_buffer[0])
-                                 for ip in to_ip_addresses]
+            if multicast_sender is None:
+                return
 
-                # once all threads up, need to set event because they wait for
-                t_send_frame.set()
+            if t_multicast and (t_cast_x != 1 or t_cast_y != 1):
+                # each image to its IP
+                pairs = zip(to_ip_addresses, images_buffer)
+            else:
+                # same image to each IP
+                pairs = ((ip, images_buffer[0]) for ip in to_ip_addresses)
 
-                # Wait for all threads to complete
-                concurrent.futures.wait(multicast, timeout=1)
+            if not multicast_sender.send(pairs, self.retry_number):
+                desktop_logger.warning(f'{t_name} Multicast frame dropped')
 
-            t_send_frame.clear()
+            CASTDesktop.total_packets += multicast_sender.packets()
 
         """
         End Multicast
@@ -446,6 +436,8 @@ class CASTDesktop(TextAnimatorMixin):
             desktop_logger.debug(f"{t_name} We are inside todo :{CASTDesktop.cast_name_todo}")
 
             try:
+                # pacing statistics for info
+                cast_stats['pacer'] = pacer.get_stats()
                 # will read cast_name_todo list and see if something to do
                 (new_todo_stop,
                  new_preview,
@@ -454,7 +446,7 @@ class CASTDesktop(TextAnimatorMixin):
                  remain_to_do) = action_executor.process_actions(i_frame, i_frame_count)
 
                 if new_frame_buffer is not None:
-                    self.frame_buffer.append(new_frame_buffer)
+                    self.frame_buffer.append(new_frame_buffer, force=True)
                 if new_cast_frame_buffer is not None:
                     self.cast_frame_buffer.append(new_cast_frame_buffer)
 
@@ -479,8 +471,43 @@ class CASTDesktop(TextAnimatorMixin):
         frame processing
         """
 
+        def send_payload(payload):
+            """
+            send again the last device payload (keepalive for static content)
+            """
+            if payload is None:
+                return
+            if t_multicast:
+                send_multicast_images_to_ips(payload, ip_addresses)
+            elif t_protocol == 'ddp':
+                if ip_addresses[0] != '127.0.0.1':
+                    ddp_host.send_to_queue(payload, self.retry_number)
+                    CASTDesktop.total_packets += ddp_host.frame_count
+            elif t_protocol == 'e131':
+                e131_host.send_to_queue(payload)
+            elif t_protocol == 'artnet':
+                artnet_host.send_to_queue(payload)
+
         def process_frame(iframe):
 
+            # static content: reuse previous result and payload, only send keepalive
+            if change_detector is not None and not self.text_animator and not self.record:
+                filter_state = (self.gamma, self.auto_bright, self.clip_hist_percent, self.saturation,
+                                self.brightness, self.contrast, self.sharpen, self.balance_r, self.balance_g,
+                                self.balance_b, self.flip, self.flip_vh, tuple(ip_addresses))
+                if not change_detector.changed(iframe, filter_state):
+                    cast_stats['skipped'] += 1
+                    if change_detector.keepalive_due():
+                        try:
+                            send_payload(change_detector.payload)
+                        except Exception as err:
+                            desktop_logger.error(traceback.format_exc())
+                            desktop_logger.error(f'{t_name} An exception occurred: {err}')
+                            raise ExitFromLoop
+                    if rate_adapter is not None:
+                        cast_stats['rate'] = rate_adapter.update(change_detector.result[0])
+                    return change_detector.result
+
             # resize frame for sending to device
             iframe = CV2Utils.resize_image(iframe, t_scale_width, t_scale_height)
 
@@ -553,7 +580,7 @@ class CASTDesktop(TextAnimatorMixin):
                     # split to matrix
                     t_cast_frame_buffer = Multi.split_image_to_matrix(iframe, t_cast_x, t_cast_y)
                     # save frame to np buffer if requested (so can be used after by the main)
-                    if self.put_to_buffer and frame_count <= self.frame_max:
+                    if self.put_to_buffer:
                         self.frame_buffer.append(iframe)
 
                 else:
@@ -572,6 +599,7 @@ class CASTDesktop(TextAnimatorMixin):
                 try:
 
                     send_multicast_images_to_ips(t_cast_frame_buffer, ip_addresses)
+                    payload = t_cast_frame_buffer
 
                 except Exception as err:
                     desktop_logger.error(traceback.format_exc())
@@ -584,8 +612,7 @@ class CASTDesktop(TextAnimatorMixin):
                 i_grid = False
 
                 frame_to_send = iframe
-                # resize frame to pixelart
-                iframe = CV2Utils.pixelart_image(iframe, t_scale_width, t_scale_height)
+                payload = [frame_to_send] if t_multicast else frame_to_send
 
                 # Protocols run in separate thread to avoid block main loop
                 # here we feed the queue that is read by Net thread
@@ -632,7 +659,7 @@ class CASTDesktop(TextAnimatorMixin):
                     artnet_host.send_to_queue(frame_to_send)
 
                 # save frame to np buffer if requested (so can be used after by the main)
-                if self.put_to_buffer and frame_count <= self.frame_max:
+                if self.put_to_buffer:
                     self.frame_buffer.append(frame)
 
             """
@@ -641,6 +668,14 @@ class CASTDesktop(TextAnimatorMixin):
             if self.record and out_file is not None:
                 out_file.write_frame(frame)
 
+            if change_detector is not None:
+                change_detector.payload = payload
+                change_detector.result = (iframe, i_grid)
+
+            # motion energy on the small processed frame
+            if rate_adapter is not None:
+                cast_stats['rate'] = rate_adapter.update(iframe)
+
             return iframe, i_grid
 
         """
@@ -657,62 +692,55 @@ class CASTDesktop(TextAnimatorMixin):
 
             if str2bool(cfg_mgr.app_config['preview_proc']):
                 # for non-win platform mainly, cv2.imshow() need to run into Main thread
-                # We use ShareableList to share data between this thread and new process
-                # preview window is managed by CV2Utils.sl_main_preview() running from sl_process
+                # We use a PreviewChannel to share data between this thread and new process
+                # preview window is managed by CV2Utils.sl_main_proc_preview() running from sl_process
                 if sl is not None:
-                    # working with the shared list
                     # what to do from data updated by the child process (keystroke from preview window)
-                    if sl[11] is True:
+                    if sl.get('todo_stop'):
                         i_todo_stop = True
-                    elif sl[6] is False:
+                    elif not sl.get('preview'):
                         i_preview = False
-                    else:
-                        # Update Data on shared List
-                        self.preview_text = sl[15] is not False
-                        sl[0] = CASTDesktop.total_frames
-                        #
-                        # append not zero value to bytes to solve ShareableList bug
-                        # see https://github.com/python/cpython/issues/106939
-                        sl[1] = CV2Utils.frame_add_one(frame)
-                        #
-                        sl[5] = self.preview_top
-                        sl[7] = self.preview_w
-                        sl[8] = self.preview_h
-                        sl[9] = self.pixel_w
-                        sl[10] = self.pixel_h
-                        sl[12] = frame_count
-                        sl[15] = self.preview_text
+                    elif sl.due(preview_window_fps):
+                        # publish frame and display data, this wakes up the preview process
+                        self.preview_text = sl.get('text')
+                        sl.write(iframe,
+                                 total_frames=CASTDesktop.total_frames,
+                                 preview_top=self.preview_top,
+                                 preview_w=self.preview_w,
+                                 preview_h=self.preview_h,
+                                 pixel_w=self.pixel_w,
+                                 pixel_h=self.pixel_h,
+                                 frame_count=frame_count,
+                                 text=self.preview_text,
+                                 grid=i_grid)
                 else:
                     desktop_logger.error('This cast need to be created with preview = True')
                     i_preview = False
 
             else:
 
-                # for win, not necessary to use child process as this work from thread (avoid overhead)
-                if not CV2Utils.window_exists(win_name):
-                    cv2.namedWindow(win_name, cv2.WINDOW_NORMAL)
-
-                i_preview, i_todo_stop, self.preview_text = CV2Utils.cv2_display_frame(
-                    CASTDesktop.total_frames,
-                    iframe,
-                    port,
-                    t_viinput,
+                # for win, not necessary to use child process: window is rendered by its own thread (PreviewWindow)
+                # at its own rate, the cast only hands over its latest frame
+                i_preview, i_todo_stop, self.preview_text = PreviewWindow.publish(
                     t_name,
-                    self.preview_top,
-                    i_preview,
-                    self.preview_w,
-                    self.preview_h,
-                    self.pixel_w,
-                    self.pixel_h,
-                    i_todo_stop,
-                    frame_count,
-                    t_fps,
-                    ip_addresses,
-                    self.preview_text,
-                    self.custom_text,
-                    self.cast_x,
-                    self.cast_y,
-                    i_grid)
+                    win_name,
+                    iframe,
+                    total_frame=CASTDesktop.total_frames,
+                    server_port=port,
+                    t_viinput=t_viinput,
+                    preview_top=self.preview_top,
+                    preview_w=self.preview_w,
+                    preview_h=self.preview_h,
+                    pixel_w=self.pixel_w,
+                    pixel_h=self.pixel_h,
+                    frame_count=frame_count,
+                    fps=t_fps,
+                    ip_addresses=ip_addresses,
+                    text=self.preview_text,
+                    custom_text=self.custom_text,
+                    cast_x=self.cast_x,
+                    cast_y=self.cast_y,
+                    grid=i_grid)
 
             return i_preview, i_todo_stop
 
@@ -721,81 +749,95 @@ class CASTDesktop(TextAnimatorMixin):
         """
 
         """
-        create shareable list for preview      
+        create preview channel for preview
         """
 
         def create_sl_for_preview(i_frame, i_grid):
             i_sl = None
-            # Create a (9999, 9999, 3) array with all values set to 111 to reserve memory
-            frame_info = i_frame.shape
-            frame_info_list = list(frame_info)
-            frame_info = tuple(frame_info_list)
-            full_array = np.full(frame_info, 111, dtype=np.uint8)
-            # create a shared list, name is thread name + _p
+            # create a preview channel, name is thread name + _p
             sl_name_p = f'{t_name}_p'
             try:
-                i_sl = ShareableList(
-                    [
-                        CASTDesktop.total_frames,
-                        full_array.tobytes(),
-                        port,
-                        t_viinput,
-                        t_name,
-                        self.preview_top,
-                        t_preview,
-                        self.preview_w,
-                        self.preview_h,
-                        self.pixel_w,
-                        self.pixel_h,
-                        t_todo_stop,
-                        frame_count,
-                        t_fps,
-                        str(ip_addresses),
-                        self.preview_text,
-                        self.custom_text,
-                        self.cast_x,
-                        self.cast_y,
-                        i_grid,
-                        str(list(frame_info))
-                    ],
-                    name=sl_name_p)
-
-            except OSError as err:
-                if err.errno == errno.EEXIST:  # errno.EEXIST is 17 (File exists)
-                    desktop_logger.warning(f"Shared memory '{sl_name_p}' already exists. Attaching to it.")
-                    i_sl = ShareableList(name=sl_name_p)
+                i_sl = PreviewChannel.create(
+                    sl_name_p,
+                    i_frame.shape,
+                    total_frames=CASTDesktop.total_frames,
+                    server_port=port,
+                    t_viinput=t_viinput,
+                    t_name=t_name,
+                    preview_top=self.preview_top,
+                    preview=t_preview,
+                    preview_w=self.preview_w,
+                    preview_h=self.preview_h,
+                    pixel_w=self.pixel_w,
+                    pixel_h=self.pixel_h,
+                    todo_stop=t_todo_stop,
+                    frame_count=frame_count,
+                    fps=t_fps,
+                    ip_addresses=ip_addresses,
+                    text=self.preview_text,
+                    custom_text=self.custom_text,
+                    cast_x=self.cast_x,
+                    cast_y=self.cast_y,
+                    grid=i_grid)
 
             except Exception as err:
                 desktop_logger.error(traceback.format_exc())
-                desktop_logger.error(f'{t_name} Exception on shared list {sl_name_p} creation : {err}')
+                desktop_logger.error(f'{t_name} Exception on preview channel {sl_name_p} creation : {err}')
+                return None, None
 
             #
             # run sl_main_proc_preview in another process
             # create a child process, so cv2.imshow() will run from its own Main Thread
             #
             w_name = f"{Utils.get_server_port()}-{t_name}-{str(t_viinput)}"
-            i_sl_process = CASTDesktop.Process(target=CV2Utils.sl_main_proc_preview,
-                                               args=(sl_name_p, 'Desktop', w_name,))
-            i_sl_process.daemon = True
-            # start the child process
-            # small delay should occur, OS take some time to initiate the new process
-            i_sl_process.start()
+            # a pre-started worker is used if ready, otherwise a new (daemon) process is started
+            i_sl_process = WorkerPool.submit(CV2Utils.sl_main_proc_preview, (sl_name_p, 'Desktop', w_name,))
             desktop_logger.debug(f'Starting Child Process for Preview : {sl_name_p}')
 
             return i_sl, i_sl_process
 
+        def get_mss_monitor(i_sct):
+            """
+            define the screen region to capture with mss, None if not possible
+            """
+            if t_viinput == 'area':
+                # specific area
+                # Calculate crop parameters : ; 19/06/2024 coordinates for 2 monitor need to be reviewed
+                x1 = int(self.screen_coordinates[0])
+                y1 = int(self.screen_coordinates[1])
+                x2 = int(self.screen_coordinates[2])
+                y2 = int(self.screen_coordinates[3])
+                # Define the screen region to capture
+                # monitor = {"top": 100, "left": 100, "width": 800, "height": 600}
+                return {'top': y1, 'left': x1, 'width': x2 - x1, 'height': y2 - y1}
+
+            elif t_viinput == 'desktop':
+                # Get monitor dimensions for full-screen capture
+                # [0] is the virtual screen, [1] is the primary monitor [2] second one
+                return i_sct.monitors[monitor + 1]
+
+            elif t_viinput.lower().startswith('win='):
+                rect = get_window_rect(mss_window_name)
+                if rect:
+                    left, top, width, height = rect
+                    return {"top": top, "left": left, "width": width, "height": height}
+
+                desktop_logger.error(f"Window '{mss_window_name}' not found.")
+
+            else:
+                desktop_logger.error('Not available with mss')
+
+            return None
+
         def need_to_sleep():
             """
             do we need to sleep to be compliant with selected rate (fps)
             """
-            # Calculate the current time
-            current_time = time.time()
+            if rate_adapter is not None:
+                # content adaptive rate: pacing follow the effective rate
+                pacer.set_rate(rate_adapter.rate)
 
-            # Calculate the time to sleep to maintain the desired FPS
-            sleep_time = expected_time - current_time
-
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            pacer.wait()
 
         """
         First, check devices 
@@ -853,6 +895,7 @@ class CASTDesktop(TextAnimatorMixin):
 
         # specifics for Multicast
         swapper = None
+        multicast_sender = None
         #
         if t_multicast:
             # validate cast_devices list
@@ -900,6 +943,11 @@ class CASTDesktop(TextAnimatorMixin):
                 # initiate IPSwapper
                 swapper = IPSwapper(ip_addresses)
 
+                # persistent multicast workers, one per DDP device
+                if t_protocol == 'ddp':
+                    multicast_sender = MulticastSender({ddp_dev._destination: ddp_dev
+                                                        for ddp_dev in t_ddp_multi_names})
+
         else:
 
             ip_addresses = [self.host]
@@ -921,6 +969,12 @@ class CASTDesktop(TextAnimatorMixin):
 
         t_fps = self.rate
 
+        # content adaptive rate, capture need to run at max rate
+        rate_adapter = None
+        if self.adaptive_rate:
+            rate_adapter = AdaptiveRate(self.rate_min, self.rate_max or self.rate)
+            t_fps = rate_adapter.rate_max
+
         if self.allow_text_animator:
             self.start_text_animator()
         else:
@@ -936,10 +990,8 @@ class CASTDesktop(TextAnimatorMixin):
                     self.sl_manager = SharedListManager()
 
                 self.sl_manager.start()
-                #Let some time to init
-                time.sleep(1)
 
-            # check SL Manager server is running
+            # check SL Manager is running
             if self.sl_manager.is_running:
                 # retrieve IP,port from SL Manager
                 sl_ip, sl_port = self.sl_manager.address
@@ -951,8 +1003,11 @@ class CASTDesktop(TextAnimatorMixin):
                 desktop_logger.error('SL Manager not running')
                 return False
 
-            # create ShareAbleList ( frame, time )
+            # create shared frame ring ( frames, time )
             sl_queue = sl_client.create_shared_list(sl_name_q, t_scale_width, t_scale_height, time.time())
+            if sl_queue is not None:
+                # producers will notify each new frame
+                sl_queue.enable_doorbell()
 
         elif capture_methode == 'av':
 
@@ -1028,9 +1083,34 @@ class CASTDesktop(TextAnimatorMixin):
                     t_viinput = os.getenv('DISPLAY')
 
         win_name = f"{Utils.get_server_port()}-{t_name}-{str(t_viinput)}"[:64]
+        # preview window (thread or process) render rate, independent of the cast rate
+        preview_window_fps = int(cfg_mgr.app_config.get('preview_window_fps', 30))
+
+        # Shared capture: casts on the same source use the same grab (see CaptureHub)
+        hub_sub = None
+        use_hub = (t_viinput != 'SharedList'
+                   and 'other' not in self.protocol
+                   and cfg_mgr.desktop_config is not None
+                   and str2bool(cfg_mgr.desktop_config.get('capture_hub', 'False')))
+
+        if use_hub and capture_methode == 'av':
+            hub_sub = CaptureHub.subscribe_av(t_viinput,
+                                              self.viformat,
+                                              input_options,
+                                              t_fps,
+                                              multi_thread=str2bool(cfg_mgr.desktop_config['multi_thread']),
+                                              size=(t_scale_width, t_scale_height))
+
+        elif use_hub and capture_methode == 'mss':
+            with mss.mss() as sct:
+                sc_monitor = get_mss_monitor(sct)
+                monitors = sct.monitors
+            if sc_monitor is None:
+                return False
+            hub_sub = CaptureHub.subscribe_mss(monitors, sc_monitor, t_fps)
 
         # Open av input container in read mode if not SL and not mss
-        if t_viinput != 'SharedList' and capture_methode == 'av':
+        if t_viinput != 'SharedList' and capture_methode == 'av' and hub_sub is None:
             try:
 
                 input_container = av.open(t_viinput, 'r', format=self.viformat, options=input_options)
@@ -1088,6 +1168,24 @@ class CASTDesktop(TextAnimatorMixin):
 
         start_time = time.time()
 
+        # per cast counters, reported by the info action
+        cast_stats = {'skipped': 0}
+        if rate_adapter is not None:
+            cast_stats['rate'] = rate_adapter.rate
+
+        # keep the requested rate on a monotonic clock
+        pacer = FramePacer(t_fps,
+                           late_policy=cfg_mgr.app_config.get('late_frames', 'skip'),
+                           spin=float(cfg_mgr.app_config.get('spin_time', 0.001)))
+
+        # skip processing of unchanged (static) frames
+        change_detector = None
+        if cfg_mgr.desktop_config is not None and str2bool(cfg_mgr.desktop_config.get('skip_static', 'False')):
+            change_detector = ChangeDetector(probe_width=min(64, t_scale_width * t_cast_x),
+                                             probe_height=min(64, t_scale_height * t_cast_y),
+                                             threshold=float(cfg_mgr.desktop_config.get('static_threshold', 3)),
+                                             keepalive=float(cfg_mgr.desktop_config.get('keepalive', 1)))
+
         # --- Initialization (do this once before the loop starts) ---
         action_executor = ActionExecutor(
             class_obj=self,  # Pass the instance of Media/Desktop itself
@@ -1108,23 +1206,25 @@ class CASTDesktop(TextAnimatorMixin):
             swapper=swapper,
             shared_buffer=shared_buffer,  # queue
             logger=desktop_logger,
-            t_protocol=t_protocol
+            t_protocol=t_protocol,
+            cast_stats=cast_stats
         )
         # --- End Initialization ---
 
         """
         Manage latest frame preview dict
         """
-        from src.utl.utils import LatestFrame, CastAPI
-        if t_name not in CastAPI.previews: CastAPI.previews[t_name] = LatestFrame()
-
-        preview_w = int(cfg_mgr.app_config.get('grid_preview_width', 240))
-        preview_h = int(cfg_mgr.app_config.get('grid_preview_height', 135))
+        from src.utl.utils import PreviewPublisher, CastAPI
+        if t_name not in CastAPI.previews:
+            CastAPI.previews[t_name] = PreviewPublisher(int(cfg_mgr.app_config.get('grid_preview_width', 240)),
+                                                        int(cfg_mgr.app_config.get('grid_preview_height', 135)),
+                                                        int(cfg_mgr.app_config.get('preview_quality', 70)))
+        ui_preview = CastAPI.previews[t_name]
 
         #
         # Main loop
         #
-        if input_container is not None or sl_queue is not None or capture_methode == 'mss':
+        if input_container is not None or sl_queue is not None or hub_sub is not None or capture_methode == 'mss':
 
             desktop_logger.info(f"{t_name} Capture from {t_viinput}")
             desktop_logger.debug(f"{t_name} Stopcast value : {self.stopcast}")
@@ -1141,9 +1241,6 @@ class CASTDesktop(TextAnimatorMixin):
                     try:
                         for frame in input_container.decode(input_stream):
 
-                            # Calculate the expected time for the current frame
-                            expected_time = start_time + frame_count * interval
-
                             if self.record and out_file is None:
                                 out_file = iio.imopen(self.output_file, "w", plugin="pyav")
                                 out_file.init_video_stream(self.vo_codec, fps=t_fps)
@@ -1193,7 +1290,7 @@ class CASTDesktop(TextAnimatorMixin):
 
                                 # preview on fixed size window and receive back value from keyboard
                                 if t_preview:
-                                    # create ShareableList if necessary
+                                    # create preview channel if necessary
                                     if frame_count == 1 and str2bool(cfg_mgr.app_config['preview_proc']):
                                         sl, sl_process = create_sl_for_preview(frame, grid)
                                         if sl is None or sl_process is None:
@@ -1203,11 +1300,8 @@ class CASTDesktop(TextAnimatorMixin):
                                     t_preview, t_todo_stop = show_preview(frame, t_preview, t_todo_stop, grid)
 
                             # --- UI Preview Frame ---
-                            # Resize the frame to thumbnail size for efficient UI preview.
-                            # Use a copy to avoid affecting the original 'frame' used elsewhere.
-                            thumbnail_frame = CV2Utils.resize_image(frame.copy(), preview_w, preview_h, keep_ratio=False)
-                            # Update the shared preview dictionary for the UI with the small thumbnail.
-                            CastAPI.previews[t_name].set(ImageUtils.image_array_to_base64(thumbnail_frame))
+                            # Encoded only if someone is watching (grid / control panel), at preview rate.
+                            ui_preview.offer(frame, self.preview_fps)
 
                             # check to see if something to do
                             if CASTDesktop.t_todo_event.is_set() and shared_buffer is not None:
@@ -1230,8 +1324,8 @@ class CASTDesktop(TextAnimatorMixin):
                     # The default image to show if the queue is empty for too long.
                     default_img = CV2Utils.resize_image(cv2.imread(cfg_mgr.app_root_path('assets/Source-intro.png')), 640, 360)
 
-                    # create ShareableList for preview if necessary
-                    # this list contains more array and values than for simple frame queue
+                    # create preview channel if necessary
+                    # the channel carries display settings in addition to the frame
                     #
                     if t_preview and str2bool(cfg_mgr.app_config['preview_proc']):
                         sl, sl_process = create_sl_for_preview(i_frame=frame, i_grid=False)
@@ -1239,13 +1333,14 @@ class CASTDesktop(TextAnimatorMixin):
                             desktop_logger.error(f'{t_name} Error on SharedList creation for Preview')
                             raise ExitFromLoop
 
+                    # last frame processed, and counters for source / cast rate
+                    last_seq = 0
+                    rate_time, rate_seq, rate_count = time.perf_counter(), sl_queue.seq, frame_count
+
                     #
-                    # infinite loop for queue-ShareAbleList
+                    # infinite loop for queue-SharedFrameRing
                     #
-                    while sl_queue:
-
-                        # Calculate the expected time for the current frame
-                        expected_time = start_time + frame_count * interval
+                    while True:
 
                         # check to see if something to do
                         if CASTDesktop.t_todo_event.is_set() and shared_buffer is not None:
@@ -1263,96 +1358,113 @@ class CASTDesktop(TextAnimatorMixin):
                         """
                         """
                         #
-                        # we read data from the ShareAbleList
+                        # wait for the producer to signal a new frame (doorbell), stay responsive to actions
                         #
-                        time_frame = sl_queue[1]
-                        # check if recent frame that we need to proces (some frames can be skipped in busy system)
-                        # this adds also 2s delay before display default image
-                        if time_frame + 2 > time.time():
-                            # ShareAbleList bug
-                            frame = CV2Utils.frame_remove_one(sl_queue[0])
-                            # process frame
-                            # 1D array
-                            frame = np.frombuffer(frame, dtype=np.uint8)
-                            # 2D array
-                            if frame.nbytes > 0:
-                                # rgb
-                                frame = frame.reshape(int(t_scale_height), int(t_scale_width), 3)
-                                #
-                                frame_count += 1
-                                CASTDesktop.total_frames += 1
-                                #
-                                frame, grid = process_frame(frame)
-                                #
-                                # --- UI Preview Frame ---
-                                # Resize the frame to thumbnail size for efficient UI preview.
-                                thumbnail_frame = CV2Utils.resize_image(frame.copy(), preview_w, preview_h, keep_ratio=False)
-                                # Update the shared preview dictionary for the UI with the small thumbnail.
-                                CastAPI.previews[t_name].set(ImageUtils.image_array_to_base64(thumbnail_frame))
-                                #
-                                if t_preview:
-                                    t_preview, t_todo_stop = show_preview(frame, t_preview, t_todo_stop, grid)
-
-                            else:
-                                desktop_logger.debug('skip frame of size = 0')
-                        else:
-                            # preview default image
-                            if t_preview:
+                        if not sl_queue.wait(last_seq, timeout=.5):
+                            # no frame for too long (2s): preview default image
+                            if t_preview and sl_queue.timestamp + 2 < time.time():
                                 t_preview, t_todo_stop = show_preview(default_img,
                                                                       t_preview,
                                                                       t_todo_stop,
                                                                       i_grid=False)
+                            continue
+
+                        # we read data from the shared frame ring: copy the slot, then check it was not reused
+                        ring_frame, ring_seq, _ = sl_queue.read()
+                        if ring_frame is None:
+                            continue
+                        ring_frame = ring_frame.copy()
+                        if not sl_queue.is_valid(ring_seq):
+                            # producer has been faster than us and reused the slot: skip, read the latest one
+                            desktop_logger.debug(f'{t_name} SharedList frame {ring_seq} overwritten while read')
+                            continue
+                        last_seq = ring_seq
+                        #
+                        frame_count += 1
+                        CASTDesktop.total_frames += 1
+                        #
+                        frame, grid = process_frame(ring_frame)
+                        #
+                        # --- UI Preview Frame ---
+                        # Encoded only if someone is watching (grid / control panel), at preview rate.
+                        ui_preview.offer(frame, self.preview_fps)
+                        #
+                        if t_preview:
+                            t_preview, t_todo_stop = show_preview(frame, t_preview, t_todo_stop, grid)
 
+                        # source rate (frames published by the producer) and cast rate, once per second
+                        rate_now = time.perf_counter()
+                        if rate_now - rate_time >= 1:
+                            cast_stats['source_fps'] = round((ring_seq - rate_seq) / (rate_now - rate_time), 1)
+                            cast_stats['cast_fps'] = round((frame_count - rate_count) / (rate_now - rate_time), 1)
+                            rate_time, rate_seq, rate_count = rate_now, ring_seq, frame_count
+
+                        # up to the cast rate
                         need_to_sleep()
 
-                        # some sleep until next, this could add some delay to stream next available frame
-                        time.sleep(0.1)
+                elif hub_sub is not None:
 
-                elif capture_methode == 'mss':
+                    desktop_logger.debug(f'{t_name} process from capture hub')
 
-                    with mss.mss() as sct:
+                    while True:
+
+                        # check to see if something to do
+                        if CASTDesktop.t_todo_event.is_set() and shared_buffer is not None:
+                            t_todo_stop, t_preview = do_action(frame, frame_count)
 
-                        if t_viinput == 'area':
+                        """
+                        instruct the thread to exit 
+                        """
+                        # if global stop or local stop
+                        if self.stopcast or t_todo_stop:
+                            raise ExitFromLoop
 
-                            # specific area
-                            # Calculate crop parameters : ; 19/06/2024 coordinates for 2 monitor need to be reviewed
-                            x1 = int(self.screen_coordinates[0])
-                            y1 = int(self.screen_coordinates[1])
-                            x2 = int(self.screen_coordinates[2])
-                            y2 = int(self.screen_coordinates[3])
-                            # Define the screen region to capture
-                            # monitor = {"top": 100, "left": 100, "width": 800, "height": 600}
-                            sc_monitor = {'top': y1, 'left': x1, 'width': x2 - x1, 'height': y2 - y1}
+                        if CASTDesktop.t_exit_event.is_set():
+                            raise ExitFromLoop
+                        """
+                        """
 
-                        elif t_viinput == 'desktop':
+                        # latest frame grabbed by the hub, read-only view shared with other casts
+                        hub_frame = hub_sub.read(timeout=1)
+                        if hub_frame is None:
+                            if not hub_sub.alive:
+                                desktop_logger.error(f'{t_name} Capture source not available')
+                                raise ExitFromLoop
+                            continue
 
-                            # Get monitor dimensions for full-screen capture
-                            # [0] is the virtual screen, [1] is the primary monitor [2] second one
-                            monitor += 1
-                            sc_monitor = sct.monitors[monitor]
+                        frame = hub_frame
+                        frame_count += 1
+                        CASTDesktop.total_frames += 1
+                        #
+                        frame, grid = process_frame(frame)
 
+                        # --- UI Preview Frame ---
+                        # Encoded only if someone is watching (grid / control panel), at preview rate.
+                        ui_preview.offer(frame, self.preview_fps)
 
-                        elif t_viinput.lower().startswith('win='):
+                        #
+                        if t_preview:
+                            # create preview channel if necessary
+                            if frame_count == 1 and str2bool(cfg_mgr.app_config['preview_proc']):
+                                sl, sl_process = create_sl_for_preview(frame, grid)
+                                if sl is None or sl_process is None:
+                                    desktop_logger.error(f'{t_name} Error on SharedList creation')
+                                    raise ExitFromLoop
 
-                            rect = get_window_rect(mss_window_name)
+                            t_preview, t_todo_stop = show_preview(frame, t_preview, t_todo_stop, grid)
 
-                            if rect:
-                                left, top, width, height = rect
-                                sc_monitor = {"top": top, "left": left, "width": width, "height": height}
+                        need_to_sleep()
 
-                            else:
-                                desktop_logger.error(f"Window '{mss_window_name}' not found.")
-                                raise ExitFromLoop
+                elif capture_methode == 'mss':
+
+                    with mss.mss() as sct:
 
-                        else:
-                            desktop_logger.error('Not available with mss')
+                        sc_monitor = get_mss_monitor(sct)
+                        if sc_monitor is None:
                             raise ExitFromLoop
 
                         while True:
 
-                            # Calculate the expected time for the current frame
-                            expected_time = start_time + frame_count * interval
-
                             # check to see if something to do
                             if CASTDesktop.t_todo_event.is_set() and shared_buffer is not None:
                                 t_todo_stop, t_preview = do_action(frame, frame_count)
@@ -1382,14 +1494,12 @@ class CASTDesktop(TextAnimatorMixin):
                             frame, grid = process_frame(frame)
 
                             # --- UI Preview Frame ---
-                            # Resize the frame to thumbnail size for efficient UI preview.
-                            thumbnail_frame = CV2Utils.resize_image(frame.copy(), preview_w, preview_h, keep_ratio=False)
-                            # Update the shared preview dictionary for the UI with the small thumbnail.
-                            CastAPI.previews[t_name].set(ImageUtils.image_array_to_base64(thumbnail_frame))
+                            # Encoded only if someone is watching (grid / control panel), at preview rate.
+                            ui_preview.offer(frame, self.preview_fps)
 
                             #
                             if t_preview:
-                                # create ShareableList if necessary
+                                # create preview channel if necessary
                                 if frame_count == 1 and str2bool(cfg_mgr.app_config['preview_proc']):
                                     sl, sl_process = create_sl_for_preview(frame, grid)
                                     if sl is None or sl_process is None:
@@ -1419,6 +1529,10 @@ class CASTDesktop(TextAnimatorMixin):
                 if input_container is not None:
                     input_container.close()
                     desktop_logger.info(f'{t_name} AV Input container closed')
+                # leave shared capture
+                if hub_sub is not None:
+                    hub_sub.close()
+                    desktop_logger.info(f'{t_name} Capture hub subscription closed')
                 # close av output if any
                 if output_container:
                     # Pass None to the encoder at the end - flush last packets
@@ -1452,10 +1566,11 @@ class CASTDesktop(TextAnimatorMixin):
         if t_name in CastAPI.previews:
             del CastAPI.previews[t_name]
         #
-        # Clean ShareableList for Preview
+        # Clean preview channel
         Utils.sl_clean(sl, sl_process, t_name)
         # cleanup SL
         if sl_queue is not None:
+            sl_queue.close()
             sl_client.delete_shared_list(sl_name_q)
         #
         CASTDesktop.t_desktop_lock.release()
@@ -1474,6 +1589,10 @@ class CASTDesktop(TextAnimatorMixin):
             with contextlib.suppress(Exception):
                 sct.close()
 
+        # stop multicast workers
+        if multicast_sender is not None:
+            multicast_sender.stop()
+
         # stop e131/artnet
         if t_protocol == 'e131':
             e131_host.deactivate()
@@ -46,8 +46,11 @@ The main casting logic runs in a separate thread (t_media_cast) to avoid blockin
 responsive UI and concurrent operations.
 
 Media Input Handling:
-Supports various input types: video files, image sequences, live camera feeds, and network streams.
-Uses OpenCV for media capture and processing.
+Supports various input types: video files, image sequences, image folders (slideshow), live camera feeds, and network
+streams. Image sequences and folders are decoded in a thread pool with a cache of ready frames (see slideshow.py).
+Uses OpenCV for media capture and processing. Local video files are decoded with PyAV and seeked from a cached keyframe
+index (see keyindex.py): frame index, skip, sync and repeat jump to the nearest keyframe without stall.
+YouTube urls are cast while downloading (see ytstream.py): first frames reach the LEDs after a few hundred KB.
 
 Network Protocol Support:
 
@@ -61,12 +64,27 @@ LED matrices composed of multiple physical devices.
 
 Synchronization:
 Supports frame and time synchronization across multiple casts, including auto-sync and manual sync features, to keep
-multiple devices in sync with the media source.
+multiple devices in sync with the media source. All sync casts wait on a condition (see castsync.py) and restart at
+the same instant, the residual skew is reported in cast info.
+With `master_clock`, casts follow the process wide media clock (see mediaclock.py), reported by the video player page:
+the frame to show comes from its timestamp, drift is corrected with frame repeats / drops instead of seeks.
 
 Image Processing:
 Includes options for resizing, gamma correction, brightness/contrast adjustment, color balancing, flipping, and applying
 custom filters.
 
+Baked Clips:
+Media files can be baked once into LED native clips (*.wvsc, see bakeclip.py) with the same processing chain
+(`prepare_frame`). A clip as input is read from a memory-mapped file and sent without any decoding or processing.
+
+Playlist:
+`playlist` media are played after `viinput` in the same cast: the next one is opened and its first frames decoded
+in background (see playlist.py), devices and senders are kept, the switch does not miss any frame.
+
+Loop Cache:
+With `repeat`, the processed frames of the first pass are kept in memory (`loop_cache_mb`, see LoopCache in
+framestore.py), next passes skip decoding and processing. A settings change goes back to the media file.
+
 Preview Functionality:
 Provides real-time preview of the output using OpenCV, with support for running the preview in a separate process for
 cross-platform compatibility.
@@ -81,10 +99,10 @@ network devices.
 
 Supporting Patterns and Utilities
 Threading and Concurrency:
-Uses Python's threading and concurrent.futures for parallel operations, including multicast sending and action handling.
+Uses Python's threading for parallel operations, including persistent multicast send workers and action handling.
 
 Shared Memory:
-Utilizes multiprocessing.shared_memory.ShareableList for sharing preview frames between processes.
+Utilizes a PreviewChannel (shared memory) for sharing preview frames between processes.
 
 Logging:
 Integrates with a custom LoggerManager for detailed debug and error logging.
@@ -93,23 +111,33 @@ Configuration Management:
 Reads settings from a configuration manager (cfg_mgr) for flexible runtime behavior.
 
 """
-import errno
 import os
 import threading
-import concurrent.futures
 import numpy as np
 import cv2
 import time
 
 from asyncio import run as as_run
-from multiprocessing.shared_memory import ShareableList
 
-from src.utl.multicast import IPSwapper
+from src.utl.multicast import IPSwapper, MulticastSender
 from src.utl.multicast import MultiUtils as Multi
 from src.net.ddp_queue import DDPDevice
 from src.net.e131_queue import E131Device
 from src.net.artnet_queue import ArtNetDevice
 from src.utl.text_utils import TextAnimatorMixin
+from src.utl.motion import AdaptiveRate
+from src.utl.pacer import FramePacer
+from src.utl.previewchannel import PreviewChannel
+from src.utl.framestore import FrameStore, LoopCache
+from src.utl.bakeclip import BakedClip, CLIP_EXT
+from src.utl.playlist import Playlist
+from src.utl.slideshow import SlideshowSource
+from src.utl.castsync import CastSync
+from src.utl.keyindex import IndexedCapture
+from src.utl.ytstream import ProgressiveCapture, YtCache
+from src.utl.mediaclock import ClockFollower
+from src.utl.cv2utils import PreviewWindow
+from src.utl.workerpool import WorkerPool
 
 from src.utl.actionutils import *
 
@@ -142,7 +170,7 @@ class CASTMedia(TextAnimatorMixin):
 
     cast_names = []  # should contain running Cast instances
     cast_name_todo = []  # list of cast names with action that need to execute from 'to do'
-    cast_name_to_sync = []  # list of cast names to sync time
+    cast_barrier = CastSync()  # all sync rounds
 
     t_exit_event = threading.Event()  # thread listen event fo exit
     t_todo_event = threading.Event()  # thread listen event for task to do
@@ -157,10 +185,14 @@ class CASTMedia(TextAnimatorMixin):
             CASTMedia.Process, CASTMedia.Queue = Utils.mp_setup()
 
         self.rate: int = 25
+        self.adaptive_rate: bool = False  # content adaptive rate, between rate_min and rate_max
+        self.rate_min: int = 5
+        self.rate_max: int = 0  # 0 = rate
         self.stopcast: bool = True
         self.preview_top: bool = False
         self.preview_w: int = 640
         self.preview_h: int = 360
+        self.preview_fps: int = 10  # max rate of the UI preview (grid / control panel), independent of cast rate
         self.scale_width: int = 128
         self.scale_height: int = 128
         self.pixel_w = 8
@@ -185,7 +217,7 @@ class CASTMedia(TextAnimatorMixin):
         self.auto_bright = False
         self.clip_hist_percent = 25
         self.gamma = 0.5
-        self.frame_buffer = []
+        self.frame_buffer = FrameStore()  # see framestore.py, capacity is frame_max
         self.frame_index: int = 0
         self.put_to_buffer: bool = False
         self.frame_max: int = 8
@@ -221,6 +253,62 @@ class CASTMedia(TextAnimatorMixin):
         self.universe_size = 510  # size of each universe e131/artnet
         self.channel_offset = 0  # The channel offset within the universe. e131/artnet
         self.channels_per_pixel = 3  # Channels to use for e131/artnet
+        self.playlist = []  # media to play after viinput, in the same cast
+        self.master_clock = False  # show frames of the master media clock (see mediaclock.py)
+
+    def prepare_frame(self, frame):
+        """Color / filter chain of the cast on a BGR frame already at scale size, return the RGB frame.
+
+        Used by the cast loop and to bake clips (see bakeclip.py).
+        """
+        # convert to RGB
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # adjust gamma
+        frame = cv2.LUT(frame, ImageUtils.gamma_correct_frame(self.gamma))
+        # auto brightness / contrast
+        if self.auto_bright:
+            frame = ImageUtils.automatic_brightness_and_contrast(frame, self.clip_hist_percent)
+        # filters
+        filter_params = [self.saturation,
+                         self.brightness,
+                         self.contrast,
+                         self.sharpen,
+                         self.balance_r,
+                         self.balance_g,
+                         self.balance_b
+                         ]
+
+        # apply filters if any
+        if any(param != 0 for param in filter_params):
+            # apply filters
+            filters = {"saturation": self.saturation,
+                       "brightness": self.brightness,
+                       "contrast": self.contrast,
+                       "sharpen": self.sharpen,
+                       "balance_r": self.balance_r,
+                       "balance_g": self.balance_g,
+                       "balance_b": self.balance_b}
+
+            frame = ImageUtils.process_filters_image(frame, filters=filters)
+
+        # flip vertical/horizontal: 0,1
+        if self.flip:
+            frame = cv2.flip(frame, self.flip_vh)
+
+        return frame
+
+    def end_all_sync(self):
+        """Called once all casts of an all sync round have seeked."""
+        if not self.auto_sync:
+            self.all_sync = False
+        self.cast_sync = False
+
+    def loop_signature(self):
+        """Settings used to process frames (device size, prepare_frame, text), a change invalidates the loop cache."""
+        return (self.scale_width, self.scale_height, self.gamma, self.auto_bright, self.clip_hist_percent,
+                self.saturation, self.brightness, self.contrast, self.sharpen,
+                self.balance_r, self.balance_g, self.balance_b, self.flip, self.flip_vh,
+                self.text_animator is not None)
 
     """
     Cast Thread
@@ -242,8 +330,6 @@ class CASTMedia(TextAnimatorMixin):
 
         media_logger.debug(f'Child thread: {t_name}')
 
-        t_send_frame = threading.Event()  # thread listen event to send frame via ddp (for synchro used by multicast)
-
         t_preview = self.preview
         t_scale_width = self.scale_width
         t_scale_height = self.scale_height
@@ -264,7 +350,6 @@ class CASTMedia(TextAnimatorMixin):
 
         self.cast_sync = False
         self.cast_sleep = False
-        CASTMedia.cast_name_to_sync = []
 
         sl_process = None
         sl = None
@@ -298,61 +383,29 @@ class CASTMedia(TextAnimatorMixin):
         # Main server port
         port = port
 
-        window_name = f"{Utils.get_server_port()}-{t_name}-{str(t_viinput)}"[:64]
+        # preview window name, built once from the first input: a playlist changes t_viinput during the cast,
+        # the same window is kept for all items
+        preview_viinput = t_viinput
+        window_name = f"{Utils.get_server_port()}-{t_name}-{str(preview_viinput)}"[:64]
+        # preview window (thread or process) render rate, independent of the cast rate
+        preview_window_fps = int(cfg_mgr.app_config.get('preview_window_fps', 30))
 
         def need_to_sleep():
             """
             do we need to sleep to be compliant with selected rate (fps)
+            return the number of missed frame slots (late_frames = skip)
             """
-            # Calculate the current time
-            s_current_time = time.time()
-
-            # Calculate the time to sleep to maintain the desired FPS
-            sleep_time = expected_time - s_current_time
-
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            return pacer.wait()
 
         """
         MultiCast inner functions.
         """
 
-        def send_multicast_image(ip, image):
-            """
-            Sends a single image to a specific IP address using the DDP protocol, used by multicast feature.
-
-            This function waits for a synchronization event before sending the image data to the appropriate device.
-            It updates the total packet count and logs a warning if the frame is dropped due to timeout.
-
-            Args:
-                ip (str): The IP address to send the image to.
-                image: The image data to send.
-
-            Returns:
-                None
-
-            """
-            if t_protocol == 'ddp':
-                # timeout provided to not have thread waiting infinitely
-                if t_send_frame.wait(timeout=.5):
-                    # send ddp data, we select DDPDevice based on the IP
-                    for ddp_dev in t_ddp_multi_names:
-                        if ip == ddp_dev._destination:
-                            ddp_dev.send_to_queue(image, self.retry_number)
-                            CASTMedia.total_packets += ddp_dev.frame_count
-                            break
-                else:
-                    media_logger.warning(f'{t_name} Multicast frame dropped')
-
         def send_multicast_images_to_ips(images_buffer, to_ip_addresses):
             """
-            Create a thread for each image,IP pair and wait for all to finish
-            Very simple synchro process
-
-            Sends images to multiple IP addresses for multicast feature:
-
-            This function distributes images to a list of IP addresses, either sending a unique image to each address
-            (for grid/matrix mode) or the same image to all addresses. It uses a thread pool for concurrent sending.
+            Send images to multiple IP addresses for multicast feature:
+            a unique image to each address (grid/matrix mode) or the same image to all addresses.
+            Persistent per-device workers (MulticastSender) release all devices at the same time.
 
             Args:
                 images_buffer (list): List of images to send.
@@ -361,23 +414,20 @@ class CASTMedia(TextAnimatorMixin):
             Returns:
                 None
             """
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                if t_multicast and (t_cast_x != 1 or t_cast_y != 1):
-                    # Submit a thread for each image and IP pair
-                    multicast = [executor.submit(send_multicast_image, ip, image)
-                                 for ip, image in zip(to_ip_addresses, images_buffer)]
-                else:
-                    # Submit a thread for each IP with same image
-                    multicast = [executor.submit(send_multicast_image, ip, images_buffer[0])
-                                 for ip in to_ip_addresses]
+            if multicast_sender is None:
+                return
 
-                # once all threads up, need to set event because they wait for
-                t_send_frame.set()
+            if t_multicast and (t_cast_x != 1 or t_cast_y != 1):
+                # each image to its IP
+                pairs = zip(to_ip_addresses, images_buffer)
+            else:
+                # same image to each IP
+                pairs = ((ip, images_buffer[0]) for ip in to_ip_addresses)
 
-                # Wait for all threads to complete, let 1 second
-                concurrent.futures.wait(multicast, timeout=1)
+            if not multicast_sender.send(pairs, self.retry_number):
+                media_logger.warning(f'{t_name} Multicast frame dropped')
 
-            t_send_frame.clear()
+            CASTMedia.total_packets += multicast_sender.packets()
 
         """
         End Multicast
@@ -441,6 +491,7 @@ class CASTMedia(TextAnimatorMixin):
 
         # specifics to Multicast
         swapper = None
+        multicast_sender = None
         #
         if t_multicast:
             # validate cast_devices list
@@ -488,6 +539,11 @@ class CASTMedia(TextAnimatorMixin):
                 # initiate IPSwapper
                 swapper = IPSwapper(ip_addresses)
 
+                # persistent multicast workers, one per DDP device
+                if t_protocol == 'ddp':
+                    multicast_sender = MulticastSender({ddp_dev._destination: ddp_dev
+                                                        for ddp_dev in t_ddp_multi_names})
+
         else:
 
             ip_addresses = [self.host]
@@ -495,6 +551,24 @@ class CASTMedia(TextAnimatorMixin):
         """
         Second, capture media
         """
+        # LED native clip (see bakeclip.py): frames are baked at device size, clip size wins
+        baked = str(t_viinput).lower().endswith(CLIP_EXT)
+        clip = None
+        cast_tiles = (t_cast_x, t_cast_y) if t_multicast else (1, 1)
+        if baked:
+            try:
+                clip = BakedClip.open(t_viinput)
+            except Exception as clip_error:
+                media_logger.error(f"{t_name} Error: Unable to open clip {t_viinput} : {clip_error}")
+                return False
+            if clip.tiles != cast_tiles:
+                media_logger.error(f"{t_name} Clip baked for a {clip.tiles[0]}x{clip.tiles[1]} matrix, "
+                                   f"cast is {cast_tiles[0]}x{cast_tiles[1]}")
+                clip.release()
+                return False
+            t_scale_width = clip.shape[1] // clip.tiles[0]
+            t_scale_height = clip.shape[0] // clip.tiles[1]
+
         self.pixel_w = t_scale_height
         self.pixel_h = t_scale_height
         self.scale_width = t_scale_width
@@ -503,11 +577,27 @@ class CASTMedia(TextAnimatorMixin):
         frame = None
         orig_frame = None
         is_image = False
-        self.frame_buffer = []
+        # new buffer for each cast, in RAM or in an archive file (see framestore.py)
+        self.frame_buffer = FrameStore.renew(None, self.frame_max, t_name, self.rate)
         self.cast_frame_buffer = []
 
         # capture media
-        media = cv2.VideoCapture(t_viinput)
+        slideshow = not baked and SlideshowSource.is_slideshow(t_viinput)
+        if baked:
+            media = clip
+        elif slideshow:
+            # folder / image sequence: decoded in a thread pool at cast size (see slideshow.py)
+            media = SlideshowSource(t_viinput, (t_scale_width, t_scale_height), fps=self.rate)
+        elif YtCache.is_youtube(t_viinput):
+            # YouTube url: the cast starts while the video downloads (see ytstream.py), else reads the stream url
+            media = (ProgressiveCapture.open(t_viinput) or ProgressiveCapture.stream(t_viinput)
+                     or cv2.VideoCapture(t_viinput))
+        else:
+            # video file: frame accurate seeks from its keyframe index (see keyindex.py), else decoded by cv2
+            media = IndexedCapture.open(t_viinput) or cv2.VideoCapture(t_viinput)
+
+        # video still downloading: its length is only known once read up to the end
+        growing = isinstance(media, ProgressiveCapture)
 
         # Check if the capture is successful
         if not media.isOpened():
@@ -516,7 +606,7 @@ class CASTMedia(TextAnimatorMixin):
 
         # retrieve frame count, if 1 we assume image (should be no?)
         media_length = int(media.get(cv2.CAP_PROP_FRAME_COUNT))
-        if media_length == 1:
+        if media_length == 1 and not baked and not slideshow:
             media.release()
             media = cv2.imread(str(t_viinput))
             frame = media
@@ -529,6 +619,27 @@ class CASTMedia(TextAnimatorMixin):
             if self.force_mjpeg:
                 media.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
 
+        # repeated media: first pass processed frames are replayed from memory (see LoopCache in framestore.py)
+        # source keeps the media file while the cache is read
+        loop_cache = None
+        source = media
+        processed = baked
+        if t_repeat != 0 and media_length > 1 and not baked and not self.text_animator and not self.playlist:
+            loop_cache = LoopCache(media_length, fps, self.loop_signature())
+
+        # media to play after this one, the next is opened in background (see playlist.py)
+        playlist = None
+        if self.playlist and not is_image:
+            playlist = Playlist([t_viinput, *self.playlist], int(cfg_mgr.app_config.get('playlist_prefetch', 8)),
+                                size=(t_scale_width, t_scale_height), fps=self.rate)
+            playlist.prepare(wrap=t_repeat != 0)
+
+        # master clock: frame to show from its timestamp, drift corrected by frame repeats / drops
+        follower = None
+        last_frame = None
+        if self.master_clock and media_length > 1 and playlist is None:
+            follower = ClockFollower(fps, media_length)
+
         # Calculate the interval between frames in seconds (fps)
         if self.rate != 0:
             interval: float = 1.0 / self.rate
@@ -567,6 +678,22 @@ class CASTMedia(TextAnimatorMixin):
 
         start_time = time.time()
 
+        # per cast counters, reported by the info action
+        cast_stats = {'skipped': 0}
+
+        # content adaptive rate, never above media rate to keep the timeline
+        rate_adapter = None
+        if self.adaptive_rate and not is_image:
+            rate_adapter = AdaptiveRate(self.rate_min, min(self.rate_max or self.rate, self.rate))
+            cast_stats['rate'] = rate_adapter.rate
+
+        # keep the requested rate on a monotonic clock
+        pacer = FramePacer(self.rate,
+                           late_policy=cfg_mgr.app_config.get('late_frames', 'skip'),
+                           spin=float(cfg_mgr.app_config.get('spin_time', 0.001)))
+        # slots missed by the pacer: their frames are read without being sent
+        late_slots = 0
+
         # --- Initialization (do this once before the loop starts) ---
         action_executor = ActionExecutor(
             class_obj=self,  # Pass the instance of Media/Desktop itself
@@ -587,7 +714,8 @@ class CASTMedia(TextAnimatorMixin):
             swapper=swapper,
             shared_buffer=shared_buffer,  # queue
             logger=media_logger,
-            t_protocol=t_protocol
+            t_protocol=t_protocol,
+            cast_stats=cast_stats
         )
         # --- End Initialization ---
 
@@ -595,11 +723,12 @@ class CASTMedia(TextAnimatorMixin):
         Manage latest frame preview dict
         """
         # Update the shared preview dictionary for the UI
-        from src.utl.utils import LatestFrame, CastAPI
-        if t_name not in CastAPI.previews: CastAPI.previews[t_name] = LatestFrame()
-
-        preview_w = int(cfg_mgr.app_config.get('grid_preview_width', 240))
-        preview_h = int(cfg_mgr.app_config.get('grid_preview_height', 135))
+        from src.utl.utils import PreviewPublisher, CastAPI
+        if t_name not in CastAPI.previews:
+            CastAPI.previews[t_name] = PreviewPublisher(int(cfg_mgr.app_config.get('grid_preview_width', 240)),
+                                                        int(cfg_mgr.app_config.get('grid_preview_height', 135)),
+                                                        int(cfg_mgr.app_config.get('preview_quality', 70)))
+        ui_preview = CastAPI.previews[t_name]
 
 
         """
@@ -613,8 +742,14 @@ class CASTMedia(TextAnimatorMixin):
             if CASTMedia.t_exit_event.is_set():
                 break
 
-            # Calculate the expected time for the current frame
-            expected_time = start_time + frame_count * interval
+            # settings changed while replaying the loop cache: back to the media file, same position
+            if media is not source and loop_cache.signature != self.loop_signature():
+                media_logger.debug(f'{t_name} Settings changed, loop cache released')
+                source.set(cv2.CAP_PROP_POS_FRAMES, loop_cache.position)
+                media = source
+                processed = False
+                loop_cache.release()
+                loop_cache = None
 
             #
             #  read media
@@ -625,63 +760,25 @@ class CASTMedia(TextAnimatorMixin):
                 # only for video
                 if media_length > 1:
                     # Sync all casts to player_time if requested
-                    # manage concurrent access to the list by using lock feature
                     # set value if auto sync is true
                     if self.auto_sync is True and current_time - auto_expected_time >= self.auto_sync_delay:
-                        time_to_set = self.sync_to_time
                         self.cast_sync = True
-                        media_logger.debug(f"{t_name}  Name to sync  :{CASTMedia.cast_name_to_sync}")
-
-                        CASTMedia.t_media_lock.acquire()
-                        if self.all_sync is True and len(CASTMedia.cast_name_to_sync) == 0:
-                            # populate cast names to sync
-                            CASTMedia.cast_name_to_sync = CASTMedia.cast_names.copy()
-                            # add additional time, can help if cast number > 0 to try to avoid small decay
-                            time_to_set += self.add_all_sync_delay
-                            media_logger.debug(f"{t_name}  Got these to sync from auto :{CASTMedia.cast_name_to_sync}")
-                        CASTMedia.t_media_lock.release()
-
                         auto_expected_time = current_time
-                        media_logger.debug(f'{t_name} Auto Sync Cast to time :{time_to_set}')
+                        media_logger.debug(f'{t_name} Auto Sync Cast to time :{self.sync_to_time}')
 
                     if self.all_sync is True and self.cast_sync is True:
-
-                        CASTMedia.t_media_lock.acquire()
-
-                        # populate cast names to sync if necessary
-                        if len(CASTMedia.cast_name_to_sync) == 0 and self.auto_sync is False:
-                            CASTMedia.cast_name_to_sync = CASTMedia.cast_names.copy()
-                            media_logger.debug(f"{t_name}  Got these to sync  :{CASTMedia.cast_name_to_sync}")
-
-                        # take only cast not already synced
-                        if t_name in CASTMedia.cast_name_to_sync:
-                            self.cast_sleep = True
-                            # remove thread name from cast to sync list
-                            media_logger.debug(f"{t_name} remove from all sync")
-                            CASTMedia.cast_name_to_sync.remove(t_name)
-                            # sync cast
-                            media.set(cv2.CAP_PROP_POS_MSEC, self.sync_to_time)
-                            media_logger.debug(f'{t_name} ALL Sync Cast to time :{self.sync_to_time}')
-
-                            media_logger.debug(f'{t_name} synced')
-
-                            # if no more, reset all_sync
-                            if len(CASTMedia.cast_name_to_sync) == 0:
-                                if not self.auto_sync:
-                                    self.all_sync = False
-                                self.cast_sync = False
-                                self.cast_sleep = False
-                                media_logger.debug(f"{t_name} All sync finished")
-
-                        CASTMedia.t_media_lock.release()
-
-                        media_logger.debug(f'{t_name} go to sleep if necessary')
-                        while (self.cast_sleep is True and
-                               self.cast_sync is True and
-                               len(CASTMedia.cast_name_to_sync) > 0):
-                            # sleep until all remaining casts sync
-                            time.sleep(.001)
-                        media_logger.debug(f'{t_name} exit sleep')
+                        # first cast here opens a round for all running casts (see castsync.py)
+                        # add additional time, can help if cast number > 0 to try to avoid small decay
+                        target = CASTMedia.cast_barrier.join(t_name, CASTMedia.cast_names,
+                                                             self.sync_to_time + self.add_all_sync_delay)
+                        if target is not None:
+                            media.set(cv2.CAP_PROP_POS_MSEC, target)
+                            media_logger.debug(f'{t_name} ALL Sync Cast to time :{target}, wait for others')
+                            # block until all casts of the round have seeked, restart together
+                            CASTMedia.cast_barrier.arrive(t_name, on_release=self.end_all_sync)
+                            pacer.reset()
+                            cast_stats['sync'] = CASTMedia.cast_barrier.get_stats()
+                            media_logger.debug(f'{t_name} synced, skew {cast_stats["sync"]["last_skew_ms"]} ms')
 
                     else:
 
@@ -699,7 +796,33 @@ class CASTMedia(TextAnimatorMixin):
                 #
                 # read frame for all
                 #
-                success, frame = media.read()
+                if follower is not None and last_frame is not None and follower.ahead(media):
+                    # ahead of the master clock: same frame again
+                    success, frame = True, last_frame
+                else:
+                    success, frame = media.read()
+                    if success and follower is not None:
+                        # behind the master clock: read frames without sending them
+                        for _ in range(follower.behind(media)):
+                            dropped, next_frame = media.read()
+                            if not dropped:
+                                break
+                            frame = next_frame
+                        last_frame = frame
+                    elif success and late_slots > 0 and media_length > 1:
+                        # cast has been late (stall): skip the frames of the missed slots, video stays on time
+                        for _ in range(late_slots):
+                            dropped, next_frame = media.read()
+                            if not dropped:
+                                break
+                            frame = next_frame
+                            frame_count += 1
+                    late_slots = 0
+                if follower is not None and success:
+                    # frames read, not frames sent, to detect the end of the media
+                    frame_count = int(media.get(cv2.CAP_PROP_POS_FRAMES)) - 1
+                if growing and media is source:
+                    media_length = int(media.get(cv2.CAP_PROP_FRAME_COUNT))
                 if not success:
                     if frame_count != media_length:
                         media_logger.warning(f'{t_name} Not all frames have been read')
@@ -707,10 +830,51 @@ class CASTMedia(TextAnimatorMixin):
 
                     else:
                         media_logger.debug(f'{t_name} Media reached END')
+                        # playlist: next media in the same cast, devices / senders / preview are kept
+                        if playlist is not None and (playlist.has_next() or t_repeat != 0):
+                            if not playlist.has_next():
+                                t_repeat -= 1
+                                media_logger.debug(f'{t_name} Remaining repeat : {t_repeat}')
+                            next_media = playlist.advance(wrap=True)
+                            if next_media is None:
+                                media_logger.error(f'{t_name} No more playable media in playlist')
+                                break
+                            if next_media.baked and (next_media.media.tiles != cast_tiles or
+                                                     next_media.media.shape[:2] != (t_scale_height * cast_tiles[1],
+                                                                                    t_scale_width * cast_tiles[0])):
+                                media_logger.error(f'{t_name} Clip {next_media.viinput} not baked for this cast')
+                                next_media.release()
+                                break
+                            source.release()
+                            media = source = next_media
+                            media_length = next_media.length
+                            growing = isinstance(next_media.media, ProgressiveCapture)
+                            baked = processed = next_media.baked
+                            t_viinput = next_media.viinput
+                            media_logger.info(f'{t_name} Playing media {t_viinput} of length {media_length} '
+                                              f'at {next_media.fps} FPS')
+                            # first frame already decoded, sent in this loop turn
+                            success, frame = media.read()
+                            if not success:
+                                media_logger.error(f'{t_name} Not able to read {t_viinput}')
+                                break
+                            frame_count = 0
+                            start_time = time.time()
+                            current_time = time.time()
+                            auto_expected_time = current_time
+                            playlist.prepare(wrap=t_repeat != 0)
+
                         # manage the repeat feature, if -1 then unlimited
-                        if t_repeat > 0 or t_repeat < 0:
+                        elif t_repeat > 0 or t_repeat < 0:
                             t_repeat -= 1
                             media_logger.debug(f'{t_name} Remaining repeat : {t_repeat}')
+                            # master clock is not restarted: the follower wraps positions on the media duration
+                            last_frame = None
+                            # first pass fully cached: next passes from memory, without decoding / processing
+                            if loop_cache is not None and media is source and loop_cache.finish():
+                                media_logger.debug(f'{t_name} Repeat from loop cache')
+                                media = loop_cache
+                                processed = True
                             # reset media to start
                             media.set(cv2.CAP_PROP_POS_FRAMES, 0)
                             # read one frame
@@ -728,64 +892,49 @@ class CASTMedia(TextAnimatorMixin):
                         else:
                             break
 
-            # resize to requested size
-            # this will validate media passed to cv2
-            # common part for image media_length = 1 or live video = -1 or video > 1
-            # break in case of failure
-            try:
-                frame = CV2Utils.resize_image(frame, t_scale_width, t_scale_height)
-            except Exception as im_error:
-                media_logger.error(f'Error to resize image : {im_error}')
-                break
+            # baked clip or loop cache: frames are already processed
+            if not processed:
+                # resize to requested size
+                # this will validate media passed to cv2
+                # common part for image media_length = 1 or live video = -1 or video > 1
+                # break in case of failure
+                try:
+                    frame = CV2Utils.resize_image(frame, t_scale_width, t_scale_height)
+                except Exception as im_error:
+                    media_logger.error(f'Error to resize image : {im_error}')
+                    break
 
-            # convert to RGB
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            # adjust gamma
-            frame = cv2.LUT(frame, ImageUtils.gamma_correct_frame(self.gamma))
-            # auto brightness / contrast
-            if self.auto_bright:
-                frame = ImageUtils.automatic_brightness_and_contrast(frame, self.clip_hist_percent)
-            # filters
-            filter_params = [self.saturation,
-                             self.brightness,
-                             self.contrast,
-                             self.sharpen,
-                             self.balance_r,
-                             self.balance_g,
-                             self.balance_b
-                             ]
-
-            # apply filters if any
-            if any(param != 0 for param in filter_params):
-                # apply filters
-                filters = {"saturation": self.saturation,
-                           "brightness": self.brightness,
-                           "contrast": self.contrast,
-                           "sharpen": self.sharpen,
-                           "balance_r": self.balance_r,
-                           "balance_g": self.balance_g,
-                           "balance_b": self.balance_b}
-
-                frame = ImageUtils.process_filters_image(frame, filters=filters)
-
-            # flip vertical/horizontal: 0,1
-            if self.flip:
-                frame = cv2.flip(frame, self.flip_vh)
-
-            # Superimpose animated text if enabled
-            if self.text_animator:
-                text_overlay_bgra = self.text_animator.generate()
-                if text_overlay_bgra is not None:
-                    # Ensure frame is BGR before overlaying
-                    if len(frame.shape) == 2:
-                        frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-                    elif frame.shape[2] == 4:
-                        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-
-                    frame = CV2Utils.overlay_bgra_on_bgr(frame, text_overlay_bgra)
+                # content adaptive rate: media timeline stay at rate, frames are sent only at the effective rate
+                if rate_adapter is not None and frame_count > 1:
+                    cast_stats['rate'] = rate_adapter.update(frame)
+                    if not rate_adapter.due(time.perf_counter(), tolerance=interval / 2):
+                        cast_stats['skipped'] += 1
+                        late_slots = need_to_sleep()
+                        frame_count += 1
+                        CASTMedia.total_frames += 1
+                        continue
+
+                # RGB, gamma, brightness / contrast, filters, flip
+                frame = self.prepare_frame(frame)
+
+                # Superimpose animated text if enabled
+                if self.text_animator:
+                    text_overlay_bgra = self.text_animator.generate()
+                    if text_overlay_bgra is not None:
+                        # Ensure frame is BGR before overlaying
+                        if len(frame.shape) == 2:
+                            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+                        elif frame.shape[2] == 4:
+                            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+
+                        frame = CV2Utils.overlay_bgra_on_bgr(frame, text_overlay_bgra)
+
+                # first pass of a repeated media: keep the processed frame for the next ones
+                if loop_cache is not None and loop_cache.enabled:
+                    loop_cache.record(frame, int(media.get(cv2.CAP_PROP_POS_FRAMES)) - 1, self.loop_signature())
 
             # put frame to np buffer (so can be used after by the main)
-            if self.put_to_buffer and frame_count <= self.frame_max:
+            if self.put_to_buffer:
                 add_frame = CV2Utils.pixelart_image(frame, t_scale_width, t_scale_height)
                 add_frame = CV2Utils.resize_image(add_frame, t_scale_width, t_scale_height)
 
@@ -804,6 +953,12 @@ class CASTMedia(TextAnimatorMixin):
                 media_logger.debug(f"{t_name} We are inside todo :{CASTMedia.cast_name_todo}")
 
                 try:
+                    # pacing statistics for info
+                    cast_stats['pacer'] = pacer.get_stats()
+                    if follower is not None:
+                        cast_stats['clock'] = follower.get_stats()
+                    if isinstance(source, IndexedCapture):
+                        cast_stats['seek'] = source.get_stats()
                     # will read cast_name_todo list and see if something to do
                     (t_todo_stop,
                      t_preview,
@@ -812,7 +967,7 @@ class CASTMedia(TextAnimatorMixin):
                      new_to_do) = action_executor.process_actions(frame, frame_count)
 
                     if add_frame_buffer is not None:
-                        self.frame_buffer.append(add_frame_buffer)
+                        self.frame_buffer.append(add_frame_buffer, force=True)
                     if add_cast_frame_buffer is not None:
                         self.cast_frame_buffer.append(add_cast_frame_buffer)
 
@@ -849,7 +1004,8 @@ class CASTMedia(TextAnimatorMixin):
 
                 # resize frame to virtual matrix size
                 # frame_art = CV2Utils.pixelart_image(frame, t_scale_width, t_scale_height)
-                frame = CV2Utils.resize_image(frame, t_scale_width * t_cast_x, t_scale_height * t_cast_y)
+                if not baked:
+                    frame = CV2Utils.resize_image(frame, t_scale_width * t_cast_x, t_scale_height * t_cast_y)
 
                 #
                 if frame_count > 1:
@@ -857,7 +1013,7 @@ class CASTMedia(TextAnimatorMixin):
                     t_cast_frame_buffer = Multi.split_image_to_matrix(frame, t_cast_x, t_cast_y)
                     # put frame to np buffer (so can be used after by the main)
                     # a new cast overwrite buffer, only the last cast buffer can be seen on GUI
-                    if self.put_to_buffer and frame_count <= self.frame_max:
+                    if self.put_to_buffer:
                         add_frame = CV2Utils.pixelart_image(frame, t_scale_width, t_scale_height)
                         add_frame = CV2Utils.resize_image(add_frame, t_scale_width, t_scale_height)
                         self.frame_buffer.append(add_frame)
@@ -891,9 +1047,10 @@ class CASTMedia(TextAnimatorMixin):
                 grid = False
 
                 # resize frame for sending to device
-                frame_to_send = CV2Utils.resize_image(frame, t_scale_width, t_scale_height)
-                # resize frame to pixelart
-                frame = CV2Utils.pixelart_image(frame, t_scale_width, t_scale_height)
+                frame_to_send = frame if baked else CV2Utils.resize_image(frame, t_scale_width, t_scale_height)
+                # resize frame to pixelart, only when a preview (window or UI) shows it
+                if t_preview or ui_preview.subscribers:
+                    frame = CV2Utils.pixelart_image(frame, t_scale_width, t_scale_height)
 
                 # Protocols run in separate thread to avoid block main loop
                 # here we feed the queue that is read by Net thread
@@ -953,11 +1110,8 @@ class CASTMedia(TextAnimatorMixin):
                             break
 
             # --- UI Preview Frame ---
-            # Resize the frame to thumbnail size for efficient UI preview.
-            # Use a copy to avoid affecting the original 'frame' used elsewhere.
-            thumbnail_frame = CV2Utils.resize_image(frame.copy(), preview_w, preview_h, keep_ratio=False)
-            # Update the shared preview dictionary for the UI with the small thumbnail.
-            CastAPI.previews[t_name].set(ImageUtils.image_array_to_base64(thumbnail_frame))
+            # Encoded only if someone is watching (grid / control panel), at preview rate.
+            ui_preview.offer(frame, self.preview_fps)
 
             """
             Manage preview window, depend on the platform
@@ -967,133 +1121,111 @@ class CASTMedia(TextAnimatorMixin):
 
                 if str2bool(cfg_mgr.app_config['preview_proc']):
                     # mandatory for no win platform, cv2.imshow() need to run into Main thread
-                    # We use ShareableList to share data between this thread and new process
+                    # We use a PreviewChannel to share data between this thread and new process
                     #
                     if frame_count == 1:
                         media_logger.debug(f'{t_name} First frame detected for SL')
-                        # Create a (9999, 9999, 3) array with all values set to 111 to reserve memory
-                        frame_info = frame.shape
-                        frame_info_list = list(frame_info)
-                        frame_info = tuple(frame_info_list)
-                        full_array = np.full(frame_info, 111, dtype=np.uint8)
-                        # create a shared list, name is thread name + _p
+                        # create a preview channel, name is thread name + _p
                         sl_name = f'{t_name}_p'
                         try:
-                            sl = ShareableList(
-                                [
-                                    CASTMedia.total_frames,
-                                    full_array.tobytes(),
-                                    port,
-                                    t_viinput,
-                                    t_name,
-                                    self.preview_top,
-                                    t_preview,
-                                    self.preview_w,
-                                    self.preview_h,
-                                    self.pixel_w,
-                                    self.pixel_h,
-                                    t_todo_stop,
-                                    frame_count,
-                                    frame_interval,
-                                    str(ip_addresses),
-                                    self.preview_text,
-                                    self.custom_text,
-                                    self.cast_x,
-                                    self.cast_y,
-                                    grid,
-                                    str(list(frame_info))
-                                ],
-                                name=sl_name
+                            sl = PreviewChannel.create(
+                                sl_name,
+                                frame.shape,
+                                total_frames=CASTMedia.total_frames,
+                                server_port=port,
+                                t_viinput=preview_viinput,
+                                t_name=t_name,
+                                preview_top=self.preview_top,
+                                preview=t_preview,
+                                preview_w=self.preview_w,
+                                preview_h=self.preview_h,
+                                pixel_w=self.pixel_w,
+                                pixel_h=self.pixel_h,
+                                todo_stop=t_todo_stop,
+                                frame_count=frame_count,
+                                fps=frame_interval,
+                                ip_addresses=ip_addresses,
+                                text=self.preview_text,
+                                custom_text=self.custom_text,
+                                cast_x=self.cast_x,
+                                cast_y=self.cast_y,
+                                grid=grid
                             )
                             media_logger.debug(f'{t_name} SL created ')
 
-                        except OSError as e:
-                            if e.errno == errno.EEXIST:  # errno.EEXIST is 17 (File exists)
-                                media_logger.warning(f"Shared memory '{sl_name}' already exists. Attaching to it.")
-                                sl = ShareableList(name=sl_name)
-
                         except Exception as e:
                             media_logger.error(traceback.format_exc())
-                            media_logger.error(f'{t_name} Exception on shared list creation : {e}')
+                            media_logger.error(f'{t_name} Exception on preview channel creation : {e}')
                             break
 
                         # run main_preview in another process
                         # create a child process, so cv2.imshow() will run from its own Main Thread
                         media_logger.debug(f'Define sl_process for Preview : {sl_name}')
-                        window_name = f"{Utils.get_server_port()}-{t_name}-{str(t_viinput)}"[:64]
-                        sl_process = CASTMedia.Process(target=CV2Utils.sl_main_proc_preview,
-                                                       args=(sl_name, 'Media', window_name,))
-                        # start the child process
-                        # small delay occur during necessary time OS take to initiate the new process
+                        # a pre-started worker is used if ready, otherwise a new process is started
                         media_logger.debug(f'Starting Child Process for Preview : {sl_name}')
-                        sl_process.start()
+                        sl_process = WorkerPool.submit(CV2Utils.sl_main_proc_preview, (sl_name, 'Media', window_name,))
                         media_logger.debug(f'Child Process started for Preview : {sl_name}')
 
-                    # working with the shared list
+                    # working with the preview channel
                     if frame_count > 1:
                         try:
                             if sl is not None:
                                 # what to do from data updated by the child process (mainly user keystroke on preview)
-                                if sl[11] is True:
+                                if sl.get('todo_stop'):
                                     t_todo_stop = True
-                                if sl[6] is False:
+                                if not sl.get('preview'):
                                     t_preview = False
-                                self.preview_text = sl[15] is not False
-                                # Update Data on shared List
-                                sl[0] = CASTMedia.total_frames
-                                #
-                                # append not zero value to bytes to solve ShareableList bug
-                                # see https://github.com/python/cpython/issues/106939
-                                sl[1] = CV2Utils.frame_add_one(frame)
-                                #
-                                sl[5] = self.preview_top
-                                sl[7] = self.preview_w
-                                sl[8] = self.preview_h
-                                sl[9] = self.pixel_w
-                                sl[10] = self.pixel_h
-                                sl[12] = frame_count
-                                sl[15] = self.preview_text
+                                elif sl.due(preview_window_fps):
+                                    self.preview_text = sl.get('text')
+                                    # publish frame and display data, this wakes up the preview process
+                                    sl.write(frame,
+                                             total_frames=CASTMedia.total_frames,
+                                             preview_top=self.preview_top,
+                                             preview_w=self.preview_w,
+                                             preview_h=self.preview_h,
+                                             pixel_w=self.pixel_w,
+                                             pixel_h=self.pixel_h,
+                                             frame_count=frame_count,
+                                             text=self.preview_text,
+                                             grid=grid)
                             else:
                                 media_logger.error(f'This cast need to be created with preview = True')
                                 t_preview = False
 
                         except Exception as e:
                             media_logger.error(traceback.format_exc())
-                            media_logger.error(f'Error to set ShareableList : {e}')
+                            media_logger.error(f'Error to set preview channel : {e}')
                             t_preview = False
 
                 else:
 
-                    # for win, not necessary to use child process as this work from this thread (avoid overhead)
-                    if not CV2Utils.window_exists(window_name):
-                        cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-
-                    t_preview, t_todo_stop, self.preview_text = CV2Utils.cv2_display_frame(
-                        CASTMedia.total_frames,
-                        frame,
-                        port,
-                        t_viinput,
+                    # for win, not necessary to use child process: window is rendered by its own thread
+                    # (PreviewWindow) at its own rate, the cast only hands over its latest frame
+                    t_preview, t_todo_stop, self.preview_text = PreviewWindow.publish(
                         t_name,
-                        self.preview_top,
-                        t_preview,
-                        self.preview_w,
-                        self.preview_h,
-                        self.pixel_w,
-                        self.pixel_h,
-                        t_todo_stop,
-                        frame_count,
-                        frame_interval,
-                        ip_addresses,
-                        self.preview_text,
-                        self.custom_text,
-                        self.cast_x,
-                        self.cast_y,
-                        grid)
+                        window_name,
+                        frame,
+                        total_frame=CASTMedia.total_frames,
+                        server_port=port,
+                        t_viinput=preview_viinput,
+                        preview_top=self.preview_top,
+                        preview_w=self.preview_w,
+                        preview_h=self.preview_h,
+                        pixel_w=self.pixel_w,
+                        pixel_h=self.pixel_h,
+                        frame_count=frame_count,
+                        fps=frame_interval,
+                        ip_addresses=ip_addresses,
+                        text=self.preview_text,
+                        custom_text=self.custom_text,
+                        cast_x=self.cast_x,
+                        cast_y=self.cast_y,
+                        grid=grid)
 
             """
             do we need to sleep to be compliant with selected rate (fps)
             """
-            need_to_sleep()
+            late_slots = need_to_sleep()
 
             """
             do we need to repeat image
@@ -1130,10 +1262,11 @@ class CASTMedia(TextAnimatorMixin):
         CASTMedia.t_media_lock.acquire()
         #
         CASTMedia.cast_names.remove(t_name)
+        CASTMedia.cast_barrier.leave(t_name)
         if t_name in CastAPI.previews:
             del CastAPI.previews[t_name]
         #
-        # Clean ShareableList
+        # Clean preview channel
         Utils.sl_clean(sl, sl_process, t_name)
         #
         CASTMedia.t_media_lock.release()
@@ -1147,16 +1280,24 @@ class CASTMedia(TextAnimatorMixin):
             if is_image:
                 time.sleep(2)
 
-            CV2Utils.cv2_win_close(port, 'Media', t_name, t_viinput)
+            CV2Utils.cv2_win_close(port, 'Media', t_name, preview_viinput)
 
         # release media
         try:
-            if not isinstance(media, np.ndarray):
-                media.release()
+            if loop_cache is not None:
+                loop_cache.release()
+            if playlist is not None:
+                playlist.close()
+            if not isinstance(source, np.ndarray):
+                source.release()
                 media_logger.debug(f'{t_name} Release Media')
         except Exception as e:
             media_logger.warning(f'{t_name} Release Media status : {e}')
 
+        # stop multicast workers
+        if multicast_sender is not None:
+            multicast_sender.stop()
+
         # stop e131/artnet
         if t_protocol == 'e131':
             e131_host.deactivate()
@@ -331,9 +331,8 @@ class CastCenter:
         elif cast_type == 'Video':
             self.Media.viinput = self.video.value
         elif cast_type == 'Youtube':
-            # custom_format = cfg_mgr.custom_config['yt_format']
-            yt_url = await Utils.get_yt_video_url(video_url=self.yt_input.value,iformat="best")
-            self.Media.viinput = yt_url
+            # the cast resolves the url (cached) or reads the video while downloading (see ytstream.py)
+            self.Media.viinput = self.yt_input.value
         elif cast_type == 'Mobile':
             self.Media.viinput = 'mobile'
         else:
@@ -33,6 +33,7 @@ from src.txt.fontsmanager import FontSetApplication
 from src.utl.utils import CASTUtils as Utils, CastAPI
 from src.utl.cv2utils import CV2Utils
 from src.utl.cv2utils import VideoThumbnailExtractor
+from src.utl.mediacatalog import MediaCatalog
 
 from configmanager import cfg_mgr, PLATFORM, LoggerManager
 
@@ -40,6 +41,22 @@ logger_manager = LoggerManager(logger_name='WLEDLogger.nice')
 nice_logger = logger_manager.logger
 
 
+def load_preview_stream():
+    """Load the preview stream script (assets/js/preview_stream.js) into the page, once.
+
+    Every <img data-preview="cast name"> of the page is then fed by the /ws/previews WebSocket.
+    """
+    script = '/assets/js/preview_stream.js'
+    client = ui.context.client
+    if client.has_socket_connection:
+        # script tags added to head / body after page load are not executed
+        client.run_javascript(f"if (!window.wvsPreview) {{"
+                              f"const s = document.createElement('script'); s.src = '{script}';"
+                              f"document.head.appendChild(s);}}")
+    else:
+        ui.add_body_html(f'<script src="{script}"></script>')
+
+
 def run_preview_grid(grid_container, columns:int = 0, timer = None, activate:bool = False):
 
     from mainapp import action_to_casts
@@ -64,8 +81,8 @@ def run_preview_grid(grid_container, columns:int = 0, timer = None, activate:boo
 
         async def update_grid():
             """
-            Dynamically updates the grid, adding/removing previews as casts start/stop,
-            and refreshes the image source for each active preview.
+            Dynamically updates the grid, adding/removing previews as casts start/stop.
+            Images are pushed to the browser by the preview stream (see load_preview_stream).
             """
             # Get the configured preview size for the thumbnails
             preview_w = int(cfg_mgr.app_config.get('grid_preview_width', 240))
@@ -74,6 +91,10 @@ def run_preview_grid(grid_container, columns:int = 0, timer = None, activate:boo
             active_cast_names = set(CastAPI.previews.keys())
             displayed_cast_names = set(preview_elements.keys())
 
+            if active_cast_names - displayed_cast_names:
+                with grid:
+                    load_preview_stream()
+
             # Add new previews for casts that have started
             for name in active_cast_names - displayed_cast_names:
                 # Determine the class_name from the thread name for the action call
@@ -87,7 +108,7 @@ def run_preview_grid(grid_container, columns:int = 0, timer = None, activate:boo
                     with ui.card().tight().style(f'width: {preview_w}px; height: auto;') as card:
                         ui.label(name).classes(
                             'absolute-top-left m-1 text-white text-xs bg-black bg-opacity-50 px-1 rounded z-10')
-                        image = ui.image().props('no-transition').classes('w-full h-full object-contain')
+                        ui.element('img').props(f'data-preview="{name}"').classes('w-full h-full object-contain')
                         # Add a clickable icon to open the preview window for this specific cast.
                         preview_icon = ui.icon('preview', size='sm', color='white') \
                             .classes('absolute-top-right m-1 cursor-pointer opacity-60 hover:opacity-100') \
@@ -97,7 +118,7 @@ def run_preview_grid(grid_container, columns:int = 0, timer = None, activate:boo
                             params='', clear=False, execute=True
                         ))
 
-                preview_elements[name] = {'card': card, 'image': image}
+                preview_elements[name] = {'card': card}
                 nice_logger.debug(f"Added '{name}' to grid view.")
 
             # Remove previews for casts that have stopped
@@ -110,15 +131,6 @@ def run_preview_grid(grid_container, columns:int = 0, timer = None, activate:boo
             if not active_cast_names:
                 placeholder.set_visibility(True)
 
-            # Update the image for each active preview
-            try:
-                for name, elements in preview_elements.items():
-                    if preview := CastAPI.previews.get(name):  # The LatestFrame class is thread-safe
-                        if frame_b64 := preview.get():
-                            elements['image'].set_source(f'data:image/jpeg;base64,{frame_b64}')
-            except RuntimeError:
-                nice_logger.debug("Skipping one grid view update due to a dictionary change during iteration.")
-
         # Set grid columns based on config
         grid_cols = int(cfg_mgr.app_config.get('grid_view_columns', 4))
         if grid_cols > 0:
@@ -841,41 +853,39 @@ async def generate_actions_to_cast(class_name, class_threads, action_to_casts, i
                     # A pause/resume button for the live preview
                     pause_button = ui.button(icon='pause', on_click=None).classes('shadow-lg').tooltip('Pause/Resume Preview Refresh')
 
-                    def toggle_pause(timer: ui.timer, button: ui.button):
-                        """Toggles the timer and updates the button icon."""
-                        if timer.active:
-                            timer.deactivate()
-                            button.props('icon=play_arrow')
-                            ui.notify('Preview paused', throttle=1.0)
-                        else:
-                            timer.activate()
+                    def toggle_pause(image_element: ui.element, button: ui.button):
+                        """Pauses / resumes the preview stream of this image and updates the button icon."""
+                        if 'data-paused' in image_element.props:
+                            image_element.props(remove='data-paused')
                             button.props('icon=pause')
                             ui.notify('Preview resumed', throttle=1.0)
+                        else:
+                            image_element.props('data-paused')
+                            button.props('icon=play_arrow')
+                            ui.notify('Preview paused', throttle=1.0)
 
-                # Create the image with an initial source
+                # The image is fed by the preview stream, only while visible and not paused
                 # Start with a transparent placeholder to ensure the element renders correctly.
-                preview_image = ui.image('data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7')
+                preview_image = ui.element('img').props(
+                    f'data-preview="{item_th}" '
+                    f'src="data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"')
                 preview_image.classes('w-64 m-auto border-8')
-                # Apply the transition style directly to the underlying <img> tag for a smooth effect.
-                preview_image.props('no-transition')
+                load_preview_stream()
 
-                # Define an async function to update this specific image
-                async def update_preview(thread_name: str, image_element: ui.image):
+                # Check if the cast is still running, show intro image when stopped
+                async def check_preview(thread_name: str, image_element: ui.element):
                     from mainapp import CastAPI
-                    if thread_name in CastAPI.previews:
-                        new_b64 = CastAPI.previews[thread_name].get()
-                        if new_b64:
-                            image_element.set_source(f'data:image/png;base64,{new_b64}')
-                    else:
-                        image_element.set_source('assets/Source-intro.png')
+                    if thread_name not in CastAPI.previews:
+                        image_element.props(remove='data-preview')
+                        image_element.props('src="assets/Source-intro.png"')
                         timer_refresh.deactivate()
 
-                # Create a timer to refresh the image every second or whatever set in config
                 refresh_interval = float(cfg_mgr.app_config.get('preview_refresh_interval', 1.0))
-                timer_refresh = ui.timer(refresh_interval, lambda t=item_th, i=preview_image: update_preview(t, i))
+                timer_refresh = ui.timer(max(refresh_interval, 1.0),
+                                         lambda t=item_th, i=preview_image: check_preview(t, i))
 
-                # Now that the timer is created, set the button's on_click handler
-                pause_button.on('click', lambda t=timer_refresh, b=pause_button: toggle_pause(t, b))
+                # Now that the image is created, set the button's on_click handler
+                pause_button.on('click', lambda i=preview_image, b=pause_button: toggle_pause(i, b))
 
                 def show_details(item_v):
                     with ui.dialog() as dialog:
@@ -921,7 +931,7 @@ async def edit_ip(class_obj):
 async def edit_rate_x_y(class_obj):
     """Creates and displays UI elements for editing rate, scale width, and scale height.
 
-    This function generates number input fields for adjusting the frame rate,
+    This function generates number input fields for adjusting the frame rate (fixed or content adaptive),
     scaling width, and scaling height.
 
     Args:
@@ -931,6 +941,15 @@ async def edit_rate_x_y(class_obj):
     new_rate = ui.number('FPS', value=class_obj.rate, min=1, max=60, precision=0)
     new_rate.tooltip('Desired Frame Per Second, max = 60')
     new_rate.bind_value(class_obj, 'rate', forward=lambda value: int(value or 1))
+    adaptive_rate = ui.checkbox('Adaptive')
+    adaptive_rate.tooltip('Content adaptive FPS: move between FPS min and FPS max (0 = FPS) depending on motion')
+    adaptive_rate.bind_value(class_obj, 'adaptive_rate')
+    new_rate_min = ui.number('FPS min', value=class_obj.rate_min, min=1, max=60, precision=0)
+    new_rate_min.bind_visibility_from(adaptive_rate, 'value')
+    new_rate_min.bind_value(class_obj, 'rate_min', forward=lambda value: int(value or 1))
+    new_rate_max = ui.number('FPS max', value=class_obj.rate_max, min=0, max=60, precision=0)
+    new_rate_max.bind_visibility_from(adaptive_rate, 'value')
+    new_rate_max.bind_value(class_obj, 'rate_max', forward=lambda value: int(value or 0))
     new_scale_width = ui.number('Scale Width', value=class_obj.scale_width, min=8, max=1920, precision=0)
     new_scale_width.tooltip('Cast Width')
     new_scale_width.bind_value(class_obj, 'scale_width', forward=lambda value: int(value or 8))
@@ -1179,10 +1198,10 @@ class LocalFilePicker(ui.dialog):
                 ui.button('Cancel', on_click=self.close).props('outline')
                 ui.button('Ok', on_click=self._handle_ok)
 
-        self.update_grid()
-
         self.thumbs = thumbs
 
+        self.update_grid()
+
     def add_drives_toggle(self):
         """Adds a drive selection toggle for Windows platforms.
 
@@ -1223,6 +1242,9 @@ class LocalFilePicker(ui.dialog):
             }
             for p in paths
         ]
+        if self.thumbs:
+            # previews of this folder extracted in background (see mediacatalog.py)
+            MediaCatalog.scan([p for p in paths if p.is_file()])
         if self.upper_limit is None and self.path != self.path.parent or \
                 self.upper_limit is not None and self.path != self.upper_limit:
             self.grid.options['rowData'].insert(0, {
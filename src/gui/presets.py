@@ -297,7 +297,11 @@ async def save_cast_preset(class_name: str, class_obj = None) -> None:
                 'wled': str(class_obj.wled),
                 'wled_live': str(class_obj.wled_live),
                 'host': str(class_obj.host),
-                'viinput': str(class_obj.viinput)
+                'viinput': str(class_obj.viinput),
+                'adaptive_rate': str(class_obj.adaptive_rate),
+                'rate_min': str(class_obj.rate_min),
+                'rate_max': str(class_obj.rate_max),
+                'preview_fps': str(class_obj.preview_fps)
             }
 
             preset['MULTICAST'] = {
@@ -363,6 +367,10 @@ async def load_cast_preset(class_name: str, class_obj: object = None, interactiv
                 ('wled_live', 'GENERAL', 'wled_live', str2bool_ini),
                 ('host', 'GENERAL', 'host'),
                 ('viinput', 'GENERAL', 'viinput', str2intstr_ini),
+                ('adaptive_rate', 'GENERAL', 'adaptive_rate', str2bool_ini),
+                ('rate_min', 'GENERAL', 'rate_min', int),
+                ('rate_max', 'GENERAL', 'rate_max', int),
+                ('preview_fps', 'GENERAL', 'preview_fps', int),
                 ('multicast', 'MULTICAST', 'multicast', str2bool_ini),
                 ('cast_x', 'MULTICAST', 'cast_x', int),
                 ('cast_y', 'MULTICAST', 'cast_y', int),
@@ -30,6 +30,10 @@ Casting and Synchronization:
 player_cast, player_sync, slider_sync, slider_time, get_player_time, player_duration, and reset_sync:
     Methods to cast video to external devices, synchronize playback time (via slider or player), and manage sync state.
 
+report_clock:
+    Player position, play / pause, seek and rate are reported to the master media clock (see mediaclock.py), casts
+    with 'Clock' enabled follow it continuously.
+
 UI elements for manual and automatic synchronization, including time sliders, buttons, and knobs.
 
 GIF Creation and WLED Upload:
@@ -75,6 +79,7 @@ from wled import WLED
 import src.gui.niceutils as nice
 from src.utl.utils import CASTUtils as Utils
 from src.utl.cv2utils import CV2Utils
+from src.utl.mediaclock import MediaClock
 from src.gui.niceutils import YtSearch
 from src.gui.niceutils import AnimatedElement as Animate
 
@@ -199,6 +204,13 @@ class VideoPlayer:
             current_frame = int(current_time * self.CastAPI.video_fps)
             self.CastAPI.current_frame = current_frame
 
+    @staticmethod
+    def report_clock(event):
+        """Report the player position to the master media clock"""
+        MediaClock.report(float(event.args['time']) * 1000,
+                          playing=not event.args['paused'],
+                          rate=float(event.args['rate'] or 1))
+
     async def player_duration(self):
         """
         Return current duration time from the Player
@@ -418,6 +430,11 @@ class VideoPlayer:
             self.CastAPI.player = ui.video(src=video_file).classes('self-center')
             self.CastAPI.player.on('ended', lambda _: ui.notify('Video playback completed.'))
             self.CastAPI.player.on('timeupdate', lambda: self.get_player_time())
+            # player position to the master media clock, followed by casts with master_clock
+            for clock_event in ('timeupdate', 'play', 'pause', 'seeked', 'ratechange'):
+                self.CastAPI.player.on(clock_event, self.report_clock,
+                                       js_handler='(e) => emit({time: e.target.currentTime, '
+                                                  'paused: e.target.paused, rate: e.target.playbackRate})')
             self.CastAPI.player.on('durationchange', lambda: self.player_duration())
             # Add blinking effect to the show_player icon when the video is playing.
             self.CastAPI.player.on('play', lambda: show_player.classes('animate-pulse'))
@@ -485,6 +502,11 @@ class VideoPlayer:
                     .bind_value(self.Media, 'all_sync') \
                     .tooltip('Sync All Casts with selected time') \
                     .bind_visibility_from(self.CastAPI.player)
+
+                ui.checkbox('Clock') \
+                    .bind_value(self.Media, 'master_clock') \
+                    .tooltip('New Casts follow the Video Player time (frame drop / repeat, no seek)') \
+                    .bind_visibility_from(self.CastAPI.player)
     
             if str2bool(cfg_mgr.custom_config['gif_enabled']):
                 with ui.row() as gif_buttons:
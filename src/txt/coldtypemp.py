@@ -17,17 +17,18 @@ Key Architectural Components
 
 
 1. RUNColdtype Class
-This is the central component of the file. It inherits from multiprocessing.Process, which is the correct and standard
-way to create a new process in Python.
+This is the central component of the file. It runs the renderer (run_coldtype function) in a separate process, taken
+from the WorkerPool (see workerpool.py) when a pre-started one is ready, so the script starts without waiting for
+Python and Coldtype to be loaded. It exposes the usual process methods (start, is_alive, join, terminate, pid).
 
 •Process Isolation: By running as a separate process, it gets its own memory space and Python interpreter instance.
 This is a powerful design choice that prevents any errors, exceptions, or global state changes within the coldtype
 script from affecting the main WLEDVideoSync application.
 •Initialization (__init__): It is initialized with the path to the script to run, an optional log_queue for
-capturing console output, a shared_list_name for potential data sharing (though not used in the run method,
+capturing console output, a shared_list_name (SharedFrameRing) for potential data sharing (though not used in the run method,
 it's a good hook for future features), and a no_view flag to control whether coldtype opens its own preview window.
 
-•Execution (run method): This method is the entry point for the new process.
+•Execution (run_coldtype function): This function is the entry point for the new process.
  •It first checks if a log_queue was provided and, if so, redirects sys.stdout and sys.stderr to instances of
  the DualStream class. This is how console output is captured.
  •It constructs a list of command-line arguments to pass to the coldtype renderer. This is a flexible way to configure
@@ -54,8 +55,9 @@ import time
 
 from datetime import datetime
 from coldtype.renderer import Renderer
-from multiprocessing.shared_memory import ShareableList
-import multiprocessing
+
+from src.utl.framering import SharedFrameRing
+from src.utl.workerpool import WorkerPool
 
 from configmanager import cfg_mgr
 from configmanager import LoggerManager
@@ -95,77 +97,103 @@ class DualStream:
             self.original_stream.flush()
 
 
-class RUNColdtype(multiprocessing.Process):
+def run_coldtype(script_file, no_view: bool = False, log_queue=None):
+    """Run the Coldtype renderer, process entry point (pool worker or new process).
+
+    This function sets up the environment for the Coldtype process,
+    redirects stdout and stderr to the log queue if provided,
+    and then executes the Coldtype renderer.
+    """
+    if log_queue:
+        sys.stdout = DualStream(sys.__stdout__, log_queue, stream_name="stdout")
+        sys.stderr = DualStream(sys.__stderr__, log_queue, stream_name="stderr")
+
+    print("Coldtype process started")
+
+    try:
+        # Extract the file name without extension
+        script_name = os.path.splitext(os.path.basename(script_file))[0]
+        # folder to store img
+        render_folder = cfg_mgr.app_root_path(f'media/coldtype/{script_name}')
+        #
+        # call Coldtype with arguments
+        if cfg_mgr.app_config is not None:
+            keyboard = cfg_mgr.app_config['keyboard']
+        else:
+            keyboard = 'uk'
+        if cfg_mgr.app_config is not None:
+            editor = cfg_mgr.app_config['py_editor']
+        else:
+            editor = 'notepad'
+        _, parser = Renderer.Argparser()
+        args = [script_file,
+                "-kl", keyboard,
+                "-wcs", "1",
+                "-ec", editor,
+                "-of", render_folder,
+                "-nv", str(no_view)]
+        print(f"Using arguments: {args}")
+        params = parser.parse_args(args)
+        renderer = Renderer(parser=params)
+        print("Running renderer.main()...main Coldtype blocking loop")
+        renderer.main()
+
+    except Exception as e:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        error_msg = f"[{timestamp}] Error running Coldtype:\n{e}"
+        print(error_msg)  # This will be captured and sent to the log queue
+
+    finally:
+        print("Coldtype process stopped")
+        if log_queue:
+            sys.stdout = sys.__stdout__  # Restore original stdout
+            sys.stderr = sys.__stderr__  # Restore original stderr
+
+
+class RUNColdtype:
     """Run the Coldtype renderer in a separate process.
 
-     This method sets up the environment for the Coldtype process,
-     redirects stdout and stderr to the log queue if provided,
-     and then executes the Coldtype renderer.
+     The process comes from the WorkerPool (already started, Coldtype already imported) when one is ready,
+     otherwise a new one is started. The object exposes the usual process methods (is_alive, join, terminate ...).
      """
     # Class-level list to keep track of all running instances
     running_processes = []
 
     def __init__(self, script_file='', log_queue=None, shared_list_name=None, no_view: bool = False):
-        super().__init__()
         self.script_file = script_file
         self.log_queue = log_queue  # Optional log queue for console capture
-        self.shared_list = ShareableList(name=shared_list_name) if shared_list_name else None
+        self.shared_list = SharedFrameRing.attach(shared_list_name) if shared_list_name else None
         self.no_view = no_view
-        self.daemon = True  # Ensure the process runs as a daemon
+        self.process = None
         # Add the new instance to the list when it's created
         RUNColdtype.running_processes.append(self)
 
+    def start(self):
+        """Hand the script to a pool worker, or start a new (daemon) process."""
+        self.process = WorkerPool.submit(run_coldtype, (self.script_file, self.no_view), log_queue=self.log_queue)
+
     def run(self):
-        """Run the Coldtype renderer in a separate process.
+        """Run the Coldtype renderer into the current process."""
+        run_coldtype(self.script_file, self.no_view, self.log_queue)
 
-        This method sets up the environment for the Coldtype process,
-        redirects stdout and stderr to the log queue if provided,
-        and then executes the Coldtype renderer.
-        """
-        if self.log_queue:
-            sys.stdout = DualStream(sys.__stdout__, self.log_queue, stream_name="stdout")
-            sys.stderr = DualStream(sys.__stderr__, self.log_queue, stream_name="stderr")
-
-        print("Coldtype process started")
-
-        try:
-            # Extract the file name without extension
-            script_name = os.path.splitext(os.path.basename(self.script_file))[0]
-            # folder to store img
-            render_folder = cfg_mgr.app_root_path(f'media/coldtype/{script_name}')
-            #
-            # call Coldtype with arguments
-            if cfg_mgr.app_config is not None:
-                keyboard = cfg_mgr.app_config['keyboard']
-            else:
-                keyboard = 'uk'
-            if cfg_mgr.app_config is not None:
-                editor = cfg_mgr.app_config['py_editor']
-            else:
-                editor = 'notepad'
-            _, parser = Renderer.Argparser()
-            args = [self.script_file,
-                    "-kl", keyboard,
-                    "-wcs", "1",
-                    "-ec", editor,
-                    "-of", render_folder,
-                    "-nv", str(self.no_view)]
-            print(f"Using arguments: {args}")
-            params = parser.parse_args(args)
-            renderer = Renderer(parser=params)
-            print("Running renderer.main()...main Coldtype blocking loop")
-            renderer.main()
-
-        except Exception as e:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            error_msg = f"[{timestamp}] Error running Coldtype:\n{e}"
-            print(error_msg)  # This will be captured and sent to the log queue
-
-        finally:
-            print("Coldtype process stopped")
-            if self.log_queue:
-                sys.stdout = sys.__stdout__  # Restore original stdout
-                sys.stderr = sys.__stderr__  # Restore original stderr
+    @property
+    def pid(self):
+        return self.process.pid if self.process is not None else None
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def join(self, timeout=None):
+        if self.process is not None:
+            self.process.join(timeout)
+
+    def terminate(self):
+        if self.process is not None:
+            self.process.terminate()
+
+    def kill(self):
+        if self.process is not None:
+            self.process.kill()
 
     @staticmethod
     def stop_all():
@@ -100,7 +100,8 @@ class ActionExecutor:
                  swapper,  # Swapper instance for multicast effects
                  shared_buffer,  # Queue for inter-thread communication
                  logger,  # Logger instance
-                 t_protocol):  # Protocol used for streaming (e.g., 'ddp', 'artnet')
+                 t_protocol,  # Protocol used for streaming (e.g., 'ddp', 'artnet')
+                 cast_stats=None):  # Per cast counters dict, updated by the thread (e.g., skipped frames)
         """
         Initializes the ActionExecutor with the context and state of the casting thread.
         """
@@ -122,6 +123,7 @@ class ActionExecutor:
         self.shared_buffer = shared_buffer
         self.logger = logger
         self.t_protocol = t_protocol
+        self.cast_stats = cast_stats if cast_stats is not None else {}
 
         # for snapshot if requested
         self.frame_buffer = None
@@ -195,6 +197,7 @@ class ActionExecutor:
                 "fps": self.fps,
                 "frames": frame_count,  # Use passed frame_count
                 "length": self.media_length,
+                "stats": dict(self.cast_stats),  # Send a copy of the current counters
                 "img": img_b64
             }
         }}
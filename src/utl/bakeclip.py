@@ -0,0 +1,332 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `BakedClip` class, an LED native clip format (*.wvsc) for scheduled shows.
+
+A Media cast decodes, resizes, filters and splits the same video again on every run, even if nothing changed since
+the last show. `BakedClip.bake` runs the Media processing chain once (scale, `CASTMedia.prepare_frame`, virtual matrix
+size for multicast) and records the result at device resolution. A Media cast with a clip as input (`viinput` ends
+with .wvsc) maps the file and sends its frames as they are: no decoding, no image processing.
+
+File layout:
+
+    +----------------------------------------------------------------------------+
+    | header: one numpy record (CLIP_DTYPE), 64 bytes                            |
+    |   frame shape, multicast tiles, frame count, fps, compression, index offset |
+    +----------------------------------------------------------------------------+
+    | frames, one after the other: raw RGB, or deflated (full frame / delta)     |
+    +----------------------------------------------------------------------------+
+    | index: one INDEX_DTYPE record per frame (offset, size, kind, pts)          |
+    +----------------------------------------------------------------------------+
+
+Key Architectural Components:
+
+1.  BakedClip Class:
+    -   **`bake`**: Renders a media file with the filter / cast settings of a CASTMedia object (e.g. after loading
+        presets) into media/clips/<name>.wvsc. Runs in the caller thread, progress in `BakedClip.jobs`.
+    -   **Compression** (`bake_compression` in config):
+        -   `none`: raw frames, played directly from the mapping (zero copy).
+        -   `zlib`: each frame deflated on its own.
+        -   `delta`: XOR with the previous frame, then deflated: static parts of the image cost almost nothing.
+            A full frame is stored every `bake_keyframe` frames, so seeking (sync, skip) decodes only a few frames.
+        A frame is stored raw each time compression does not make it smaller.
+    -   **VideoCapture like reader**: `read`, `get`, `set` (CAP_PROP_POS_FRAMES / CAP_PROP_POS_MSEC), `release`, so
+        the Media cast loop (repeat, sync, skip frames, frame_index) works as with cv2.VideoCapture.
+    -   **Multicast**: frames hold the whole virtual matrix, the cast splits them with numpy views only. The tile
+        layout is stored in the header and checked against the cast settings.
+
+Design Philosophy:
+-   **Work once**: image processing is paid when baking, playback only reads memory and feeds the device queues,
+    so a small box can run many shows at the same time.
+"""
+
+import glob
+import os
+import time
+import zlib
+
+import cv2
+import numpy as np
+
+from src.utl.cv2utils import CV2Utils
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.bakeclip')
+bakeclip_logger = logger_manager.logger
+
+CLIP_EXT = '.wvsc'
+CLIP_FOLDER = 'media/clips'
+CLIP_MAGIC = 0x43535657  # 'WVSC'
+CLIP_VERSION = 1
+CLIP_DTYPE = np.dtype([
+    ('magic', '<u4'),
+    ('version', '<u2'),
+    ('compression', 'u1'),
+    ('channels', 'u1'),
+    ('height', '<u4'),
+    ('width', '<u4'),
+    ('tiles_x', '<u2'),
+    ('tiles_y', '<u2'),
+    ('count', '<u8'),
+    ('fps', '<f8'),
+    ('index_offset', '<u8'),
+    ('created', '<f8')
+])
+CLIP_HEADER_SIZE = 64
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('size', '<u4'),
+    ('kind', 'u1'),
+    ('pts', '<f8')
+])
+
+COMPRESSIONS = ('none', 'zlib', 'delta')
+KIND_RAW, KIND_ZLIB, KIND_DELTA = 0, 1, 2
+
+
+class BakedClip:
+    """Pre-rendered LED clip, read from a memory-mapped file like a cv2.VideoCapture."""
+
+    jobs = {}  # clip name -> bake progress
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.name = os.path.basename(self.path)
+        self._map = np.memmap(self.path, dtype=np.uint8, mode='r')
+
+        header = self._map[:CLIP_DTYPE.itemsize].view(CLIP_DTYPE)[0]
+        if int(header['magic']) != CLIP_MAGIC:
+            raise ValueError(f'{self.path} is not a baked clip')
+        if int(header['version']) > CLIP_VERSION:
+            raise ValueError(f'{self.path} clip version {int(header["version"])} not supported')
+
+        self.shape = (int(header['height']), int(header['width']), int(header['channels']))
+        self.tiles = (int(header['tiles_x']), int(header['tiles_y']))
+        self.count = int(header['count'])
+        self.fps = float(header['fps'])
+        self.compression = COMPRESSIONS[int(header['compression'])]
+        offset = int(header['index_offset'])
+        self.index = self._map[offset:offset + self.count * INDEX_DTYPE.itemsize].view(INDEX_DTYPE)
+        # frames a delta frame can be decoded from
+        self._keyframes = np.flatnonzero(self.index['kind'] != KIND_DELTA)
+
+        self.position = 0
+        self._decoded = (-1, None)  # last decoded frame number, frame
+
+    @classmethod
+    def open(cls, path):
+        """Map an existing clip read-only."""
+        return cls(path)
+
+    @staticmethod
+    def folder():
+        return cfg_mgr.app_root_path(CLIP_FOLDER)
+
+    @staticmethod
+    def list_clips():
+        """File names of baked clips, newest first."""
+        files = glob.glob(os.path.join(BakedClip.folder(), f'*{CLIP_EXT}'))
+        return [os.path.basename(file) for file in sorted(files, key=os.path.getmtime, reverse=True)]
+
+    """
+    Frames
+    """
+
+    def _decode(self, number, previous):
+        """Decode frame number, previous is the decoded frame number - 1 (delta frames only)."""
+        offset, size, kind = (int(self.index[number]['offset']), int(self.index[number]['size']),
+                              int(self.index[number]['kind']))
+        if kind == KIND_RAW:
+            return np.ndarray(self.shape, dtype=np.uint8, buffer=self._map, offset=offset)
+        data = np.frombuffer(zlib.decompress(self._map[offset:offset + size]), dtype=np.uint8).reshape(self.shape)
+        if kind == KIND_DELTA:
+            return np.bitwise_xor(previous, data)
+        return data
+
+    def frame(self, number):
+        """Return frame number (RGB, read only)."""
+        if not 0 <= number < self.count:
+            raise IndexError(f'frame {number} out of clip range (0-{self.count - 1})')
+
+        last, frame = self._decoded
+        if last == number:
+            return frame
+        if last == number - 1 and frame is not None:
+            # sequential playback: one frame to decode
+            start = number
+        else:
+            # seek: decode from the previous full frame
+            start = int(self._keyframes[np.searchsorted(self._keyframes, number, side='right') - 1])
+            frame = None
+        for current in range(start, number + 1):
+            frame = self._decode(current, frame)
+        self._decoded = (number, frame)
+        return frame
+
+    """
+    cv2.VideoCapture like API, used by CASTMedia
+    """
+
+    def isOpened(self):
+        return self._map is not None
+
+    def read(self):
+        """Return (success, frame) of the current position, then move to the next frame."""
+        if self._map is None or self.position >= self.count:
+            return False, None
+        frame = self.frame(self.position)
+        self.position += 1
+        return True, frame
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return self.count
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.position
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            # as cv2: timestamp of the last read frame
+            return float(self.index[self.position - 1]['pts']) * 1000 if self.position > 0 else 0.0
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.shape[1]
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.shape[0]
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.position = int(min(max(value, 0), self.count))
+        elif prop == cv2.CAP_PROP_POS_MSEC:
+            self.position = int(np.searchsorted(self.index['pts'], value / 1000))
+        else:
+            return False
+        return True
+
+    def release(self):
+        self.index = None
+        self._decoded = (-1, None)
+        self._map = None
+
+    def get_stats(self):
+        """Clip description, for info / API."""
+        return {'name': self.name,
+                'frames': self.count,
+                'fps': self.fps,
+                'shape': self.shape,
+                'tiles': self.tiles,
+                'compression': self.compression,
+                'size_mb': round(os.path.getsize(self.path) / 1024 / 1024, 2)}
+
+    """
+    Bake
+    """
+
+    @staticmethod
+    def clip_name(name):
+        """Clip name without any folder part, so the clip stays in the clips folder. ValueError if empty."""
+        clean = os.path.basename(str(name).replace('\\', '/')).strip()
+        if clean.endswith(CLIP_EXT):
+            clean = clean[:-len(CLIP_EXT)]
+        if clean in ('', '.', '..'):
+            raise ValueError(f'Invalid clip name {name!r}')
+        return clean
+
+    @classmethod
+    def bake(cls, cast, source, name=None, compression=None, keyframe=None):
+        """Render source with the settings of the CASTMedia object cast into a clip, return the clip path.
+
+        Output size is the cast scale_width x scale_height, multiplied by cast_x / cast_y for multicast.
+        """
+        compression = compression or cfg_mgr.app_config.get('bake_compression', 'delta')
+        if compression not in COMPRESSIONS:
+            raise ValueError(f'Unknown clip compression {compression}, should be in {COMPRESSIONS}')
+        keyframe = max(1, int(keyframe or cfg_mgr.app_config.get('bake_keyframe', 50)))
+
+        width, height = int(cast.scale_width), int(cast.scale_height)
+        tiles = (int(cast.cast_x), int(cast.cast_y)) if cast.multicast else (1, 1)
+
+        name = cls.clip_name(name or os.path.splitext(os.path.basename(str(source)))[0])
+        os.makedirs(cls.folder(), exist_ok=True)
+        path = os.path.join(cls.folder(), f'{name}{CLIP_EXT}')
+        tmp_path = f'{path}.tmp'
+
+        capture = cv2.VideoCapture(str(source))
+        if not capture.isOpened():
+            raise ValueError(f'Unable to open media {source}')
+        fps = capture.get(cv2.CAP_PROP_FPS) or float(cast.rate)
+        total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        job = cls.jobs[os.path.basename(path)] = {'frames': 0, 'total': total, 'done': False, 'error': None}
+        bakeclip_logger.info(f'Bake {source} to {path} ({compression}) at {width}x{height} tiles {tiles}')
+
+        index = []
+        previous = None
+        try:
+            with open(tmp_path, 'wb') as clip_file:
+                clip_file.write(bytes(CLIP_HEADER_SIZE))
+                offset = CLIP_HEADER_SIZE
+
+                while True:
+                    success, frame = capture.read()
+                    if not success:
+                        break
+
+                    # same chain as the Media cast loop
+                    frame = CV2Utils.resize_image(frame, width, height)
+                    frame = cast.prepare_frame(frame)
+                    if tiles != (1, 1):
+                        frame = CV2Utils.resize_image(frame, width * tiles[0], height * tiles[1])
+                    frame = np.ascontiguousarray(frame[..., :3], dtype=np.uint8)
+
+                    data, kind = frame.tobytes(), KIND_RAW
+                    if compression != 'none':
+                        delta_frame = (compression == 'delta' and previous is not None and len(index) % keyframe != 0)
+                        if delta_frame:
+                            packed, packed_kind = zlib.compress(np.bitwise_xor(frame, previous).tobytes()), KIND_DELTA
+                        else:
+                            packed, packed_kind = zlib.compress(data), KIND_ZLIB
+                        if len(packed) < len(data):
+                            data, kind = packed, packed_kind
+
+                    clip_file.write(data)
+                    index.append((offset, len(data), kind, len(index) / fps))
+                    offset += len(data)
+                    previous = frame
+                    job['frames'] = len(index)
+
+                if not index:
+                    raise ValueError(f'No frame read from {source}')
+
+                clip_file.write(np.array(index, dtype=INDEX_DTYPE).tobytes())
+
+                header = np.zeros((), dtype=CLIP_DTYPE)
+                header['magic'] = CLIP_MAGIC
+                header['version'] = CLIP_VERSION
+                header['compression'] = COMPRESSIONS.index(compression)
+                header['height'], header['width'], header['channels'] = previous.shape
+                header['tiles_x'], header['tiles_y'] = tiles
+                header['count'] = len(index)
+                header['fps'] = fps
+                header['index_offset'] = offset
+                header['created'] = time.time()
+                clip_file.seek(0)
+                clip_file.write(header.tobytes())
+
+            os.replace(tmp_path, path)
+
+        except Exception as er:
+            job['error'] = str(er)
+            bakeclip_logger.error(f'Bake error for {source} : {er}')
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        finally:
+            capture.release()
+            job['done'] = True
+
+        bakeclip_logger.info(f'Clip {path} baked: {len(index)} frames, {offset / 1024 / 1024:.2f} MB')
+        return path
@@ -0,0 +1,292 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `CaptureHub` class, a process-wide fan-out point for desktop captures. Without it, every
+`CASTDesktop` thread opens its own PyAV (x11grab / gdigrab / avfoundation) container or its own `mss` session, even
+when several casts capture the very same monitor. Screen capture is the most expensive step of a desktop cast, so its
+cost grew linearly with the number of running casts.
+
+With the hub, each distinct capture source (a monitor, a window rectangle or a PyAV input) is grabbed once per tick by
+a single background thread, and every cast that subscribes to it receives a read-only numpy view of the latest frame.
+Casts that only need a part of the screen (area selection) subscribe to the monitor that contains the area and receive
+a cropped view, so no additional grab is needed for them.
+
+Key Architectural Components:
+
+1.  CaptureHub Class:
+    -   **Purpose**: Registry of running capture sources, keyed by what they capture.
+    -   **`subscribe_mss`**: Returns a subscriber for an `mss` region. The region is mapped to the smallest monitor
+        that fully contains it, so full-screen and area casts on the same monitor share one grab.
+    -   **`subscribe_av`**: Returns a subscriber for a PyAV input (same format, input and options = same source).
+    -   **`get_stats`**: Provides grab / subscriber counters for monitoring.
+
+2.  CaptureSource Class:
+    -   A daemon thread owning the real capture object. `mss` handles are thread bound, so the `mss` instance is
+        created inside the thread. The source runs at the highest rate requested by its subscribers and stops by
+        itself when the last subscriber leaves.
+    -   PyAV frames are scaled by swscale to the largest cast size of the subscribers before the conversion to
+        numpy, as a single cast did before the hub: a 1080p / 4K screen is never converted at full resolution.
+
+3.  CaptureSubscriber Class:
+    -   Handle given to a cast. `read()` blocks until a frame newer than the last one seen is available, and returns
+        a (cropped) view on it. Frames are published as new arrays and never modified afterward, so the views stay
+        valid while the source moves on.
+
+Design Philosophy:
+-   **Share, don't copy**: scaling and conversion to a 3 channels array are done once in the source thread,
+    subscribers only slice.
+-   **On by default**: casts keep their own capture when `capture_hub` is disabled in the [desktop] config section.
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from configmanager import LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.capturehub')
+capturehub_logger = logger_manager.logger
+
+
+class CaptureSubscriber:
+    """Handle used by a cast to read frames from a shared CaptureSource."""
+
+    def __init__(self, source, rate, crop=None, size=None):
+        """
+        Args:
+            source (CaptureSource): the source to read from.
+            rate (int): requested fps, used by the source to select its own grab rate.
+            crop (tuple, optional): (x, y, w, h) region, relative to the source frame.
+            size (tuple, optional): (width, height) cast size, the PyAV source scales its frames down to it.
+        """
+        self.source = source
+        self.rate = rate
+        self.crop = crop
+        self.size = size
+        self.last_seq = 0
+
+    def read(self, timeout: float = 1.0):
+        """Wait for a frame newer than the last one read and return a view on it.
+
+        Returns:
+            np.ndarray or None: read-only view of the frame (cropped if requested), None on timeout or source error.
+        """
+        frame, self.last_seq = self.source.wait_frame(self.last_seq, timeout)
+        if frame is None:
+            return None
+        if self.crop is not None:
+            x, y, w, h = self.crop
+            frame = frame[y:y + h, x:x + w]
+        return frame
+
+    @property
+    def alive(self):
+        return self.source.is_alive() and not self.source.failed
+
+    def close(self):
+        """Leave the source, the source stops when no more subscriber."""
+        CaptureHub.unsubscribe(self)
+
+
+class CaptureSource(threading.Thread):
+    """Background thread grabbing one capture source and publishing the latest frame."""
+
+    def __init__(self, key, method, params):
+        super().__init__(name=f'CaptureHub-{method}', daemon=True)
+        self.key = key
+        self.method = method
+        self.params = params
+        self.subscribers = []
+        self.failed = False
+        self.grabs = 0
+
+        self._frame = None
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+
+    def rate(self):
+        """Highest rate requested by the subscribers."""
+        return max((sub.rate for sub in self.subscribers), default=25) or 25
+
+    def scale(self):
+        """Largest size requested by the subscribers, None if one of them needs the full frame."""
+        sizes = [sub.size for sub in list(self.subscribers)]
+        if not sizes or None in sizes:
+            return None
+        return max(width for width, _ in sizes), max(height for _, height in sizes)
+
+    def wait_frame(self, last_seq, timeout):
+        """Block until a frame with a sequence number greater than last_seq is published."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq > last_seq or self.failed or self._stop_event.is_set(),
+                                       timeout=timeout):
+                return None, last_seq
+            return self._frame, self._seq
+
+    def publish(self, frame):
+        """Make frame the latest one and wake up all subscribers."""
+        frame.flags.writeable = False
+        with self._cond:
+            self._frame = frame
+            self._seq += 1
+            self.grabs += 1
+            self._cond.notify_all()
+
+    def stop(self):
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def run(self):
+        try:
+            if self.method == 'mss':
+                self._run_mss()
+            else:
+                self._run_av()
+        except Exception as er:
+            capturehub_logger.error(f'Capture source {self.key} error: {er}')
+        finally:
+            self.failed = not self._stop_event.is_set()
+            with self._cond:
+                self._cond.notify_all()
+            CaptureHub.forget(self)
+            capturehub_logger.debug(f'Capture source {self.key} stopped after {self.grabs} grabs')
+
+    def _run_mss(self):
+        import mss
+
+        region = self.params['region']
+        with mss.mss() as sct:
+            next_time = time.perf_counter()
+            while not self._stop_event.is_set():
+                frame = np.array(sct.grab(region))
+                # same conversion as the per cast mss capture
+                self.publish(cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR))
+
+                next_time += 1.0 / self.rate()
+                sleep_time = next_time - time.perf_counter()
+                if sleep_time > 0:
+                    self._stop_event.wait(sleep_time)
+                else:
+                    # we are late, do not try to catch up
+                    next_time = time.perf_counter()
+
+    def _run_av(self):
+        import av
+
+        input_container = av.open(self.params['viinput'], 'r',
+                                  format=self.params['viformat'],
+                                  options=self.params['options'])
+        try:
+            input_stream = input_container.streams.get(video=0)
+            if self.params.get('multi_thread'):
+                input_container.streams.video[0].thread_type = "AUTO"
+            for frame in input_container.decode(input_stream):
+                if self._stop_event.is_set():
+                    break
+                size = self.scale()
+                if size is not None:
+                    # resize to the cast size in swscale, before the conversion
+                    frame = frame.reformat(width=size[0], height=size[1], format='rgb24')
+                self.publish(frame.to_ndarray(format="rgb24"))
+        finally:
+            input_container.close()
+
+
+class CaptureHub:
+    """Process-wide registry of shared capture sources."""
+
+    sources = {}  # key -> CaptureSource
+    hub_lock = threading.Lock()
+
+    @staticmethod
+    def mss_region(monitors, region):
+        """Find the source region and the crop to use for an mss region.
+
+        The smallest physical monitor (index >= 1) fully containing the region is used as source,
+        so all casts on this monitor share the same grab. If no monitor contains it, the region itself is the source.
+
+        Returns:
+            tuple: (source_region dict, crop tuple (x, y, w, h) or None)
+        """
+        left, top = region['left'], region['top']
+        right, bottom = left + region['width'], top + region['height']
+        candidates = [mon for mon in monitors[1:]
+                      if mon['left'] <= left and mon['top'] <= top
+                      and right <= mon['left'] + mon['width'] and bottom <= mon['top'] + mon['height']]
+        if not candidates:
+            return dict(region), None
+
+        mon = min(candidates, key=lambda m: m['width'] * m['height'])
+        source = {'top': mon['top'], 'left': mon['left'], 'width': mon['width'], 'height': mon['height']}
+        if source == {'top': top, 'left': left, 'width': region['width'], 'height': region['height']}:
+            return source, None
+        return source, (left - mon['left'], top - mon['top'], region['width'], region['height'])
+
+    @classmethod
+    def subscribe_mss(cls, monitors, region, rate):
+        """Subscribe to an mss capture of region (dict with top, left, width, height)."""
+        source_region, crop = cls.mss_region(monitors, region)
+        key = ('mss', source_region['left'], source_region['top'], source_region['width'], source_region['height'])
+        return cls._subscribe(key, 'mss', {'region': source_region}, rate, crop)
+
+    @classmethod
+    def subscribe_av(cls, viinput, viformat, options, rate, multi_thread=False, size=None):
+        """Subscribe to a PyAV capture, same input / format / options share the same container.
+
+        size (width, height) is the cast size: frames are scaled to the largest size of the subscribers.
+        """
+        key = ('av', str(viinput), viformat, tuple(sorted(options.items())))
+        params = {'viinput': viinput, 'viformat': viformat, 'options': options, 'multi_thread': multi_thread}
+        return cls._subscribe(key, 'av', params, rate, size=size)
+
+    @classmethod
+    def _subscribe(cls, key, method, params, rate, crop=None, size=None):
+        with cls.hub_lock:
+            source = cls.sources.get(key)
+            if source is None or not source.is_alive():
+                source = CaptureSource(key, method, params)
+                cls.sources[key] = source
+                subscriber = CaptureSubscriber(source, rate, crop, size)
+                source.subscribers.append(subscriber)
+                source.start()
+                capturehub_logger.info(f'New capture source : {key}')
+            else:
+                subscriber = CaptureSubscriber(source, rate, crop, size)
+                source.subscribers.append(subscriber)
+                capturehub_logger.info(f'Capture source {key} shared by {len(source.subscribers)} casts')
+        return subscriber
+
+    @classmethod
+    def unsubscribe(cls, subscriber):
+        with cls.hub_lock:
+            source = subscriber.source
+            if subscriber in source.subscribers:
+                source.subscribers.remove(subscriber)
+            if not source.subscribers:
+                source.stop()
+                if cls.sources.get(source.key) is source:
+                    del cls.sources[source.key]
+
+    @classmethod
+    def forget(cls, source):
+        """Remove a terminated source from the registry."""
+        with cls.hub_lock:
+            if cls.sources.get(source.key) is source:
+                del cls.sources[source.key]
+
+    @classmethod
+    def get_stats(cls):
+        """Return grab and subscriber counters for all running sources."""
+        with cls.hub_lock:
+            return [{'source': str(key),
+                     'subscribers': len(source.subscribers),
+                     'rate': source.rate(),
+                     'grabs': source.grabs}
+                    for key, source in cls.sources.items()]
@@ -0,0 +1,128 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `CastSync` class, the rendezvous used by Media casts for 'all sync' (`all_sync`, `auto_sync`):
+all running casts seek to the same media time, then restart together.
+
+Before, casts to sync were kept in a list under the media lock; each one removed its name, seeked, then polled the list
+with `time.sleep(.001)` until empty: one wake-up per millisecond per cast, and casts restarted up to a frame apart,
+depending on when each one polled the list for the last time.
+
+Key Architectural Components:
+
+1.  CastSync Class (one instance, `CASTMedia.cast_barrier`):
+    -   **`join`**: The first cast reaching the sync opens a round for all running casts, with the shared target
+        time (media ms). Each cast of the round gets the target, seeks, then calls `arrive`.
+    -   **`arrive`**: Blocks on a condition until the last cast of the round arrives (no polling). The last one
+        sets a common release instant a few ms ahead; all casts sleep / spin until this instant and restart
+        together. A cast that stopped in the meantime `leave`s the round; after `sync_timeout` seconds the round
+        is released anyway.
+    -   **Skew**: The spread of the actual restart instants is measured for each round and reported by
+        `get_stats` (cast info `sync` entry).
+"""
+
+import threading
+import time
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.castsync')
+castsync_logger = logger_manager.logger
+
+RELEASE_MARGIN_NS = 5_000_000  # time given to all waiting casts to wake up before the common release
+SPIN_NS = 1_000_000
+
+
+class CastSync:
+    """All cast sync round: seek to a shared target time, then release all casts together."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.generation = 0
+        self.target = 0.0
+        self._members = set()  # casts of the running round
+        self._waiting = set()  # members not yet arrived
+        self._release_ns = 0
+        self._on_release = None
+        self._restarts = []  # actual restart instants of the last round
+        self.rounds = 0
+        self.timeouts = 0
+        self.last_skew_ms = 0.0
+        self.max_skew_ms = 0.0
+
+    def join(self, name, names, target):
+        """Return the target time (ms) to seek to if name takes part in a round, opening one if none, else None."""
+        with self._cond:
+            if not self._waiting:
+                self.generation += 1
+                self.target = target
+                self._members = set(names)
+                self._waiting = set(names)
+                self._restarts = []
+                castsync_logger.debug(f'Sync round {self.generation} to {target} ms for {sorted(self._members)}')
+            return self.target if name in self._waiting else None
+
+    def arrive(self, name, on_release=None, timeout=None):
+        """Block until all casts of the round arrived, then return at the common release instant.
+
+        on_release is called once per round, under lock, before any cast restarts.
+        """
+        if timeout is None:
+            timeout = float(cfg_mgr.app_config.get('sync_timeout', 5))
+
+        with self._cond:
+            generation = self.generation
+            self._on_release = on_release
+            self._waiting.discard(name)
+            if not self._waiting:
+                self._release()
+            elif not self._cond.wait_for(lambda: self.generation != generation or not self._waiting, timeout):
+                castsync_logger.warning(f'Sync round {generation} timeout, not arrived: {sorted(self._waiting)}')
+                self.timeouts += 1
+                self._members -= self._waiting
+                self._waiting.clear()
+                self._release()
+            release_ns = self._release_ns
+
+        # all casts restart at the same instant
+        delay = release_ns - time.perf_counter_ns()
+        if delay > SPIN_NS:
+            time.sleep((delay - SPIN_NS) / 1e9)
+        while time.perf_counter_ns() < release_ns:
+            pass
+        restart = time.perf_counter_ns()
+
+        with self._cond:
+            if generation == self.generation:
+                self._restarts.append(restart)
+                if len(self._restarts) == len(self._members):
+                    self.last_skew_ms = (max(self._restarts) - min(self._restarts)) / 1e6
+                    self.max_skew_ms = max(self.max_skew_ms, self.last_skew_ms)
+
+    def _release(self):
+        """Last arrival (lock held): set the common release instant and wake up the round."""
+        self._release_ns = time.perf_counter_ns() + RELEASE_MARGIN_NS
+        self.rounds += 1
+        if self._on_release is not None:
+            self._on_release()
+        self._cond.notify_all()
+
+    def leave(self, name):
+        """Cast stopped: do not wait for it."""
+        with self._cond:
+            if name in self._waiting:
+                self._waiting.discard(name)
+                self._members.discard(name)
+                if not self._waiting:
+                    self._release()
+
+    def get_stats(self):
+        """Sync rounds and measured restart skew, for info / API."""
+        return {'rounds': self.rounds,
+                'timeouts': self.timeouts,
+                'target_ms': self.target,
+                'last_skew_ms': round(self.last_skew_ms, 3),
+                'max_skew_ms': round(self.max_skew_ms, 3)}
@@ -21,12 +21,14 @@
          applying pixel art effects (`pixelart_image`), and overlaying transparent images (`overlay_bgra_on_bgr`).
      -   **Preview Display**: Manages the creation and control of OpenCV preview windows (`cv2_display_frame`,
          `cv2_win_close`, `window_exists`). It also handles cross-platform complexities by supporting separate
-         processes for preview windows on non-Windows systems (`sl_main_preview`).
-     -   **Inter-Process Communication (IPC)**: Provides utilities for working with `multiprocessing.shared_memory.ShareableList`
-         (`send_to_queue`, `frame_add_one`, `frame_remove_one`), enabling efficient sharing of image data between
-         different processes or threads.
-     -   **Video/GIF Processing**: Offers methods for converting videos to GIFs (`video_to_gif`), resizing GIFs,
-         and extracting video metadata (`get_media_info`).
+         processes for preview windows on non-Windows systems (`sl_main_proc_preview`), or a window thread
+         (`PreviewWindow`) rendering at its own capped rate.
+     -   **Inter-Process Communication (IPC)**: Provides utilities for working with shared memory
+         (`update_sl_with_frame`, `sl_main_proc_preview` with `PreviewChannel`), enabling efficient sharing of image
+         data between different processes or threads.
+     -   **Video/GIF Processing**: Offers methods for converting videos to GIFs (`video_to_gif`, streamed by
+         `GifTranscoder`), resizing GIFs, and extracting video metadata (`get_media_info`, probed once per file by
+         `MediaCatalog`).
      -   **File Operations**: Includes functionality to save images from buffers (`save_image`).
 
  2.  ImageUtils Class:
@@ -44,6 +46,7 @@
      -   **Media Type Detection**: Intelligently determines if a given path points to an image or video file.
      -   **Thumbnail Generation**: Extracts frames at specified time intervals from videos or resizes images to create
          thumbnails (`extract_thumbnails`, `extract_thumbnails_from_video`, `extract_thumbnails_from_image`).
+         Local files are served by the media catalog (disk cache, process pool, see mediacatalog.py).
      -   **Error Handling**: Generates blank frames for invalid media files, ensuring robust operation.
 
  Design Philosophy:
@@ -58,21 +61,24 @@
 """
 
 import asyncio
-import ast
-import time
-import collections
 
 import cv2
-from multiprocessing.shared_memory import ShareableList
 import numpy as np
 from PIL import Image
 import io
 import base64
 import contextlib
 import os
+import threading
+import time
 from datetime import datetime
 from str2bool import str2bool
 
+from src.utl.previewchannel import PreviewChannel
+from src.utl.mosaic import MosaicRenderer
+from src.utl.mediacatalog import MediaCatalog
+from src.utl.giftranscode import GifTranscoder
+
 from configmanager import cfg_mgr
 from configmanager import LoggerManager
 
@@ -106,82 +112,24 @@ class CV2Utils:
             np.ndarray: A single image representing the grid of input images.
         """
         if not images:
-            try:
-                # Load the default placeholder image if no images are provided
-                default_img_path = cfg_mgr.app_root_path('assets/Source-intro.png')
-                default_img = cv2.imread(default_img_path)
-                if default_img is not None:
-                    return cv2.resize(default_img, (400, 225)) # Resize to a reasonable placeholder size
-            except Exception as e:
-                cv2utils_logger.warning(f"Could not load default grid image: {e}")
-            # Fallback to a blank image if the default image can't be loaded
-            return np.zeros((100, 400, 3), dtype=np.uint8)
-
-        # Determine grid dimensions
-        num_images = len(images)
-        if grid_cols is None:
-            grid_cols = int(np.ceil(np.sqrt(num_images)))
-        grid_rows = int(np.ceil(num_images / grid_cols))
+            # Default placeholder image if no images are provided (black if it can't be loaded)
+            return cv2.cvtColor(MosaicRenderer.background(400, 225), cv2.COLOR_RGB2BGR)
 
         # Use fixed preview dimensions from the configuration
-        preview_h = int(cfg_mgr.app_config.get('grid_preview_height', 90))
-        preview_w = int(cfg_mgr.app_config.get('grid_preview_width', 160))
-
-        # Calculate the total size of the grid canvas, including gaps
-        grid_height = grid_rows * preview_h + (grid_rows + 1) * gap
-        grid_width = grid_cols * preview_w + (grid_cols + 1) * gap
+        tile_size = (int(cfg_mgr.app_config.get('grid_preview_width', 160)),
+                     int(cfg_mgr.app_config.get('grid_preview_height', 90)))
+        # layout is keyed by image index
+        positions, grid_size = MosaicRenderer.layout(range(len(images)), tile_size, grid_cols or 0, gap)
 
-        # Create the canvas for the grid
-        try:
-            # Load the background image and resize it to the full grid dimensions
-            bg_img_path = cfg_mgr.app_root_path('assets/Source-intro.png')
-            grid_image = cv2.imread(bg_img_path)
-            if grid_image is None:
-                raise FileNotFoundError("Background image could not be loaded.")
-            grid_image = cv2.resize(grid_image, (grid_width, grid_height))
-        except Exception as e:
-            cv2utils_logger.warning(f"Could not load background for grid, falling back to black: {e}")
-            # Fallback to a black canvas if the image can't be loaded
-            grid_image = np.zeros((grid_height, grid_width, 3), dtype=np.uint8)
-
-        # Place each image into the grid
+        # cached background (RGB): grid is built in RGB then returned as BGR
+        grid_image = MosaicRenderer.background(*grid_size).copy()
         for i, img in enumerate(images):
-            row = i // grid_cols
-            col = i % grid_cols
-
-            # Standardize image size and format
             if img.shape[2] == 4:
                 img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-            resized_img = cv2.resize(img, (preview_w, preview_h))
-
-            # Overlay the name if provided
-            if names and i < len(names):
-                name_text = names[i]
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 0.3
-                font_thickness = 1
-                max_text_width = resized_img.shape[1] - 10  # 5px padding on each side
-
-                # Truncate text if it's too long to fit in the image
-                while cv2.getTextSize(name_text, font, font_scale, font_thickness)[0][0] > max_text_width:
-                    name_text = name_text[:-1]
-                if len(name_text) < len(names[i]):
-                    name_text = f'{name_text[:-2]}...'
-
-                text_size = cv2.getTextSize(name_text, font, font_scale, font_thickness)[0] # Recalculate size
-                text_x = (resized_img.shape[1] - text_size[0]) // 2
-                text_y = resized_img.shape[0] - 10  # 10 pixels from the bottom
-                cv2.putText(resized_img, name_text, (text_x, text_y), font, font_scale, (0, 0, 0), font_thickness + 2,
-                           cv2.LINE_AA)  # Black outline
-                cv2.putText(resized_img, name_text, (text_x, text_y), font, font_scale, (255, 255, 255), font_thickness,
-                            cv2.LINE_AA)  # White text
-
-            # Calculate position with gap and paste the image
-            y_offset = (row + 1) * gap + row * preview_h
-            x_offset = (col + 1) * gap + col * preview_w
-            grid_image[y_offset:y_offset + preview_h, x_offset:x_offset + preview_w] = resized_img
-
-        return grid_image
+            name = names[i] if names and i < len(names) else None
+            MosaicRenderer.draw_tile(grid_image, *positions[i], cv2.cvtColor(img, cv2.COLOR_BGR2RGB), tile_size, name)
+
+        return cv2.cvtColor(grid_image, cv2.COLOR_RGB2BGR)
 
     @staticmethod
     def overlay_bgra_on_bgr(background_bgr, overlay_bgra):
@@ -211,12 +159,12 @@ class CV2Utils:
         """Resizes a frame and places it into a shared memory list for inter-process communication.
         This SL is used by the 'SharedList' feature of desktop cast.
 
-        This method resizes the input frame to the specified width and height,applies a workaround for ShareableList
-        to ensure proper compatibility, and stores the processed frame and a timestamp in the provided shared list.
+        This method resizes the input frame to the specified width and height, and writes it with its timestamp
+        into the next slot of the shared frame ring.
 
         Args:
             frame (np.ndarray): The image frame to be sent.
-            sl (ShareableList): The shared memory list to store the frame and timestamp.
+            sl (SharedFrameRing): The shared memory frame ring to store the frame and timestamp.
             w (int): The target width for resizing the frame.
             h (int): The target height for resizing the frame.
 
@@ -226,41 +174,11 @@ class CV2Utils:
 
         try:
             frame = CV2Utils.resize_image(frame, w, h, keep_ratio=False)
-            frame = CV2Utils.frame_add_one(frame)
-
-            sl[0] = frame
-            sl[1] = time.time()
+            sl.write(frame)
 
         except Exception as e:
             cv2utils_logger.error(f'Error to set frame in SL : {str(e)}')
 
-    @staticmethod
-    def frame_add_one(frame):
-        """Appends a non-zero byte to a frame's byte representation.
-
-        This workaround addresses a ShareableList bug where zero-sized byte strings cause issues.  It converts the
-        NumPy array representing the frame to bytes, appends a non-zero byte, and returns the modified bytes.
-        see https://github.com/python/cpython/issues/106939
-        """
-        frame = frame.tobytes()
-        frame = bytearray(frame)
-        frame.append(1)
-        return bytes(frame)
-
-    @staticmethod
-    def frame_remove_one(frame):
-        """Removes the last byte from a frame's byte representation.
-
-        This function reverses the workaround applied by frame_add_1, removing the extra byte appended to handle a
-        ShareableList bug.  It converts the byte string to a bytearray, removes the last byte, and returns the
-        modified byte string.
-        """
-        # remove the last byte
-        frame = bytearray(frame)
-        frame = frame[:-1]
-        return bytes(frame)
-
-
     @staticmethod
     def set_black_bg(image):
         """
@@ -303,20 +221,21 @@ class CV2Utils:
         cv2utils_logger.debug(f'{t_name} Stop window preview if any for {class_name}')
         window_name = f"{server_port}-{t_name}-{str(t_viinput)}"
 
-        # check if window run into sub process so data come from ShareableList
+        # check if window run into sub process so data come from PreviewChannel
         if str2bool(cfg_mgr.app_config['preview_proc']):
             cv2utils_logger.debug('Preview Window on sub process')
             sl_name = f'{t_name}_p'
             try:
-                # attach to a shareable list by name
-                sl = ShareableList(name=sl_name)
-                sl[6] = False
-                sl[18] = '0,0,0'
+                # attach to the preview channel by name, ask the preview process to end
+                channel = PreviewChannel.attach(sl_name)
+                channel.set(preview=False)
+                channel.notify()
+                channel.close()
             except Exception as e:
-                cv2utils_logger.error(f'Error to access SharedList  {sl_name} with error : {e} ')
+                cv2utils_logger.error(f'Error to access PreviewChannel  {sl_name} with error : {e} ')
 
-        else:
-            # for window into thread
+        elif not PreviewWindow.close(t_name):
+            # for window into cast thread
             try:
                 win = cv2.getWindowProperty(window_name, cv2.WND_PROP_VISIBLE)
                 if win != 0:
@@ -328,135 +247,100 @@ class CV2Utils:
     @staticmethod
     def sl_main_proc_preview(shared_list, class_name, window_name):
         """
-        Preview Window from ShareableList
+        Preview Window from PreviewChannel
 
         Used by platform <> win32, in this way cv2.imshow() will run on MainThread from a subprocess.
-        This one will read data from a ShareAbleList created by cast thread.
-
-        Refactored for clarity, maintainability, and robustness:
-        - Uses a named tuple for shared list structure.
-        - Extracts frame extraction and validation into a helper.
-        - Adds explicit error logging for data mismatches.
-        - Encapsulates shared list access.
+        This one will read data from the PreviewChannel created by cast thread (see previewchannel.py).
 
-        It handles potential data corruption issues during the byte-to-array
-        conversion by displaying a default image if the data size is incorrect. User interactions with the preview
-        window are captured, and the corresponding flags (t_preview, t_todo_stop, text) are updated in the shared list.
-        The loop terminates when t_todo_stop is set or t_preview is cleared.
+        The process blocks until the cast thread publishes a new frame, so it does not use CPU when the cast
+        is paused or idle. Without new frame, the last one is shown again a few times per second, so window events
+        and keys are still handled. User interactions with the preview window are captured, and the corresponding
+        flags (preview, todo_stop, text) are updated in the channel.
+        The loop terminates when todo_stop is set or preview is cleared (from the window or by the cast thread).
 
         Args:
-            shared_list (str): Name of the shared memory list containing frame data and metadata.
+            shared_list (str): Name of the preview channel containing frame data and metadata.
             class_name (str): Name of the class or process for logging and window identification.
             window_name (str): Name of the OpenCV window to display the preview.
 
         Returns:
             None
         """
-        # Define a named tuple for the shared list structure
-        SLFields = collections.namedtuple('SLFields', [
-            'total_frame', 'frame_bytes', 'server_port', 't_viinput', 't_name', 'preview_top', 't_preview',
-            'preview_w', 'preview_h', 'pixel_w', 'pixel_h', 't_todo_stop', 'frame_count', 'fps', 'ip_addresses',
-            'text', 'custom_text', 'cast_x', 'cast_y', 'grid', 'frame_info'
-        ])
-
-        def extract_fields(sl):
-            """Extracts and returns a SLFields namedtuple from the ShareableList."""
-            try:
-                return SLFields(
-                    sl[0], sl[1], sl[2], sl[3], sl[4], sl[5], sl[6], sl[7], sl[8], sl[9], sl[10],
-                    sl[11], sl[12], sl[13], sl[14], sl[15], sl[16], sl[17], sl[18], sl[19], sl[20]
-                )
-            except Exception as e:
-                cv2utils_logger.error(f"Error extracting fields from ShareableList: {e}")
-                raise
-
-        def get_frame_from_bytes(frame_bytes, frame_info, default_img):
-            """Converts bytes to a numpy array frame, or returns default_img on error."""
-            try:
-                frame_data = CV2Utils.frame_remove_one(frame_bytes)
-                frame_np = np.frombuffer(frame_data, dtype=np.uint8)
-                shape = tuple(map(int, ast.literal_eval(frame_info)))
-                expected_bytes = shape[0] * shape[1] * shape[2]
-                if frame_np.nbytes == expected_bytes:
-                    # shape need to be the same
-                    return frame_np.reshape(shape)
-                else:
-                    cv2utils_logger.warning(
-                        f"Frame data size mismatch: got {frame_np.nbytes}, expected {expected_bytes}. Using default image."
-                    )
-                    return default_img
-            except Exception as e:
-                cv2utils_logger.error(f"Error reconstructing frame from bytes: {e}")
-                return default_img
+        # attach to the preview channel by name: name is Thread Name + _p
+        channel = PreviewChannel.attach(shared_list)
+        # cast thread will wake us up on each new frame
+        channel.enable_doorbell()
+        t_name = channel.get('t_name')
 
-        # attach to a shareable list by name: name is Thread Name + _p for a preview shareable list
-        # sl[0]...sl[20] are used to store work data
-        sl = ShareableList(name=shared_list)
-
-        # Default image to display in case of np.array conversion problem
+        # Default image to display until first frame
         default_img = cv2.imread(cfg_mgr.app_root_path('assets/Source-intro.png'))
         default_img = cv2.cvtColor(default_img, cv2.COLOR_BGR2RGB)
         default_img = CV2Utils.resize_image(default_img, 640, 360, keep_ratio=False)
 
-        cv2utils_logger.info(f'Preview from ShareAbleList for {class_name}')
+        cv2utils_logger.info(f'Preview from PreviewChannel for {class_name}')
 
         # Check if window already exists otherwise create it
         if not CV2Utils.window_exists(window_name):
             cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
 
-        #
-        # Display image on preview window
-        # infinite loop
-        #
-        while True:
-            fields = extract_fields(sl)
-
-            # Generate new frame (2D) from ShareableList. Display default img in case of problem
-            # original np.array has been transformed to bytes with 'tobytes()'
-            # re-created as array with 'frombuffer()'
-            # ... looks like some data can miss (ShareableList bug)  !!!
-            # see https://github.com/python/cpython/issues/106939
-            frame_to_view = get_frame_from_bytes(fields.frame_bytes, fields.frame_info, default_img)
-
-            # Display the frame and update control flags in the shared list
-            #
-            # Display the frame (frame_to_view) into preview window
-            # here we work with value from ShareAbleList
-            #
-            t_preview, t_todo_stop, text = CV2Utils.cv2_display_frame(
-                fields.total_frame,
-                frame_to_view,
-                fields.server_port,
-                fields.t_viinput,
-                fields.t_name,
-                fields.preview_top,
-                fields.t_preview,
-                fields.preview_w,
-                fields.preview_h,
-                fields.pixel_w,
-                fields.pixel_h,
-                fields.t_todo_stop,
-                fields.frame_count,
-                fields.fps,
-                fields.ip_addresses,
-                fields.text,
-                fields.custom_text,
-                fields.cast_x,
-                fields.cast_y,
-                fields.grid
-            )
-            # and put back new returned value into ShareAbleList
-            sl[6], sl[11], sl[15] = t_preview, t_todo_stop, text
+        last_seq = 0
+        frame_to_view = default_img
+        try:
+            while True:
+                # block until a new frame, or time to refresh the window
+                if channel.wait(last_seq, timeout=.25):
+                    frame, last_seq = channel.read()
+                    if frame is not None:
+                        frame_to_view = frame
+
+                # stop requested by the cast thread
+                if not channel.get('preview') or channel.get('todo_stop'):
+                    cv2utils_logger.debug(f'SL END Preview requested by cast : {t_name}')
+                    break
+
+                #
+                # Display the frame (frame_to_view) into preview window
+                # here we work with value from PreviewChannel
+                #
+                t_preview, t_todo_stop, text = CV2Utils.cv2_display_frame(
+                    channel.get('total_frames'),
+                    frame_to_view,
+                    channel.get('server_port'),
+                    channel.get('t_viinput'),
+                    t_name,
+                    channel.get('preview_top'),
+                    True,
+                    channel.get('preview_w'),
+                    channel.get('preview_h'),
+                    channel.get('pixel_w'),
+                    channel.get('pixel_h'),
+                    False,
+                    channel.get('frame_count'),
+                    channel.get('fps'),
+                    channel.get('ip_addresses'),
+                    channel.get('text'),
+                    channel.get('custom_text'),
+                    channel.get('cast_x'),
+                    channel.get('cast_y'),
+                    channel.get('grid')
+                )
+                # and put back new returned value into PreviewChannel
+                channel.set(preview=t_preview, todo_stop=t_todo_stop, text=text)
+
+                # Stop if requested
+                if t_todo_stop is True:
+                    cv2utils_logger.debug(f'SL STOP Cast for : {t_name}')
+                    break
+                elif t_preview is False:
+                    cv2utils_logger.debug(f'SL END Preview for : {t_name}')
+                    break
 
-            # Stop if requested
-            if t_todo_stop is True:
-                cv2utils_logger.debug(f'SL STOP Cast for : {fields.t_name}')
-                break
-            elif t_preview is False:
-                cv2utils_logger.debug(f'SL END Preview for : {fields.t_name}')
-                break
+        finally:
+            with contextlib.suppress(Exception):
+                cv2.destroyWindow(window_name)
+            channel.close()
 
-        cv2utils_logger.info(f'Child process exit for : {fields.t_name}')
+        cv2utils_logger.info(f'Child process exit for : {t_name}')
 
     @staticmethod
     def cv2_display_frame(total_frame,
@@ -669,24 +553,8 @@ class CV2Utils:
 
         try:
 
-            capture = cv2.VideoCapture(media)
-
-            dict_media = {
-                    "CV_CAP_PROP_FRAME_WIDTH": capture.get(cv2.CAP_PROP_FRAME_WIDTH),
-                    "CV_CAP_PROP_FRAME_HEIGHT": capture.get(cv2.CAP_PROP_FRAME_HEIGHT),
-                    "CAP_PROP_FPS": capture.get(cv2.CAP_PROP_FPS),
-                    "CAP_PROP_POS_MSEC": capture.get(cv2.CAP_PROP_POS_MSEC),
-                    "CAP_PROP_FRAME_COUNT": capture.get(cv2.CAP_PROP_FRAME_COUNT),
-                    "CAP_PROP_BRIGHTNESS": capture.get(cv2.CAP_PROP_BRIGHTNESS),
-                    "CAP_PROP_CONTRAST": capture.get(cv2.CAP_PROP_CONTRAST),
-                    "CAP_PROP_SATURATION": capture.get(cv2.CAP_PROP_SATURATION),
-                    "CAP_PROP_HUE": capture.get(cv2.CAP_PROP_HUE),
-                    "CAP_PROP_GAIN": capture.get(cv2.CAP_PROP_GAIN),
-                    "CAP_PROP_CONVERT_RGB": capture.get(cv2.CAP_PROP_CONVERT_RGB)
-            }
-
-            # release
-            capture.release()
+            # local files are probed once, then read from the media catalog (see mediacatalog.py)
+            dict_media = MediaCatalog.info(media)
 
         except Exception as e:
             cv2utils_logger.error(f'Error to get cv2 info : {e}')
@@ -708,45 +576,14 @@ class CV2Utils:
             fps (int):
         """
         try:
-            cap = cv2.VideoCapture(video_path)
-            # fps = cap.get(cv2.CAP_PROP_FPS)
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-            start_frame = max(0, min(start_frame, total_frames - 1))
-            end_frame = max(start_frame + 1, min(end_frame, total_frames))
-
-            frames = []
-            for i in range(start_frame, end_frame):
-                cap.set(cv2.CAP_PROP_POS_FRAMES, i)
-                ret, frame = cap.read()
-                if ret:
-                    # select gif quality
-                    if str2bool(cfg_mgr.custom_config['gif_quality']):
-                        if width and height:
-                            frame = cv2.resize(frame, (width, height))
-                        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                    else:
-                        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                        if width and height:
-                            img = img.convert(mode='P', colors=64)
-                            img = img.resize(size=(width, height), resample=1)
-
-                    frames.append(img)
-
-            if frames:
-                duration = int(1000 / fps)  # Duration in milliseconds, based on desired FPS
-                frames[0].save(gif_path,
-                               save_all=True,
-                               append_images=frames[1:],
-                               duration=duration,
-                               loop=0,
-                               disposal=2)
+            # select gif quality: full palette or smaller size
+            colors = 256 if str2bool(cfg_mgr.custom_config['gif_quality']) else 64
+            # streaming pipeline, memory does not grow with the clip length (see giftranscode.py)
+            if GifTranscoder.video_to_gif(video_path, gif_path, fps, start_frame, end_frame, width, height, colors):
                 cv2utils_logger.info(f"GIF created successfully: {gif_path}")
             else:
                 cv2utils_logger.error("No frames extracted. GIF not created.")
 
-            cap.release()
-
         except Exception as e:
             cv2utils_logger.error(f"Error creating GIF: {e}")
 
@@ -904,6 +741,124 @@ class CV2Utils:
         cv2utils_logger.debug(f"Image saved to {t_filename}")
 
 
+class PreviewWindow:
+    """cv2 preview window of a cast, rendered by its own thread at a capped rate (preview_proc = False).
+
+    The cast thread only hands over its latest frame and display settings with `publish`. Resize, pixel art,
+    overlays, imshow and waitKey run in the window thread, at most `preview_window_fps` times per second, so the
+    preview no longer slows the cast. Without new frame, the last one is shown again a few times per second
+    so window keys are still handled.
+    """
+
+    _windows = {}  # t_name -> PreviewWindow
+    _ended = {}  # t_name -> (preview, todo_stop, text) of a window closed from its keys, for the next publish
+    _lock = threading.Lock()
+
+    def __init__(self, t_name, window_name, rate):
+        self.t_name = t_name
+        self.window_name = window_name
+        self.rate = rate
+        # flags updated by window keys (q, p, t), given back to the cast
+        self.preview = True
+        self.todo_stop = False
+        self.text = False
+        self._cast_text = None
+        self._frame = None
+        self._seq = 0
+        self._settings = {}
+        self._event = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f'Preview-{t_name}')
+
+    @classmethod
+    def publish(cls, t_name, window_name, frame, **settings):
+        """Cast side: hand over the latest frame (not modified afterward) and display settings.
+
+        settings are the cv2_display_frame parameters (total_frame, server_port, ..., text, grid).
+        Returns (preview, todo_stop, text) as updated by the window.
+        """
+        with cls._lock:
+            if (ended := cls._ended.pop(t_name, None)) is not None:
+                # closed from the window keys
+                return ended
+            window = cls._windows.get(t_name)
+            if window is None:
+                rate = int(cfg_mgr.app_config.get('preview_window_fps', 30))
+                window = cls._windows[t_name] = cls(t_name, window_name, max(rate, 1))
+                window._thread.start()
+
+        text = settings.pop('text')
+        if text != window._cast_text:
+            # changed by the cast (UI / API)
+            window.text = window._cast_text = text
+        window._settings = settings
+        window._frame = frame
+        window._seq += 1
+        window._event.set()
+        return window.preview, window.todo_stop, window.text
+
+    @classmethod
+    def close(cls, t_name) -> bool:
+        """Close the preview window of a cast, False if there is none."""
+        with cls._lock:
+            window = cls._windows.pop(t_name, None)
+            cls._ended.pop(t_name, None)
+        if window is None:
+            return False
+        window._running = False
+        window.preview = False
+        window._event.set()
+        if threading.current_thread() is not window._thread:
+            window._thread.join(timeout=1)
+        return True
+
+    def _run(self):
+        if not CV2Utils.window_exists(self.window_name):
+            cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+
+        last_seq = 0
+        frame = None
+        try:
+            while self._running:
+                # wait for a new frame, or time to refresh the window
+                self._event.wait(.25)
+                self._event.clear()
+                if not self._running:
+                    break
+                start = time.monotonic()
+                if self._seq != last_seq:
+                    frame, last_seq = self._frame, self._seq
+                if frame is None:
+                    continue
+
+                self.preview, self.todo_stop, self.text = CV2Utils.cv2_display_frame(
+                    frame=frame,
+                    t_name=self.t_name,
+                    t_preview=True,
+                    t_todo_stop=False,
+                    text=self.text,
+                    **self._settings)
+
+                if self.todo_stop or not self.preview:
+                    break
+
+                # cap the render rate
+                time.sleep(max(0.0, 1 / self.rate - (time.monotonic() - start)))
+
+        except Exception as er:
+            cv2utils_logger.error(f'{self.t_name} Error on preview window : {er}')
+            self.preview = False
+        finally:
+            with PreviewWindow._lock:
+                if PreviewWindow._windows.get(self.t_name) is self:
+                    del PreviewWindow._windows[self.t_name]
+                    PreviewWindow._ended[self.t_name] = (self.preview, self.todo_stop, self.text)
+            self._running = False
+            with contextlib.suppress(Exception):
+                if cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) != 0:
+                    cv2.destroyWindow(self.window_name)
+
+
 class ImageUtils:
     """Provides utility functions for image processing and manipulation.
 
@@ -1216,7 +1171,12 @@ class VideoThumbnailExtractor:
         """
         if times_in_seconds is None:
             times_in_seconds = [5]
-        if await self.is_image_file():
+        if MediaCatalog.is_local(self.media_path):
+            # from the media catalog, else extracted by its process pool
+            frames = await MediaCatalog.thumbnails(self.media_path, times_in_seconds, self.thumbnail_width)
+            self.thumbnail_frames = [frame if frame is not None else await self.create_blank_frame()
+                                     for frame in frames]
+        elif await self.is_image_file():
             await self.extract_thumbnails_from_image()
         elif await self.is_video_file():
             await self.extract_thumbnails_from_video(times_in_seconds)
@@ -0,0 +1,269 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `FrameRegistry` class, a local registry of the shared frame rings (see framering.py) used by
+the 'SharedList' input of Desktop casts. It replaces the `SyncManager` server that was running over TCP: creating,
+listing or attaching a shared list no longer needs a server process, a connection or any proxy call.
+
+The registry is a small index file mapped in memory (mmap) by every process using it: the application, the Coldtype
+scripts, the mobile server, ... Each entry stores the name of the shared memory block, the frame shape and dtype,
+and the PID (with its creation time) of the process that owns it.
+
+Key Architectural Components:
+
+1.  FrameRegistry Class:
+    -   **`open`**: Maps the index file of a registry (one per manager port, in the app tmp folder). The mapping is
+        cached by process, so attaching to a list only costs an index lookup plus a `SharedMemory` attach.
+    -   **`create`**: Creates a ring, checks shape / dtype if the name already exists, and records the owner.
+        The ring stays open in the creating process until `delete`.
+    -   **`attach`**: Attaches to a ring, optionally checking its shape and dtype.
+    -   **`reclaim_stale`**: Entries whose owner process is gone (crash, kill) are removed and their shared memory
+        blocks unlinked. A PID reused by another process is detected with the process creation time.
+    -   **Locking**: Index updates are protected by an OS file lock (`fcntl` / `msvcrt`), so several processes
+        can create and delete entries at the same time.
+
+Design Philosophy:
+-   **No server**: the index is the only shared state, everything else is plain shared memory.
+-   **Crash safe**: the index lives on disk, so blocks of a crashed run are found and reclaimed on next start.
+"""
+
+import mmap
+import os
+import time
+
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import psutil
+
+from src.utl.framering import SharedFrameRing
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.frameregistry')
+frameregistry_logger = logger_manager.logger
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+MAGIC = 0x49525657  # 'WVRI'
+ENTRIES = 64
+INDEX_HEADER_SIZE = 16
+
+ENTRY_DTYPE = np.dtype([
+    ('name', 'S64'),
+    ('width', '<u4'),
+    ('height', '<u4'),
+    ('channels', '<u4'),
+    ('pid', '<u4'),
+    ('dtype', 'S8'),
+    ('pid_time', '<f8'),
+    ('created', '<f8')
+])
+
+
+def _process_time(pid):
+    """Creation time of a process, None if it does not exist."""
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError):
+        return None
+
+
+class FrameRegistry:
+    """Local registry of shared frame rings, backed by a memory mapped index file."""
+
+    _registries = {}  # path -> FrameRegistry, one mapping per process
+    _owned = {}  # name -> SharedFrameRing created by this process
+
+    def __init__(self, path):
+        self.path = path
+        size = INDEX_HEADER_SIZE + ENTRIES * ENTRY_DTYPE.itemsize
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            with self._locked():
+                if os.fstat(self._fd).st_size < size:
+                    os.ftruncate(self._fd, size)
+        self._mm = mmap.mmap(self._fd, size)
+
+        self._header = np.ndarray((4,), dtype='<u4', buffer=self._mm, offset=0)
+        self._entries = np.ndarray((ENTRIES,), dtype=ENTRY_DTYPE, buffer=self._mm, offset=INDEX_HEADER_SIZE)
+        if int(self._header[0]) != MAGIC:
+            with self._locked():
+                self._entries[:] = np.zeros((), dtype=ENTRY_DTYPE)
+                self._header[1] = ENTRIES
+                self._header[0] = MAGIC
+
+    @classmethod
+    def open(cls, port=50000):
+        """Return the registry for this manager port, mapped once by process."""
+        path = cfg_mgr.app_root_path(f'tmp/sl_registry_{port}.idx')
+        registry = cls._registries.get(path)
+        if registry is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            registry = cls(path)
+            cls._registries[path] = registry
+        return registry
+
+    @contextmanager
+    def _locked(self):
+        if os.name == 'nt':
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _find(self, name):
+        matches = np.flatnonzero(self._entries['name'] == name.encode())
+        return int(matches[0]) if len(matches) else None
+
+    def _is_stale(self, index):
+        entry = self._entries[index]
+        pid_time = _process_time(int(entry['pid']))
+        # owner gone, or PID reused by a process started after the entry
+        return pid_time is None or pid_time > float(entry['pid_time']) + 1
+
+    def _release(self, index):
+        """Unlink the block of an entry and free the entry (lock held)."""
+        name = self._entries[index]['name'].decode()
+        ring = FrameRegistry._owned.pop(name, None)
+        try:
+            if ring is not None:
+                ring.close()
+            else:
+                shm = SharedMemory(name=name)
+                shm.close()
+                shm.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as er:
+            frameregistry_logger.error(f"Error releasing shared list '{name}': {er}")
+        self._entries[index] = np.zeros((), dtype=ENTRY_DTYPE)
+
+    def reclaim_stale(self):
+        """Remove entries (and shared memory) whose owner process does not exist anymore."""
+        reclaimed = []
+        with self._locked():
+            for index in np.flatnonzero(self._entries['name'] != b''):
+                if self._is_stale(index):
+                    reclaimed.append(self._entries[index]['name'].decode())
+                    self._release(index)
+        if reclaimed:
+            frameregistry_logger.warning(f'Reclaimed stale shared lists : {reclaimed}')
+        return reclaimed
+
+    def create(self, name, width, height, channels=3, dtype=np.uint8, start_time=0.0):
+        """Create a shared frame ring.
+
+        Returns:
+            str: 'success', 'exists' (same name, same shape and dtype) or 'error'.
+        """
+        dtype = np.dtype(dtype)
+        if len(name.encode()) > 64:
+            frameregistry_logger.error(f"Shared list name too long : '{name}'")
+            return 'error'
+
+        with self._locked():
+            index = self._find(name)
+            if index is not None:
+                entry = self._entries[index]
+                if self._is_stale(index):
+                    frameregistry_logger.warning(f"Shared list '{name}' from a dead process, reclaim it.")
+                    self._release(index)
+                elif ((int(entry['width']), int(entry['height']), int(entry['channels']), entry['dtype'].decode())
+                      == (width, height, channels, dtype.str)):
+                    frameregistry_logger.warning(f"Shared list '{name}' already exists, nothing to do.")
+                    return 'exists'
+                else:
+                    frameregistry_logger.error(f"Shared list '{name}' already exists with another shape or dtype.")
+                    return 'error'
+
+            free = np.flatnonzero(self._entries['name'] == b'')
+            if not len(free):
+                frameregistry_logger.error('No more free entry into the shared list registry')
+                return 'error'
+
+            try:
+                ring = SharedFrameRing.create(name, width, height, channels, dtype, start_time=start_time)
+            except FileExistsError:
+                # block not in registry (e.g. index file removed), replace it
+                stale = SharedMemory(name=name)
+                stale.close()
+                stale.unlink()
+                ring = SharedFrameRing.create(name, width, height, channels, dtype, start_time=start_time)
+            except Exception as er:
+                frameregistry_logger.error(f"Error creating shared list '{name}': {er}")
+                return 'error'
+
+            FrameRegistry._owned[name] = ring
+            pid = os.getpid()
+            self._entries[int(free[0])] = (name.encode(), width, height, channels, pid, dtype.str.encode(),
+                                           _process_time(pid) or 0.0, time.time())
+
+        frameregistry_logger.info(f"Created shared list '{name}'  for : {width} - {height} of size {ring.shm.size}.")
+        return 'success'
+
+    def attach(self, name, width=None, height=None, channels=None, dtype=None):
+        """Attach to a shared frame ring, check shape / dtype if given.
+
+        Raises:
+            FileNotFoundError: name not registered.
+            ValueError: shape or dtype mismatch.
+        """
+        info = self.get_info(name)
+        if info is None:
+            raise FileNotFoundError(f"Shared list '{name}' does not exist")
+        ring = SharedFrameRing.attach(name)
+        expected = (height or ring.height, width or ring.width, channels or ring.channels)
+        if ring.shape != expected or (dtype is not None and ring.dtype != np.dtype(dtype)):
+            ring.close()
+            raise ValueError(f"Shared list '{name}' is {ring.shape} {ring.dtype}, not {expected} {dtype}")
+        return ring
+
+    def get_info(self, name):
+        """Return {'w', 'h'} of a shared list, None if not registered."""
+        index = self._find(name)
+        if index is None:
+            return None
+        entry = self._entries[index]
+        return {"w": int(entry['width']), "h": int(entry['height'])}
+
+    def names(self):
+        """Return the list of registered shared list names."""
+        return [name.decode() for name in self._entries['name'] if name]
+
+    def infos(self):
+        """Return {name: {'w', 'h'}} for all registered shared lists."""
+        return {entry['name'].decode(): {"w": int(entry['width']), "h": int(entry['height'])}
+                for entry in self._entries if entry['name']}
+
+    def owned(self):
+        """Return names of the shared lists created by this process."""
+        return [name for name in self.names() if name in FrameRegistry._owned]
+
+    def delete(self, name):
+        """Delete a shared list and free its shared memory."""
+        with self._locked():
+            index = self._find(name)
+            if index is None:
+                frameregistry_logger.warning(f"Shared list '{name}' does not exist.")
+                return False
+            self._release(index)
+        frameregistry_logger.info(f"Deleted shared list '{name}'.")
+        return True
@@ -0,0 +1,264 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `SharedFrameRing` class, the shared memory transport used by the 'SharedList' input of
+Desktop casts. External producers (Coldtype scripts, text animator, mobile camera ...) write frames into the ring
+with `CV2Utils.update_sl_with_frame`, and the cast thread reads them.
+
+It replaces the previous `ShareableList([frame_bytes, timestamp])` transport, which needed several copies per frame
+(`tobytes()`, `bytearray`, one appended byte to work around https://github.com/python/cpython/issues/106939, then the
+reverse operation and `np.frombuffer` on the reader side).
+
+Memory layout (one `SharedMemory` block):
+
+    +----------------------------------------------------------------------------+
+    | header (128 bytes): magic, version, slots, height, width, channels, dtype, |
+    |                     last published sequence number, doorbell port          |
+    +----------------------------------------------------------------------------+
+    | slot 0 header (64 bytes): slot sequence (seqlock), timestamp               |
+    | slot 0 frame  (height * width * channels * itemsize, 64 bytes aligned)     |
+    +----------------------------------------------------------------------------+
+    | slot 1 ...                                                                 |
+    +----------------------------------------------------------------------------+
+
+Key Architectural Components:
+
+1.  SharedFrameRing Class:
+    -   **`create` / `attach`**: The block is created once (by the SL manager) with the frame shape and dtype written
+        into the header; readers and writers attach by name and get shape / dtype from the header.
+    -   **`write`**: (single producer) copies the frame into the next slot. The slot sequence is odd while the copy
+        is in progress and set to `2 * seq` once done (seqlock), then the header sequence is published.
+    -   **`read`**: returns a numpy view on the latest slot, without any copy, with its sequence number and timestamp.
+    -   **`is_valid`**: tells if the slot read for a sequence number has not been overwritten since; with N slots
+        the producer needs to publish N - 1 frames while the consumer is working before this can happen.
+    -   **Doorbell**: the consumer can call `enable_doorbell()`: a UDP socket is bound on the loopback and its port
+        is stored into the header. After each publish, the producer sends one byte to this port, and the consumer
+        blocks in `wait()` (select) until a frame newer than the last one it has seen is available.
+        No polling, no fixed sleep, and this works the same way on all platforms and between any processes.
+        Without doorbell, `wait()` falls back to short sleeps.
+
+2.  Doorbell Class:
+    -   The loopback UDP notification used above, also used by the preview channel (see previewchannel.py).
+
+Design Philosophy:
+-   **Numpy views everywhere**: header fields, slot sequences and frames are numpy views on the shared buffer,
+    no struct packing and no intermediate bytes objects in the real-time path.
+"""
+
+import select
+import socket
+import time
+
+import numpy as np
+
+from multiprocessing.shared_memory import SharedMemory
+
+MAGIC = 0x52535657  # 'WVSR'
+VERSION = 1
+HEADER_SIZE = 128
+SLOT_HEADER_SIZE = 64
+
+# header fields, all 8 bytes
+H_MAGIC, H_VERSION, H_SLOTS, H_HEIGHT, H_WIDTH, H_CHANNELS, H_DTYPE, H_SEQ, H_DOORBELL = range(9)
+H_FIELDS = HEADER_SIZE // 8
+
+
+def _align(size, to=64):
+    return (size + to - 1) // to * to
+
+
+class Doorbell:
+    """Wake up a consumer blocked in another process, one UDP byte on the loopback per notification."""
+
+    def __init__(self):
+        self._out = None
+        self._in = None
+
+    def bind(self) -> int:
+        """Consumer side: bind the receiving socket, return its port (to be published to the producer)."""
+        if self._in is None:
+            self._in = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._in.bind(('127.0.0.1', 0))
+            self._in.setblocking(False)
+        return self._in.getsockname()[1]
+
+    @property
+    def bound(self) -> bool:
+        return self._in is not None
+
+    def ring(self, port):
+        """Producer side: notify the consumer listening on port, if any."""
+        if port == 0:
+            return
+        try:
+            if self._out is None:
+                self._out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._out.setblocking(False)
+            self._out.sendto(b'\x01', ('127.0.0.1', port))
+        except OSError:
+            # consumer gone or socket buffer full: it will see the sequence anyway
+            pass
+
+    def wait(self, timeout) -> bool:
+        """Consumer side: block up to timeout seconds for a notification (all pending ones are consumed)."""
+        if self._in is None:
+            time.sleep(min(timeout, 0.005))
+            return False
+        readable, _, _ = select.select([self._in], [], [], timeout)
+        if readable:
+            try:
+                while True:
+                    self._in.recv(64)
+            except OSError:
+                pass
+        return bool(readable)
+
+    def close(self):
+        for sock in (self._in, self._out):
+            if sock is not None:
+                sock.close()
+        self._in = self._out = None
+
+
+class SharedFrameRing:
+    """N slots frame ring in shared memory, single producer / multiple consumers."""
+
+    def __init__(self, shm: SharedMemory, owner: bool = False):
+        self.shm = shm
+        self.name = shm.name
+        self.owner = owner
+
+        buf = shm.buf
+        # header as uint64 fields
+        self._header = np.ndarray((H_FIELDS,), dtype=np.uint64, buffer=buf, offset=0)
+        if int(self._header[H_MAGIC]) != MAGIC:
+            raise ValueError(f'{shm.name} is not a frame ring')
+
+        self.slots = int(self._header[H_SLOTS])
+        self.height = int(self._header[H_HEIGHT])
+        self.width = int(self._header[H_WIDTH])
+        self.channels = int(self._header[H_CHANNELS])
+        self.dtype = np.dtype(int(self._header[H_DTYPE]).to_bytes(8, 'little').rstrip(b'\0').decode())
+        self.shape = (self.height, self.width, self.channels)
+
+        frame_size = self.height * self.width * self.channels * self.dtype.itemsize
+        self.stride = SLOT_HEADER_SIZE + _align(frame_size)
+
+        self._slot_seq = np.ndarray((self.slots,), dtype=np.uint64, buffer=buf,
+                                    offset=HEADER_SIZE, strides=(self.stride,))
+        self._slot_time = np.ndarray((self.slots,), dtype=np.float64, buffer=buf,
+                                     offset=HEADER_SIZE + 8, strides=(self.stride,))
+        item = self.dtype.itemsize
+        self._frames = np.ndarray((self.slots, self.height, self.width, self.channels), dtype=self.dtype, buffer=buf,
+                                  offset=HEADER_SIZE + SLOT_HEADER_SIZE,
+                                  strides=(self.stride, self.width * self.channels * item, self.channels * item, item))
+
+        self._doorbell = Doorbell()
+
+    @staticmethod
+    def size_for(width, height, channels=3, dtype=np.uint8, slots=3):
+        """Bytes needed for a ring."""
+        frame_size = height * width * channels * np.dtype(dtype).itemsize
+        return HEADER_SIZE + slots * (SLOT_HEADER_SIZE + _align(frame_size))
+
+    @classmethod
+    def create(cls, name, width, height, channels=3, dtype=np.uint8, slots=3, start_time=0.0):
+        """Create a new ring, frames are initialized to grey (111) like the previous SL."""
+        dtype = np.dtype(dtype)
+        shm = SharedMemory(name=name, create=True, size=cls.size_for(width, height, channels, dtype, slots))
+        header = np.ndarray((H_FIELDS,), dtype=np.uint64, buffer=shm.buf, offset=0)
+        header[:] = 0
+        header[H_MAGIC] = MAGIC
+        header[H_VERSION] = VERSION
+        header[H_SLOTS] = slots
+        header[H_HEIGHT] = height
+        header[H_WIDTH] = width
+        header[H_CHANNELS] = channels
+        header[H_DTYPE] = int.from_bytes(dtype.str.encode().ljust(8, b'\0'), 'little')
+        del header
+
+        ring = cls(shm, owner=True)
+        ring._frames[:] = 111
+        ring._slot_seq[:] = 0
+        ring._slot_time[:] = start_time
+        return ring
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to an existing ring."""
+        return cls(SharedMemory(name=name))
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last published frame, 0 if none."""
+        return int(self._header[H_SEQ])
+
+    @property
+    def timestamp(self) -> float:
+        """Timestamp (time.time()) of the last published frame."""
+        return float(self._slot_time[self.seq % self.slots])
+
+    def write(self, frame, timestamp=None):
+        """Copy frame into the next slot and publish it (single producer)."""
+        if frame.shape != self.shape:
+            raise ValueError(f'frame shape {frame.shape} does not match ring shape {self.shape}')
+        seq = self.seq + 1
+        slot = seq % self.slots
+        self._slot_seq[slot] = 2 * seq - 1  # odd: write in progress
+        np.copyto(self._frames[slot], frame, casting='unsafe')
+        self._slot_time[slot] = time.time() if timestamp is None else timestamp
+        self._slot_seq[slot] = 2 * seq  # even: slot consistent for seq
+        self._header[H_SEQ] = seq
+        self._ring_doorbell()
+
+    def _ring_doorbell(self):
+        self._doorbell.ring(int(self._header[H_DOORBELL]))
+
+    def enable_doorbell(self):
+        """Consumer side: be notified by the producer on each new frame."""
+        self._header[H_DOORBELL] = self._doorbell.bind()
+
+    def wait(self, last_seq, timeout) -> bool:
+        """Wait up to timeout seconds for a frame with a sequence number other than last_seq."""
+        end = time.perf_counter() + timeout
+        while self.seq == last_seq:
+            remaining = end - time.perf_counter()
+            if remaining <= 0:
+                return False
+            self._doorbell.wait(remaining)
+        return True
+
+    def read(self):
+        """Return (view, seq, timestamp) of the latest frame, (None, 0, 0.0) if nothing published yet.
+
+        The view is on the shared memory, use is_valid(seq) once done to know if it has been overwritten.
+        """
+        for _ in range(self.slots):
+            seq = self.seq
+            if seq == 0:
+                return None, 0, 0.0
+            slot = seq % self.slots
+            if int(self._slot_seq[slot]) == 2 * seq:
+                return self._frames[slot], seq, float(self._slot_time[slot])
+        return None, 0, 0.0
+
+    def is_valid(self, seq) -> bool:
+        """True if the frame of sequence seq is still in its slot."""
+        return int(self._slot_seq[seq % self.slots]) == 2 * seq
+
+    def close(self):
+        """Release the numpy views and close the shared memory (unlink if owner)."""
+        if self._doorbell.bound:
+            self._header[H_DOORBELL] = 0
+        self._doorbell.close()
+        self._header = self._slot_seq = self._slot_time = self._frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # a frame view is still referenced somewhere, memory is released with it
+            pass
+        if self.owner:
+            self.shm.unlink()
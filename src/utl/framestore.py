@@ -0,0 +1,450 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `FrameStore` class, the container behind `frame_buffer` of Desktop and Media casts
+(`put_to_buffer`, 'shot' action). It replaces the Python list of numpy arrays: every frame was a separate allocation,
+kept alive until the next cast, and only `frame_max` limited the memory used by a long capture.
+
+Frames are copied into one contiguous uint8 array of (capacity, height, width, channels), allocated with the first
+frame. Capacity is `frame_max`, reduced to fit into the `buffer_max_mb` byte budget of the [app] config section.
+Frames with another size (e.g. a snapshot during a multicast cast) are resized to the store size.
+
+Key Architectural Components:
+
+1.  FrameStore Class:
+    -   **List like access**: `len()`, `store[i]` (negative index too), iteration and `append`, so the API, the GUI
+        and `CV2Utils.save_image` use it as before. `store[0]` is always the oldest kept frame, access is O(1).
+    -   **Returned frames are views** on the store: read-only, and replaced if the ring overwrites their slot.
+    -   **Eviction policies** (`buffer_policy` in config), applied when the store is full:
+        -   `keep`: new frames are ignored (same result as `frame_max` before).
+        -   `ring`: the oldest frame is overwritten, the store holds the last frames of the cast.
+        -   `decimate`: every second frame is dropped and only one frame out of two is then accepted,
+            the store covers the whole cast with a lower time resolution.
+    -   **`append(frame, force=True)`**: used by the 'shot' action, a snapshot always finds a slot (oldest dropped).
+    -   **`renew`**: Store to use for a new cast, a `FrameArchive` if `buffer_archive` is enabled.
+
+2.  FrameArchive Class (`buffer_archive = True`):
+    -   Same store, but the frame array is a memory-mapped file (tmp/archive/<cast>_<date>.wvsa), so a capture can
+        last minutes at LED resolution: capacity comes from the `archive_max_mb` disk budget, not from `frame_max`.
+    -   **File layout**: one header record (ARCHIVE_DTYPE: shape, capacity, start, count, fps), then the frames.
+        The header is updated on each frame, the file can be reopened after a crash.
+    -   **Growing file**: the file is extended (and mapped again) by ARCHIVE_GROW_MB chunks as frames arrive, up to
+        the `archive_max_mb` budget, so a short cast does not reserve the whole budget on disk.
+    -   **Hot window**: the last `archive_hot_frames` frames are also kept in RAM for the API / GUI reads, older
+        ones are read from the mapping, the OS only keeps the touched pages in memory.
+    -   **`open`**: Maps an existing archive read-only, to replay it (API `buffer/archive/{file_name}`).
+    -   Only the `archive_keep` last archive files are kept on disk, archives still used by a cast are never removed.
+
+3.  LoopCache Class (Media casts with `repeat`):
+    -   Records the processed frames of the first pass (decoded, resized, filtered), within `loop_cache_mb`.
+    -   Next passes read the frames back through a cv2.VideoCapture like API (`read`, `get`, `set`), so the cast
+        loop (repeat, sync, skip frames) works as with the media file, without decoding nor processing.
+    -   Disabled if the pass has gaps (adaptive rate, skip, sync), does not fit in the budget, or if the filter
+        settings change during the pass; a change during replay brings the cast back to the media file.
+"""
+
+import glob
+import os
+import threading
+import time
+import weakref
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.framestore')
+framestore_logger = logger_manager.logger
+
+POLICIES = ('keep', 'ring', 'decimate')
+
+ARCHIVE_MAGIC = 0x41535657  # 'WVSA'
+ARCHIVE_DTYPE = np.dtype([
+    ('magic', '<u4'),
+    ('height', '<u4'),
+    ('width', '<u4'),
+    ('channels', '<u4'),
+    ('capacity', '<u8'),
+    ('start', '<u8'),
+    ('count', '<u8'),
+    ('fps', '<f8'),
+    ('created', '<f8')
+])
+ARCHIVE_HEADER_SIZE = 64
+ARCHIVE_GROW_MB = 64  # archive file is extended by chunks of this size
+
+
+class FrameStore:
+    """Bounded frame buffer backed by one preallocated contiguous uint8 array."""
+
+    def __init__(self, capacity=8, max_bytes=None, policy=None):
+        app_config = cfg_mgr.app_config or {}
+        self.max_bytes = max_bytes if max_bytes is not None else \
+            int(float(app_config.get('buffer_max_mb', 256)) * 1024 * 1024)
+        self.policy = policy or app_config.get('buffer_policy', 'keep')
+        if self.policy not in POLICIES:
+            framestore_logger.warning(f'Unknown buffer_policy {self.policy}, use keep')
+            self.policy = 'keep'
+        self.requested = max(int(capacity), 1)
+        self.capacity = 0
+        self.shape = None
+        self.frames = None  # (capacity, h, w, c) uint8, allocated with the first frame
+        self.start = 0  # slot of the oldest frame
+        self.count = 0
+        self.stride = 1  # decimate: accept one frame out of stride
+        self.offered = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def _allocate(self, shape):
+        frame_bytes = int(np.prod(shape))
+        fit = self.max_bytes // frame_bytes if frame_bytes else 0
+        self.capacity = max(1, min(self.requested, fit))
+        if self.capacity < self.requested:
+            framestore_logger.warning(f'Frame buffer limited to {self.capacity} frames of {shape} '
+                                      f'by buffer_max_mb ({self.max_bytes // 1048576} MB)')
+        self.shape = shape
+        self.frames = np.empty((self.capacity, *shape), dtype=np.uint8)
+
+    def _slot(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('frame buffer index out of range')
+        return (self.start + index) % self.capacity
+
+    def append(self, frame, force=False):
+        """Copy a frame into the store, return False if ignored by the eviction policy."""
+        with self.lock:
+            self.offered += 1
+            if self.frames is None:
+                self._allocate(frame.shape if frame.ndim == 3 else (*frame.shape, 3))
+
+            # decimate: frames 0, stride, 2 * stride ... are accepted, aligned with the kept ones
+            if self.policy == 'decimate' and not force and (self.offered - 1) % self.stride:
+                return False
+
+            if (self.policy == 'decimate' and not force and self.capacity > 1
+                    and self.count >= self.capacity - self.capacity % 2):
+                # even number of slots used, so the kept frames stay aligned on the new stride;
+                # the frame that triggered the decimation is stored after it
+                self._decimate()
+
+            if self.count == self.capacity:
+                if self.policy == 'keep' and not force:
+                    self.dropped += 1
+                    return False
+                # ring (or forced / single slot): drop the oldest
+                self.start = (self.start + 1) % self.capacity
+                self.count -= 1
+                self.dropped += 1
+
+            if frame.shape != self.shape:
+                frame = cv2.resize(frame, (self.shape[1], self.shape[0]))
+                if frame.ndim == 2:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+            slot = (self.start + self.count) % self.capacity
+            np.copyto(self.frames[slot], frame[..., :self.shape[2]], casting='unsafe')
+            self.count += 1
+            return True
+
+    def _decimate(self):
+        """Keep one frame out of two, in place, and halve the rate of accepted frames (lock held)."""
+        kept = [self._slot(i) for i in range(0, self.count, 2)]
+        for target, slot in enumerate(kept):
+            target_slot = (self.start + target) % self.capacity
+            if target_slot != slot:
+                self.frames[target_slot] = self.frames[slot]
+        self.dropped += self.count - len(kept)
+        self.count = len(kept)
+        self.stride *= 2
+
+    def set_capacity(self, capacity):
+        """Change the number of frames to keep (e.g. frame_max updated), newest frames are preserved."""
+        capacity = max(int(capacity), 1)
+        with self.lock:
+            if capacity == self.requested:
+                return
+            self.requested = capacity
+            if self.frames is None:
+                return
+            kept = [self.frames[self._slot(i)].copy() for i in range(max(0, self.count - capacity), self.count)]
+            self._allocate(self.shape)
+            for i, frame in enumerate(kept[-self.capacity:]):
+                self.frames[i] = frame
+            self.start = 0
+            self.count = min(len(kept), self.capacity)
+
+    @staticmethod
+    def renew(store, capacity, name, fps=0.0):
+        """Return the store for a new cast named name: an archive if enabled, else store with new capacity."""
+        app_config = cfg_mgr.app_config or {}
+        if str(app_config.get('buffer_archive', 'False')).lower() in ('true', '1', 'yes', 'on'):
+            # a previous archive may still be used by another cast, its mapping is released with its last reference
+            return FrameArchive(name, fps=fps)
+        if isinstance(store, FrameArchive) or store is None:
+            return FrameStore(capacity)
+        store.set_capacity(capacity)
+        return store
+
+    def clear(self):
+        """Remove all frames and release the memory."""
+        with self.lock:
+            self.frames = None
+            self.shape = None
+            self.start = self.count = self.offered = self.dropped = 0
+            self.stride = 1
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        with self.lock:
+            view = self.frames[self._slot(index)].view()
+        view.flags.writeable = False
+        return view
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __bool__(self):
+        return self.count > 0
+
+    def get_stats(self):
+        """Store status, for info / API."""
+        return {'frames': self.count,
+                'capacity': self.capacity or self.requested,
+                'shape': self.shape,
+                'bytes': self.frames.nbytes if self.frames is not None else 0,
+                'policy': self.policy,
+                'dropped': self.dropped}
+
+
+class FrameArchive(FrameStore):
+    """Frame store backed by a memory-mapped file, with a small in-RAM window of the last frames."""
+
+    _writing = weakref.WeakSet()  # archives mapped for writing, not removed by _purge
+
+    def __init__(self, name=None, path=None, fps=0.0):
+        app_config = cfg_mgr.app_config or {}
+        max_bytes = int(float(app_config.get('archive_max_mb', 2048)) * 1024 * 1024)
+        # with a disk budget, the oldest frames are overwritten by default
+        super().__init__(capacity=2 ** 31, max_bytes=max_bytes, policy='ring')
+        self.hot_frames = int(app_config.get('archive_hot_frames', 16))
+        self.fps = fps
+        self.read_only = False
+        self._hot = OrderedDict()  # slot -> frame copy
+        self._header = None
+        self._keep = int(app_config.get('archive_keep', 5))
+        self._mapped = 0  # frames mapped (file size), grows up to capacity
+        if path is None:
+            # file is only created with the first frame
+            path = os.path.join(cfg_mgr.app_root_path('tmp/archive'),
+                                f"{name or 'cast'}_{time.strftime('%Y%m%d-%H%M%S')}.wvsa")
+        self.path = path
+
+    @classmethod
+    def _purge(cls, folder, keep):
+        """Remove old archive files, keep the last (keep - 1) to make room for a new one."""
+        files = sorted(glob.glob(os.path.join(folder, '*.wvsa')), key=os.path.getmtime)
+        writing = {os.path.abspath(archive.path) for archive in list(cls._writing)}
+        for file in files[:max(0, len(files) - max(keep - 1, 0))]:
+            if os.path.abspath(file) in writing:
+                continue
+            try:
+                os.remove(file)
+            except OSError as er:
+                framestore_logger.warning(f'Could not remove archive {file} : {er}')
+
+    def _allocate(self, shape):
+        frame_bytes = int(np.prod(shape))
+        self.capacity = max(1, self.max_bytes // frame_bytes)
+        self.shape = shape
+        folder = os.path.dirname(self.path)
+        os.makedirs(folder, exist_ok=True)
+        self._purge(folder, self._keep)
+        with open(self.path, 'wb') as file:
+            file.truncate(ARCHIVE_HEADER_SIZE)
+        self._header = np.memmap(self.path, dtype=ARCHIVE_DTYPE, mode='r+', shape=())
+        self._header[()] = (ARCHIVE_MAGIC, shape[0], shape[1], shape[2], self.capacity, 0, 0, self.fps, time.time())
+        FrameArchive._writing.add(self)
+        self._grow()
+        framestore_logger.info(f'Frame archive {self.path} for up to {self.capacity} frames of {shape}')
+
+    def _grow(self):
+        """Extend the file by one chunk of frames (at most up to capacity) and map it again."""
+        frame_bytes = int(np.prod(self.shape))
+        chunk = max(1, int(ARCHIVE_GROW_MB * 1024 * 1024) // frame_bytes)
+        self._mapped = min(self.capacity, self._mapped + chunk)
+        if self.frames is not None:
+            self.frames.flush()
+        with open(self.path, 'r+b') as file:
+            file.truncate(ARCHIVE_HEADER_SIZE + self._mapped * frame_bytes)
+        # views given before stay on the previous mapping
+        self.frames = np.memmap(self.path, dtype=np.uint8, mode='r+', offset=ARCHIVE_HEADER_SIZE,
+                                shape=(self._mapped, *self.shape))
+
+    @classmethod
+    def open(cls, path):
+        """Map an existing archive read-only, for replay."""
+        header = np.memmap(path, dtype=ARCHIVE_DTYPE, mode='r', shape=())
+        if int(header['magic']) != ARCHIVE_MAGIC:
+            raise ValueError(f'{path} is not a frame archive')
+        archive = cls(path=path, fps=float(header['fps']))
+        archive.read_only = True
+        archive.shape = (int(header['height']), int(header['width']), int(header['channels']))
+        archive.capacity = archive.requested = int(header['capacity'])
+        archive.start, archive.count = int(header['start']), int(header['count'])
+        archive._header = header
+        # file is only as long as the frames written (growing file)
+        written = (os.path.getsize(path) - ARCHIVE_HEADER_SIZE) // int(np.prod(archive.shape))
+        archive._mapped = min(archive.capacity, written)
+        archive.count = min(archive.count, archive._mapped)
+        archive.frames = np.memmap(path, dtype=np.uint8, mode='r', offset=ARCHIVE_HEADER_SIZE,
+                                   shape=(archive._mapped, *archive.shape))
+        return archive
+
+    @staticmethod
+    def list_archives():
+        """Return archive file names of the tmp/archive folder, newest first."""
+        files = glob.glob(os.path.join(cfg_mgr.app_root_path('tmp/archive'), '*.wvsa'))
+        return [os.path.basename(file) for file in sorted(files, key=os.path.getmtime, reverse=True)]
+
+    def append(self, frame, force=False):
+        if self.read_only:
+            return False
+        with self.lock:
+            # before wrapping, slots are used in order: extend the file when the next one is not mapped yet
+            if self.frames is not None and self.count == self._mapped < self.capacity:
+                self._grow()
+        if not super().append(frame, force):
+            return False
+        with self.lock:
+            slot = (self.start + self.count - 1) % self.capacity
+            self._header['start'], self._header['count'] = self.start, self.count
+            if self.hot_frames > 0:
+                self._hot[slot] = np.array(self.frames[slot])
+                self._hot.move_to_end(slot)
+                while len(self._hot) > self.hot_frames:
+                    self._hot.popitem(last=False)
+        return True
+
+    def _decimate(self):
+        super()._decimate()
+        self._hot.clear()
+
+    def set_capacity(self, capacity):
+        """Capacity of an archive comes from archive_max_mb."""
+
+    def __getitem__(self, index):
+        with self.lock:
+            slot = self._slot(index)
+            if (frame := self._hot.get(slot)) is None:
+                frame = self.frames[slot]
+            view = frame.view(np.ndarray)
+        view.flags.writeable = False
+        return view
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats.update({'archive': os.path.basename(self.path), 'hot_frames': len(self._hot),
+                      'read_only': self.read_only})
+        return stats
+
+    def close(self):
+        """Flush and unmap the archive file, the file stays on disk for replay."""
+        with self.lock:
+            if self.frames is not None and not self.read_only:
+                self.frames.flush()
+                self._header.flush()
+            self.frames = self._header = None
+            self._hot.clear()
+            self.count = 0
+            FrameArchive._writing.discard(self)
+
+    def clear(self):
+        self.close()
+
+
+class LoopCache(FrameStore):
+    """Processed frames of the first pass of a repeated media, replayed like a cv2.VideoCapture."""
+
+    def __init__(self, length, fps, signature):
+        app_config = cfg_mgr.app_config or {}
+        max_bytes = int(float(app_config.get('loop_cache_mb', 64)) * 1024 * 1024)
+        super().__init__(capacity=length, max_bytes=max_bytes, policy='keep')
+        self.fps = fps or 25
+        self.signature = signature
+        self.enabled = max_bytes > 0
+        self.ready = False
+        self.position = 0
+
+    def record(self, frame, number, signature):
+        """Add frame number of the first pass, the cache is disabled on a gap, a settings change or if full."""
+        if not self.enabled:
+            return False
+        if signature != self.signature or number != self.count:
+            self.disable('settings changed or frames skipped')
+        elif self.frames is None and self.requested * frame.size > self.max_bytes:
+            self.disable(f'{self.requested} frames of {frame.shape} exceed loop_cache_mb')
+        elif not self.append(frame):
+            self.disable('more frames than expected')
+        return self.enabled
+
+    def finish(self):
+        """End of the first pass, return True if all frames are cached."""
+        self.ready = self.enabled and self.count > 0
+        if self.ready:
+            framestore_logger.debug(f'Loop cache ready: {self.count} frames, {self.frames.nbytes // 1024} KB')
+        return self.ready
+
+    def disable(self, reason):
+        framestore_logger.debug(f'Loop cache disabled: {reason}')
+        self.enabled = self.ready = False
+        self.clear()
+
+    """
+    cv2.VideoCapture like API, used by CASTMedia on repeat
+    """
+
+    def isOpened(self):
+        return self.ready
+
+    def read(self):
+        if not self.ready or self.position >= self.count:
+            return False, None
+        frame = self[self.position]
+        self.position += 1
+        return True, frame
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return self.count
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.position
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            # as cv2: timestamp of the last read frame
+            return max(self.position - 1, 0) / self.fps * 1000
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.position = int(min(max(value, 0), self.count))
+        elif prop == cv2.CAP_PROP_POS_MSEC:
+            self.position = int(min(max(value / 1000 * self.fps, 0), self.count))
+        else:
+            return False
+        return True
+
+    def release(self):
+        self.enabled = self.ready = False
+        self.clear()
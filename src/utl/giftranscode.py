@@ -0,0 +1,180 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `GifTranscoder` class, the streaming video to GIF pipeline used to create the GIF files
+uploaded to WLED (video player 'GIF' button, `CV2Utils.video_to_gif`, `Utils.video_to_gif`, `Utils.resize_gif`).
+
+GIF creation seeked the decoder once per frame (each seek decodes from the previous keyframe), kept all frames as PIL
+images in memory, then let Pillow quantize each one and write the file at the end: memory grew with the clip length
+and a few seconds of video took much longer to convert than to play.
+
+Key Architectural Components:
+
+1.  GifTranscoder Class:
+    -   **Bounded pipeline**: a decoder thread reads the clip sequentially (one seek to the start frame, by the
+        keyframe index when available, see keyindex.py) and resizes the frames; a queue of `gif_queue` frames feeds
+        the encoder, memory stays flat whatever the clip length.
+    -   **Palette per source**: one palette (median cut on `gif_palette_samples` frames spread over the clip) is
+        computed per source (path, size, mtime) / range / colors and cached; frames are mapped to it with a 32K
+        entries lookup table (numpy indexing) instead of a quantization per frame.
+    -   **Streaming encoder**: palettized frames go to the PyAV GIF encoder, packets are written to the file as
+        produced; the encoder only stores what changed from the previous frame.
+    -   **Upload**: WLED needs the file size before accepting an upload (free space check, no chunked request
+        body), so `Utils.wled_upload_file` sends the file once closed, streamed from disk.
+"""
+
+import contextlib
+import os
+import queue
+import threading
+import time
+
+from collections import OrderedDict
+
+import av
+import cv2
+import numpy as np
+
+from PIL import Image
+
+from src.utl.keyindex import IndexedCapture
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.giftranscode')
+giftranscode_logger = logger_manager.logger
+
+PALETTE_CACHE = 32  # palettes kept in memory
+
+
+class GifTranscoder:
+    """Video / GIF to GIF, decoded, resized and palettized in a bounded pipeline."""
+
+    _palettes = OrderedDict()  # (source, range, size, colors) -> (palette BGR, lookup table)
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _open(source):
+        media = IndexedCapture.open(source) or cv2.VideoCapture(source)
+        if not media.isOpened():
+            raise ValueError(f'Unable to open media {source}')
+        return media
+
+    @staticmethod
+    def _lookup_table(palette):
+        """Palette index of each 5 bits per channel BGR color."""
+        levels = np.arange(32, dtype=np.float32) * 8 + 4
+        grid = np.stack(np.meshgrid(levels, levels, levels, indexing='ij'), axis=-1).reshape(-1, 3)
+        colors = palette.astype(np.float32)
+        # nearest palette color: |grid|^2 - 2 grid.colors + |colors|^2, |grid|^2 is the same for all colors
+        distance = (colors ** 2).sum(axis=1)[None, :] - 2 * grid @ colors.T
+        return distance.argmin(axis=1).astype(np.uint8)
+
+    @classmethod
+    def palette(cls, media, source, start, end, size, colors):
+        """Palette (BGR) and lookup table of the clip, from the cache or computed on sampled frames."""
+        stat = os.stat(source) if os.path.isfile(str(source)) else None
+        key = (str(source), stat and (stat.st_size, stat.st_mtime_ns), start, end, size, colors)
+        with cls._lock:
+            if key in cls._palettes:
+                cls._palettes.move_to_end(key)
+                return cls._palettes[key]
+
+        # frames evenly spread over the clip, in increasing order: seeks by the keyframe index decode forward
+        samples = max(1, int(cfg_mgr.app_config.get('gif_palette_samples', 16)))
+        positions = np.unique(np.linspace(start, end - 1, min(samples, end - start)).astype(int)).tolist()
+
+        frames = []
+        for position in positions:
+            media.set(cv2.CAP_PROP_POS_FRAMES, position)
+            success, frame = media.read()
+            if success:
+                frames.append(cv2.resize(frame, size, interpolation=cv2.INTER_AREA))
+        if not frames:
+            raise ValueError(f'No frame to compute the palette of {source}')
+
+        montage = Image.fromarray(cv2.cvtColor(np.vstack(frames), cv2.COLOR_BGR2RGB))
+        rgb = montage.quantize(colors=colors, method=Image.Quantize.MEDIANCUT).getpalette()[:colors * 3]
+        palette = np.array(rgb, dtype=np.uint8).reshape(-1, 3)[:, ::-1]
+        result = (palette, cls._lookup_table(palette))
+        with cls._lock:
+            cls._palettes[key] = result
+            while len(cls._palettes) > PALETTE_CACHE:
+                cls._palettes.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _decode(media, start, end, size, frames, stop):
+        """Decoder thread: read start to end, resize, feed the bounded queue (None at the end)."""
+        try:
+            media.set(cv2.CAP_PROP_POS_FRAMES, start)
+            for _ in range(start, end):
+                success, frame = media.read()
+                if not success or stop.is_set():
+                    break
+                frames.put(cv2.resize(frame, size, interpolation=cv2.INTER_AREA))
+        except Exception as er:
+            giftranscode_logger.error(f'GIF decoder error : {er}')
+        finally:
+            frames.put(None)
+
+    @classmethod
+    def video_to_gif(cls, source, gif_path, fps=None, start_frame=0, end_frame=None, width=None, height=None,
+                     colors=256, loop=0):
+        """Create gif_path from frames start_frame to end_frame of source, return the number of frames written."""
+        begin = time.perf_counter()
+        media = cls._open(source)
+        frames = queue.Queue(maxsize=max(1, int(cfg_mgr.app_config.get('gif_queue', 16))))
+        stop = threading.Event()
+        decoder = None
+        written = 0
+        try:
+            total = int(media.get(cv2.CAP_PROP_FRAME_COUNT))
+            if total > 0:
+                start_frame = max(0, min(start_frame, total - 1))
+                end_frame = total if end_frame is None else max(start_frame + 1, min(end_frame, total))
+            elif end_frame is None:
+                raise ValueError(f'Unknown length of {source}')
+            if not (width and height):
+                width = int(media.get(cv2.CAP_PROP_FRAME_WIDTH))
+                height = int(media.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            size = (int(width), int(height))
+            fps = fps or media.get(cv2.CAP_PROP_FPS) or 10
+
+            palette, lookup = cls.palette(media, source, start_frame, end_frame, size, colors)
+            # PyAV pal8 palette: 256 rows of A, R, G, B
+            argb = np.zeros((256, 4), dtype=np.uint8)
+            argb[:, 0] = 255
+            argb[:len(palette), 1:] = palette[:, ::-1]
+
+            decoder = threading.Thread(target=cls._decode, args=(media, start_frame, end_frame, size, frames, stop),
+                                       daemon=True, name='GifDecoder')
+            decoder.start()
+
+            with av.open(str(gif_path), 'w', format='gif', options={'loop': str(loop)}) as container:
+                stream = container.add_stream('gif', rate=int(round(fps)) or 10)
+                stream.width, stream.height = size
+                stream.pix_fmt = 'pal8'
+                while (frame := frames.get()) is not None:
+                    bgr = (frame >> 3).astype(np.uint16)
+                    indexes = lookup[(bgr[..., 0] << 10) | (bgr[..., 1] << 5) | bgr[..., 2]]
+                    gif_frame = av.VideoFrame.from_ndarray((indexes, argb), format='pal8')
+                    gif_frame.pts = written
+                    container.mux(stream.encode(gif_frame))
+                    written += 1
+                container.mux(stream.encode())
+
+        finally:
+            stop.set()
+            if decoder is not None:
+                # unblock the decoder if the encoder stopped early
+                while decoder.is_alive():
+                    with contextlib.suppress(queue.Empty):
+                        frames.get_nowait()
+                    decoder.join(.01)
+            media.release()
+
+        giftranscode_logger.info(f'GIF {gif_path} : {written} frames in {time.perf_counter() - begin:.2f}s')
+        return written
@@ -0,0 +1,312 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `KeyframeIndex` class, the frame / keyframe timestamp table of a video file, and
+`IndexedCapture`, the Media cast input for video files that uses it for fast frame accurate seeks.
+
+`frame_index`, `cast_skip_frames`, sync (`sync_to_time`, all sync, master clock) and repeat seek the media with
+cv2.VideoCapture `set(CAP_PROP_POS_FRAMES / CAP_PROP_POS_MSEC)`. With long GOP files, cv2 seeks a few frames before
+the target, then decodes from the previous keyframe: hundreds of ms for each seek, a visible stall on the LEDs,
+even to jump 3 frames ahead.
+
+Key Architectural Components:
+
+1.  KeyframeIndex Class:
+    -   **Built in background**: on the first open of a file, packets of the video stream are demuxed with PyAV in
+        a thread, without decoding: timestamp of every frame (presentation order) and the frames that are
+        keyframes. This cast is decoded by cv2, it does not wait for the whole file to be read.
+    -   **Disk cache**: saved in tmp/keyindex/, one file per media path, valid while size and mtime do not change:
+        next casts of the same file use it at once.
+    -   **`frame_at`** (media ms to frame number) and **`keyframe_before`** (last keyframe at or before a frame).
+
+2.  IndexedCapture Class:
+    -   Decodes with PyAV (threaded decoder), cv2.VideoCapture like API (`read`, `get`, `set`, `release`), so the
+        cast loop (repeat, sync, skip frames, loop cache, master clock) works unchanged.
+    -   **Seek**: if no keyframe stands between the current position and the target, frames are decoded forward
+        (not converted) up to the target, no seek at all. Else the container jumps to the keyframe at or before
+        the target and decodes forward only from there.
+    -   Frame numbers come from the index, `CAP_PROP_POS_MSEC` / `CAP_PROP_POS_FRAMES` are exact.
+    -   Rotation metadata of the stream (display matrix) is applied to the frames, as cv2 does.
+    -   Used for local video files (VIDEO_EXT) if `keyframe_index` is enabled and the index is ready; images, GIFs,
+        streams, cameras and files PyAV can not index are still read by cv2.VideoCapture.
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+from fractions import Fraction
+
+import av
+import cv2
+import numpy as np
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.keyindex')
+keyindex_logger = logger_manager.logger
+
+INDEX_FOLDER = 'tmp/keyindex'
+VIDEO_EXT = ('.mp4', '.m4v', '.mov', '.mkv', '.webm', '.avi', '.mpg', '.mpeg', '.ts', '.flv', '.wmv')
+# frame rotation (counterclockwise degrees) -> cv2.rotate code to display it upright
+ROTATIONS = {-90: cv2.ROTATE_90_CLOCKWISE, 270: cv2.ROTATE_90_CLOCKWISE,
+             90: cv2.ROTATE_90_COUNTERCLOCKWISE, -270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+             180: cv2.ROTATE_180, -180: cv2.ROTATE_180}
+
+
+class KeyframeIndex:
+    """Timestamps of all frames and keyframe positions of the video stream of a file."""
+
+    _lock = threading.Lock()
+    _building = set()  # paths indexed in background
+    _failed = set()  # (path, size, mtime) of files PyAV could not index, not tried again
+
+    def __init__(self, pts, keys, time_base):
+        self.pts = np.asarray(pts, dtype=np.int64)  # frame timestamps, presentation order
+        self.keys = np.asarray(keys, dtype=np.int64)  # frame numbers of keyframes, sorted
+        self.time_base = Fraction(time_base)
+        self.times_ms = (self.pts - self.pts[0]).astype(np.float64) * float(self.time_base) * 1000
+
+    def __len__(self):
+        return len(self.pts)
+
+    @staticmethod
+    def cache_path(path):
+        name = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return os.path.join(cfg_mgr.app_root_path(INDEX_FOLDER), f'{name}.npz')
+
+    @classmethod
+    def cached(cls, path):
+        """Index of path from the disk cache, None if not there or no more valid."""
+        stat = os.stat(path)
+        cache = cls.cache_path(path)
+        if os.path.isfile(cache):
+            try:
+                with np.load(cache) as data:
+                    if int(data['size']) == stat.st_size and int(data['mtime']) == stat.st_mtime_ns:
+                        return cls(data['pts'], data['keys'], Fraction(int(data['tb_num']), int(data['tb_den'])))
+            except Exception as er:
+                keyindex_logger.warning(f'Keyframe index cache {cache} not readable : {er}')
+        return None
+
+    @classmethod
+    def load(cls, path):
+        """Index of path, from the disk cache if still valid, else built and saved."""
+        index = cls.cached(path)
+        if index is not None:
+            return index
+
+        stat = os.stat(path)
+        cache = cls.cache_path(path)
+        index = cls.build(path)
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            tmp_path = f'{cache}.tmp'
+            with open(tmp_path, 'wb') as index_file:
+                np.savez(index_file, pts=index.pts, keys=index.keys,
+                         tb_num=index.time_base.numerator, tb_den=index.time_base.denominator,
+                         size=stat.st_size, mtime=stat.st_mtime_ns)
+            os.replace(tmp_path, cache)
+        except OSError as er:
+            keyindex_logger.warning(f'Keyframe index of {path} not saved : {er}')
+        return index
+
+    @classmethod
+    def load_background(cls, path):
+        """Build and save the index of path in a thread, once at a time per path."""
+        stat = os.stat(path)
+        version = (path, stat.st_size, stat.st_mtime_ns)
+        with cls._lock:
+            if path in cls._building or version in cls._failed:
+                return
+            cls._building.add(path)
+
+        def run():
+            try:
+                cls.load(path)
+            except Exception as er:
+                cls._failed.add(version)
+                keyindex_logger.warning(f'No keyframe index for {path}, seek by cv2 : {er}')
+            finally:
+                with cls._lock:
+                    cls._building.discard(path)
+
+        threading.Thread(target=run, daemon=True, name='KeyframeIndex').start()
+
+    @classmethod
+    def build(cls, path):
+        """Demux (no decoding) the video stream of path."""
+        start = time.perf_counter()
+        pts = []
+        key_pts = []
+        with av.open(path) as container:
+            stream = container.streams.video[0]
+            time_base = stream.time_base
+            for packet in container.demux(stream):
+                # flush packets have no timestamp
+                if packet.pts is None:
+                    continue
+                pts.append(packet.pts)
+                if packet.is_keyframe:
+                    key_pts.append(packet.pts)
+        if not pts or not key_pts:
+            raise ValueError(f'no indexable video frame in {path}')
+        pts = np.unique(pts)
+        keys = np.searchsorted(pts, np.unique(key_pts))
+        keyindex_logger.debug(f'Keyframe index of {path} : {len(pts)} frames, {len(keys)} keyframes '
+                              f'in {time.perf_counter() - start:.2f}s')
+        return cls(pts, keys, time_base)
+
+    def frame_at(self, ms):
+        """Number of the frame shown at media time ms."""
+        return int(min(max(np.searchsorted(self.times_ms, ms + 0.5, side='right') - 1, 0), len(self.pts) - 1))
+
+    def frame_of(self, pts):
+        """Number of the frame with timestamp pts."""
+        return int(min(np.searchsorted(self.pts, pts), len(self.pts) - 1))
+
+    def keyframe_before(self, number):
+        """Number of the last keyframe at or before frame number."""
+        return int(self.keys[max(np.searchsorted(self.keys, number, side='right') - 1, 0)])
+
+
+class IndexedCapture:
+    """Video file decoded with PyAV, seeks by the keyframe index, read like a cv2.VideoCapture."""
+
+    def __init__(self, path, index):
+        self.path = path
+        self.index = index
+        self.container = av.open(path)
+        self.stream = self.container.streams.video[0]
+        self.stream.thread_type = 'AUTO'
+        self.fps = float(self.stream.average_rate or self.stream.guessed_rate or 0)
+        self._frames = self.container.decode(self.stream)
+        self.position = 0  # number of the next frame to read
+        self.last_ms = 0.0  # timestamp of the last read frame
+        self.seeks = self.forwards = self.decoded = 0
+        # frame decoded while seeking forward, next one to read: the first one, to know the rotation
+        self._pending = next(self._frames)
+        self.rotate = ROTATIONS.get(int(round(getattr(self._pending, 'rotation', 0) or 0)))
+
+    @classmethod
+    def open(cls, viinput):
+        """IndexedCapture of a local video file, None if not enabled, not indexable or index not yet ready.
+
+        The index of a new file is built in background, cv2.VideoCapture is used meanwhile.
+        """
+        app_config = cfg_mgr.app_config or {}
+        if (str(app_config.get('keyframe_index', 'True')).lower() not in ('true', '1', 'yes', 'on')
+                or not str(viinput).lower().endswith(VIDEO_EXT) or not os.path.isfile(str(viinput))):
+            return None
+        try:
+            index = KeyframeIndex.cached(str(viinput))
+            if index is None:
+                KeyframeIndex.load_background(str(viinput))
+                return None
+            if len(index) < 2:
+                return None
+            return cls(str(viinput), index)
+        except Exception as er:
+            keyindex_logger.warning(f'No keyframe index for {viinput}, seek by cv2 : {er}')
+            return None
+
+    def _next(self):
+        """Next decoded frame (not converted), None at end of media."""
+        if self._pending is not None:
+            frame, self._pending = self._pending, None
+            return frame
+        try:
+            frame = next(self._frames)
+        except (StopIteration, av.error.FFmpegError):
+            return None
+        self.decoded += 1
+        return frame
+
+    def _number(self, frame):
+        return self.index.frame_of(frame.pts) if frame.pts is not None else self.position
+
+    def seek(self, number):
+        """Position to frame number: decode forward if no keyframe in between, else from the nearest keyframe."""
+        number = int(min(max(number, 0), len(self.index)))
+        if number == self.position:
+            return True
+        key = self.index.keyframe_before(number)
+        if self.position <= number and key <= self.position:
+            self.forwards += 1
+        else:
+            self.container.seek(int(self.index.pts[key]), stream=self.stream, backward=True, any_frame=False)
+            self._frames = self.container.decode(self.stream)
+            self._pending = None
+            self.position = key
+            self.seeks += 1
+        # decode, without conversion, up to the target
+        while self.position < number:
+            frame = self._next()
+            if frame is None:
+                self.position = len(self.index)
+                return False
+            frame_number = self._number(frame)
+            if frame_number >= number:
+                self._pending = frame
+                self.position = frame_number
+                break
+            self.position = frame_number + 1
+            self.last_ms = self.index.times_ms[frame_number]
+        return True
+
+    """
+    cv2.VideoCapture like API, used by CASTMedia
+    """
+
+    def isOpened(self):
+        return self.container is not None
+
+    def read(self):
+        frame = self._next()
+        if frame is None:
+            return False, None
+        frame_number = self._number(frame)
+        self.position = frame_number + 1
+        self.last_ms = self.index.times_ms[frame_number]
+        image = frame.to_ndarray(format='bgr24')
+        return True, image if self.rotate is None else cv2.rotate(image, self.rotate)
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return len(self.index)
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.position
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            # as cv2: timestamp of the last read frame
+            return self.last_ms
+        if prop in (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT):
+            # displayed size, as cv2: width and height swapped by a quarter turn
+            width, height = self.stream.codec_context.width, self.stream.codec_context.height
+            if self.rotate in (cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE):
+                width, height = height, width
+            return width if prop == cv2.CAP_PROP_FRAME_WIDTH else height
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.seek(value)
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.seek(self.index.frame_at(value))
+        return False
+
+    def release(self):
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+
+    def get_stats(self):
+        """Seek statistics, for info / API."""
+        return {'frames': len(self.index), 'keyframes': len(self.index.keys), 'seeks': self.seeks,
+                'forwards': self.forwards, 'decoded': self.decoded}
+
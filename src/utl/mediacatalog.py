@@ -0,0 +1,298 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `MediaCatalog` class, a disk cache of media probe results (`CV2Utils.get_media_info`,
+`Utils.get_video_dimensions`) and thumbnails (`VideoThumbnailExtractor`), shared by the GUI pages.
+
+Each media page, file picker preview or player cast opened the file again with cv2 to read the same properties, and
+thumbnails were decoded again on each right click, seeking once per requested time in the GUI event loop.
+
+Key Architectural Components:
+
+1.  MediaCatalog Class (class level state, one catalog per app):
+    -   **Fingerprint**: entries are keyed by path, size and mtime: a replaced or edited file gets a new entry, the
+        old one is removed.
+    -   **Disk cache**: probe results are kept in tmp/catalog/catalog.json, thumbnails as small JPEG files beside it.
+        Entries survive an app restart.
+    -   **LRU eviction**: least recently used entries (and their thumbnails) are removed when the catalog exceeds
+        `catalog_max_mb`.
+    -   **Process pool**: thumbnails are extracted by `catalog_workers` processes, out of the GUI event loop; times
+        are read in increasing order, one forward pass per file.
+    -   **`scan`**: the file picker submits the media of the displayed folder in background, so a preview is read
+        from the catalog when asked.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.mediacatalog')
+mediacatalog_logger = logger_manager.logger
+
+CATALOG_FOLDER = 'tmp/catalog'
+CATALOG_FILE = 'catalog.json'
+IMAGE_EXT = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+MEDIA_EXT = IMAGE_EXT + ('.gif', '.avi', '.mkv', '.mp4', '.mov')
+ENTRY_BYTES = 1024  # catalog size of an entry, without its thumbnails
+
+
+def probe(media):
+    """cv2 properties of media."""
+    capture = cv2.VideoCapture(media)
+    try:
+        return {"CV_CAP_PROP_FRAME_WIDTH": capture.get(cv2.CAP_PROP_FRAME_WIDTH),
+                "CV_CAP_PROP_FRAME_HEIGHT": capture.get(cv2.CAP_PROP_FRAME_HEIGHT),
+                "CAP_PROP_FPS": capture.get(cv2.CAP_PROP_FPS),
+                "CAP_PROP_POS_MSEC": capture.get(cv2.CAP_PROP_POS_MSEC),
+                "CAP_PROP_FRAME_COUNT": capture.get(cv2.CAP_PROP_FRAME_COUNT),
+                "CAP_PROP_BRIGHTNESS": capture.get(cv2.CAP_PROP_BRIGHTNESS),
+                "CAP_PROP_CONTRAST": capture.get(cv2.CAP_PROP_CONTRAST),
+                "CAP_PROP_SATURATION": capture.get(cv2.CAP_PROP_SATURATION),
+                "CAP_PROP_HUE": capture.get(cv2.CAP_PROP_HUE),
+                "CAP_PROP_GAIN": capture.get(cv2.CAP_PROP_GAIN),
+                "CAP_PROP_CONVERT_RGB": capture.get(cv2.CAP_PROP_CONVERT_RGB)}
+    finally:
+        capture.release()
+
+
+def extract(path, times, width):
+    """Thumbnails (BGR) of path at times (s), run by the process pool. One for an image, None if not read."""
+
+    def resize(image):
+        height, img_width = image.shape[:2]
+        return cv2.resize(image, (width, int(width * height / img_width)))
+
+    if path.lower().endswith(IMAGE_EXT):
+        image = cv2.imread(path)
+        return [resize(image) if image is not None else None]
+
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        return [None for _ in times]
+    fps = capture.get(cv2.CAP_PROP_FPS) or 25
+    last_frame = max(int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) - 1, 0)
+    thumbs = {}
+    # increasing times: the decoder only moves forward
+    for time_in_seconds in sorted(set(times)):
+        capture.set(cv2.CAP_PROP_POS_FRAMES, min(int(time_in_seconds * fps), last_frame))
+        success, frame = capture.read()
+        thumbs[time_in_seconds] = resize(frame) if success else None
+    capture.release()
+    return [thumbs[time_in_seconds] for time_in_seconds in times]
+
+
+class MediaCatalog:
+    """Probe results and thumbnails of local media, cached on disk."""
+
+    _lock = threading.Lock()
+    _entries = None  # fingerprint -> entry, loaded on first use
+    _pool = None
+    _scanning = set()
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def folder():
+        return cfg_mgr.app_root_path(CATALOG_FOLDER)
+
+    @staticmethod
+    def is_local(media):
+        return media is not None and os.path.isfile(str(media))
+
+    @staticmethod
+    def fingerprint(path):
+        stat = os.stat(path)
+        return hashlib.sha1(f'{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}'.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def pool(cls):
+        with cls._lock:
+            if cls._pool is None:
+                workers = max(1, int(cfg_mgr.app_config.get('catalog_workers', 2)))
+                cls._pool = ProcessPoolExecutor(max_workers=workers)
+            return cls._pool
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            if cls._pool is not None:
+                cls._pool.shutdown(wait=False, cancel_futures=True)
+                cls._pool = None
+
+    @classmethod
+    def _load(cls):
+        """Read the catalog file (lock held)."""
+        if cls._entries is None:
+            cls._entries = {}
+            catalog = os.path.join(cls.folder(), CATALOG_FILE)
+            if os.path.isfile(catalog):
+                try:
+                    with open(catalog, encoding='utf-8') as catalog_file:
+                        cls._entries = json.load(catalog_file)
+                except (OSError, ValueError) as er:
+                    mediacatalog_logger.warning(f'Media catalog not readable, start a new one : {er}')
+
+    @classmethod
+    def _save(cls):
+        """Write the catalog file (lock held)."""
+        try:
+            os.makedirs(cls.folder(), exist_ok=True)
+            catalog = os.path.join(cls.folder(), CATALOG_FILE)
+            with open(f'{catalog}.tmp', 'w', encoding='utf-8') as catalog_file:
+                json.dump(cls._entries, catalog_file)
+            os.replace(f'{catalog}.tmp', catalog)
+        except OSError as er:
+            mediacatalog_logger.warning(f'Media catalog not saved : {er}')
+
+    @classmethod
+    def _entry(cls, path):
+        """Return key and entry of path, created if new (lock held)."""
+        cls._load()
+        key = cls.fingerprint(path)
+        entry = cls._entries.get(key)
+        if entry is None:
+            abs_path = os.path.abspath(path)
+            # file changed: previous entries of the same path are stale
+            for stale in [k for k, e in cls._entries.items() if e['path'] == abs_path]:
+                cls._remove(stale)
+            entry = cls._entries[key] = {'path': abs_path, 'info': None, 'thumbs': {}, 'bytes': 0}
+        entry['used'] = time.time()
+        return key, entry
+
+    @classmethod
+    def _remove(cls, key):
+        """Drop an entry and its thumbnail files (lock held)."""
+        entry = cls._entries.pop(key)
+        for file_name in entry['thumbs'].values():
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(cls.folder(), file_name))
+
+    @classmethod
+    def _evict(cls):
+        """Remove least recently used entries above the catalog budget (lock held)."""
+        budget = float(cfg_mgr.app_config.get('catalog_max_mb', 64)) * 1024 * 1024
+        total = sum(entry['bytes'] + ENTRY_BYTES for entry in cls._entries.values())
+        for key in sorted(cls._entries, key=lambda k: cls._entries[k]['used']):
+            if total <= budget or len(cls._entries) <= 1:
+                break
+            total -= cls._entries[key]['bytes'] + ENTRY_BYTES
+            cls._remove(key)
+
+    @classmethod
+    def info(cls, media):
+        """cv2 properties of media, probed once per local file version (failed probes are not kept)."""
+        if not cls.is_local(media):
+            return probe(media)
+        with cls._lock:
+            _, entry = cls._entry(media)
+            info = entry['info']
+        if info is not None:
+            cls.hits += 1
+            return dict(info)
+        cls.misses += 1
+        info = probe(media)
+        if info['CV_CAP_PROP_FRAME_WIDTH'] <= 0 or info['CV_CAP_PROP_FRAME_HEIGHT'] <= 0:
+            # not readable by cv2: not stored, probed again next time
+            return dict(info)
+        with cls._lock:
+            entry['info'] = info
+            cls._evict()
+            cls._save()
+        return dict(info)
+
+    @staticmethod
+    def _names(path, times, width):
+        if str(path).lower().endswith(IMAGE_EXT):
+            return [f'{width}']
+        return [f'{width}_{time_in_seconds}' for time_in_seconds in times]
+
+    @classmethod
+    def _files(cls, path, times, width):
+        """Thumbnail file names in the catalog, None if one is missing."""
+        with cls._lock:
+            _, entry = cls._entry(path)
+            files = [entry['thumbs'].get(name) for name in cls._names(path, times, width)]
+        return None if None in files else files
+
+    @classmethod
+    def _cached(cls, path, times, width):
+        """Thumbnails from the catalog, None if one is missing."""
+        files = cls._files(path, times, width)
+        if files is None:
+            return None
+        frames = [cv2.imread(os.path.join(cls.folder(), file_name)) for file_name in files]
+        return None if any(frame is None for frame in frames) else frames
+
+    @classmethod
+    def _store(cls, path, times, width, frames):
+        """Save the extracted thumbnails and add them to the entry."""
+        os.makedirs(cls.folder(), exist_ok=True)
+        with cls._lock:
+            key, entry = cls._entry(path)
+            for name, frame in zip(cls._names(path, times, width), frames):
+                if frame is None or name in entry['thumbs']:
+                    continue
+                file_name = f'{key}_{name}.jpg'
+                file_path = os.path.join(cls.folder(), file_name)
+                if cv2.imwrite(file_path, frame):
+                    entry['thumbs'][name] = file_name
+                    entry['bytes'] += os.path.getsize(file_path)
+            cls._evict()
+            cls._save()
+
+    @classmethod
+    async def thumbnails(cls, path, times, width=160):
+        """Thumbnails (BGR) of a local media at times (s), from the catalog or extracted by the process pool."""
+        path = str(path)
+        frames = cls._cached(path, times, width)
+        if frames is not None:
+            cls.hits += 1
+            return frames
+        cls.misses += 1
+        frames = await asyncio.get_running_loop().run_in_executor(cls.pool(), extract, path, list(times), width)
+        cls._store(path, times, width, frames)
+        return frames
+
+    @classmethod
+    def scan(cls, paths, times=(5,), width=160):
+        """Extract in background the thumbnails not yet in the catalog."""
+        for path in map(str, paths):
+            if not path.lower().endswith(MEDIA_EXT) or not cls.is_local(path) or path in cls._scanning:
+                continue
+            if cls._files(path, times, width) is not None:
+                continue
+            cls._scanning.add(path)
+            future = cls.pool().submit(extract, path, list(times), width)
+            future.add_done_callback(lambda done, p=path: cls._scanned(done, p, times, width))
+
+    @classmethod
+    def _scanned(cls, future, path, times, width):
+        cls._scanning.discard(path)
+        try:
+            cls._store(path, times, width, future.result())
+        except Exception as er:
+            mediacatalog_logger.debug(f'No thumbnail for {path} : {er}')
+
+    @classmethod
+    def get_stats(cls):
+        """Catalog status, for info / API."""
+        with cls._lock:
+            cls._load()
+            return {'entries': len(cls._entries),
+                    'thumbs_mb': round(sum(e['bytes'] for e in cls._entries.values()) / 1024 / 1024, 2),
+                    'scanning': len(cls._scanning),
+                    'hits': cls.hits,
+                    'misses': cls.misses}
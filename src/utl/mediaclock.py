@@ -0,0 +1,175 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `MediaClock` class, the process wide master media clock, and `ClockFollower`, used by a Media
+cast (`master_clock = True`) to show the frame matching this clock.
+
+Media casts count frames (frame number * interval), each one drifts on its own, and the video player page could only
+bring them back with `sync_to_time` seeks (VSync, TSync, auto sync every x seconds). A seek on a long GOP file
+decodes from the previous keyframe: a visible stall each time.
+
+Key Architectural Components:
+
+1.  MediaClock Class:
+    -   **Position**: media time (ms) = anchor position + elapsed monotonic time * rate, while playing.
+    -   **`report`**: The video player page reports its position, play / pause, seek and rate (browser 'timeupdate'
+        events). The clock is moved only if the report differs from the predicted position by more than
+        `clock_tolerance` ms, or if the state changed: network jitter of the reports does not move the casts.
+    -   **`start`**: Without player, the first cast following the clock starts it at its own position, the next
+        casts follow the same clock.
+
+2.  ClockFollower Class (one per cast):
+    -   Compares the timestamp of the last read frame (`CAP_PROP_POS_MSEC`) with the clock.
+    -   **`ahead`**: cast ahead of the clock by more than 1.5 frame: the last frame is shown again.
+    -   **`behind`**: number of frames to drop (read and not sent, at most `clock_max_drop` per frame) to catch up.
+    -   A seek is used only when the drift is larger than `clock_seek_ms` (player seek, new cast).
+    -   **Repeat**: positions are compared modulo the media duration, so a cast that starts its media again keeps
+        following the clock, which is never stopped nor restarted by a cast (other casts follow it too).
+"""
+
+import threading
+import time
+
+import cv2
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.mediaclock')
+mediaclock_logger = logger_manager.logger
+
+
+class MediaClock:
+    """Process wide media time, followed by casts."""
+
+    _lock = threading.Lock()
+    _anchor_ms = 0.0  # media position at anchor time
+    _anchor_ns = None  # monotonic anchor time, None: clock not started
+    rate = 1.0
+    playing = False
+    source = None
+    reports = 0
+    moves = 0
+
+    @classmethod
+    def running(cls):
+        return cls._anchor_ns is not None
+
+    @classmethod
+    def position(cls):
+        """Current media time in ms, None if the clock is not started."""
+        with cls._lock:
+            if cls._anchor_ns is None:
+                return None
+            if not cls.playing:
+                return cls._anchor_ms
+            return cls._anchor_ms + (time.perf_counter_ns() - cls._anchor_ns) / 1e6 * cls.rate
+
+    @classmethod
+    def start(cls, position_ms=0.0, source='cast'):
+        """Start the clock at position_ms if not already running, return the clock position."""
+        with cls._lock:
+            if cls._anchor_ns is None:
+                cls._set(position_ms, True, 1.0, source)
+                mediaclock_logger.debug(f'Media clock started by {source} at {position_ms:.0f} ms')
+        return cls.position()
+
+    @classmethod
+    def report(cls, position_ms, playing=True, rate=1.0, source='player'):
+        """Position reported by a player, the clock moves only if needed."""
+        tolerance = float(cfg_mgr.app_config.get('clock_tolerance', 40))
+        predicted = cls.position()
+        with cls._lock:
+            cls.reports += 1
+            if (predicted is None or playing != cls.playing or rate != cls.rate or
+                    abs(predicted - position_ms) > tolerance):
+                cls._set(position_ms, playing, rate, source)
+                cls.moves += 1
+
+    @classmethod
+    def _set(cls, position_ms, playing, rate, source):
+        cls._anchor_ms = float(position_ms)
+        cls._anchor_ns = time.perf_counter_ns()
+        cls.playing = bool(playing)
+        cls.rate = float(rate) or 1.0
+        cls.source = source
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            cls._anchor_ns = None
+            cls.playing = False
+            cls.source = None
+
+    @classmethod
+    def get_stats(cls):
+        """Clock status, for info / API."""
+        position = cls.position()
+        return {'running': cls.running(),
+                'position_ms': round(position, 1) if position is not None else None,
+                'playing': cls.playing,
+                'rate': cls.rate,
+                'source': cls.source,
+                'reports': cls.reports,
+                'moves': cls.moves}
+
+
+class ClockFollower:
+    """Frame repeats / drops of one cast to stay on the master clock."""
+
+    def __init__(self, fps, length=0):
+        """
+        Args:
+            fps (float): media frame rate.
+            length (int): media frame count, clock positions wrap on its duration (repeat). 0 if unknown.
+        """
+        app_config = cfg_mgr.app_config or {}
+        self.frame_ms = 1000 / max(fps, 1)
+        self.duration_ms = length * self.frame_ms if length > 1 else 0
+        self.max_drop = max(1, int(app_config.get('clock_max_drop', 4)))
+        self.seek_ms = float(app_config.get('clock_seek_ms', 2000))
+        self.drift_ms = 0.0
+        self.repeated = self.dropped = self.seeks = 0
+
+    def _drift(self, media):
+        """Media time of the last read frame minus clock time (ms), > 0 if the cast is ahead."""
+        clock = MediaClock.position()
+        if clock is None:
+            clock = MediaClock.start(media.get(cv2.CAP_PROP_POS_MSEC))
+        self.drift_ms = media.get(cv2.CAP_PROP_POS_MSEC) - clock
+        if self.duration_ms:
+            # shortest way around the media loop
+            half = self.duration_ms / 2
+            self.drift_ms = (self.drift_ms + half) % self.duration_ms - half
+        return self.drift_ms
+
+    def target(self):
+        """Clock position in the media (ms)."""
+        clock = MediaClock.position() or 0.0
+        return clock % self.duration_ms if self.duration_ms else clock
+
+    def ahead(self, media):
+        """True if the last frame has to be shown again."""
+        if self._drift(media) > 1.5 * self.frame_ms and self.drift_ms < self.seek_ms:
+            self.repeated += 1
+            return True
+        return False
+
+    def behind(self, media):
+        """Return the number of frames to read without sending, seek first if the drift is too large."""
+        drift = self._drift(media)
+        if abs(drift) >= self.seek_ms:
+            self.seeks += 1
+            media.set(cv2.CAP_PROP_POS_MSEC, self.target())
+            return 0
+        if drift < -1.5 * self.frame_ms:
+            drop = min(self.max_drop, int(-drift / self.frame_ms))
+            self.dropped += drop
+            return drop
+        return 0
+
+    def get_stats(self):
+        return {'drift_ms': round(self.drift_ms, 1), 'repeated': self.repeated, 'dropped': self.dropped,
+                'seeks': self.seeks, 'clock': MediaClock.get_stats()}
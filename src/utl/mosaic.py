@@ -0,0 +1,260 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `MosaicRenderer` class, which builds the 'Live Grid View' page as one server side image: all
+running cast previews (see `PreviewPublisher` in utils.py) are composed into a single mosaic, sent to the browser as
+one MJPEG stream (`/api/mosaic/mjpeg`, see api.py).
+
+Before, the grid view page refreshed one image element per cast every `grid_view_refresh_interval` (0.1 s), each
+one a base64 string pushed through the NiceGUI socket, and `CV2Utils.create_grid_from_images` re-read and resized
+`assets/Source-intro.png` twice per call and fitted the cast names with a character by character loop.
+
+Key Architectural Components:
+
+1.  MosaicRenderer Class:
+    -   **Render thread**: Runs only while the mosaic has viewers (`subscribe` / `unsubscribe`). It subscribes to the
+        preview of every running cast, so casts encode their thumbnail only while the grid is displayed.
+    -   **Dirty tiles**: The canvas is kept between two renders. Only tiles whose cast published a new thumbnail
+        (sequence number changed) are re-composited, the JPEG is encoded only if at least one tile changed.
+        The whole canvas is rebuilt only when the list of casts changes.
+    -   **Caches**: Background images (by size) and label bitmaps (by name and tile width) are created once.
+        Names are fitted to the tile width with a binary search.
+    -   **`tile_at`**: Cast name at a position of the mosaic, used by the page to open the preview of a clicked tile.
+
+Design Philosophy:
+-   **One stream**: a wall of 30 casts costs one JPEG encode per refresh and one HTTP stream, not 30 socket messages.
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.mosaic')
+mosaic_logger = logger_manager.logger
+
+LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+LABEL_SCALE = 0.3
+LABEL_THICKNESS = 1
+LABEL_HEIGHT = 16
+
+
+class MosaicRenderer:
+    """Single mosaic of all cast previews, rendered in background while watched."""
+
+    subscribers = 0
+    jpeg = None
+    seq = 0
+    _lock = threading.Lock()
+    _thread = None
+    _layout = {}  # cast name -> (x, y) of its tile
+    _tile_size = (0, 0)
+    _backgrounds = {}  # (w, h) -> RGB background
+    _labels = {}  # (name, width) -> (bitmap, mask)
+    _stats = {'renders': 0, 'tiles': 0, 'layouts': 0}
+
+    @classmethod
+    def subscribe(cls):
+        """Add one viewer, start the render thread if needed."""
+        with cls._lock:
+            cls.subscribers += 1
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._run, daemon=True, name='MosaicRenderer')
+                cls._thread.start()
+
+    @classmethod
+    def unsubscribe(cls):
+        """Remove one viewer, the render thread stops by itself without viewer."""
+        with cls._lock:
+            cls.subscribers = max(0, cls.subscribers - 1)
+
+    @classmethod
+    def get_jpeg(cls):
+        """Return (jpeg bytes, seq) of the latest mosaic, (None, 0) if none."""
+        with cls._lock:
+            return cls.jpeg, cls.seq
+
+    @classmethod
+    def tile_at(cls, x, y):
+        """Return the cast name displayed at position (x, y) of the mosaic, None if none."""
+        tile_w, tile_h = cls._tile_size
+        for name, (tile_x, tile_y) in dict(cls._layout).items():
+            if tile_x <= x < tile_x + tile_w and tile_y <= y < tile_y + tile_h:
+                return name
+        return None
+
+    @classmethod
+    def get_stats(cls):
+        """Render counters, for info / API."""
+        return {'subscribers': cls.subscribers, 'casts': len(cls._layout), **cls._stats}
+
+    @classmethod
+    def background(cls, width, height):
+        """Return the background image (RGB, read only) resized to width x height, cached."""
+        key = (width, height)
+        if (image := cls._backgrounds.get(key)) is None:
+            image = cv2.imread(cfg_mgr.app_root_path('assets/Source-intro.png'))
+            if image is None:
+                mosaic_logger.warning('Could not load background for grid, falling back to black')
+                image = np.zeros((height, width, 3), dtype=np.uint8)
+            else:
+                image = cv2.cvtColor(cv2.resize(image, key, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2RGB)
+            image.flags.writeable = False
+            if len(cls._backgrounds) > 16:
+                cls._backgrounds.clear()
+            cls._backgrounds[key] = image
+        return image
+
+    @staticmethod
+    def fit_text(text, max_width):
+        """Return text, truncated with '...' if wider than max_width pixels."""
+        def width(value):
+            return cv2.getTextSize(value, LABEL_FONT, LABEL_SCALE, LABEL_THICKNESS)[0][0]
+
+        if width(text) <= max_width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if width(f'{text[:middle]}...') <= max_width:
+                low = middle
+            else:
+                high = middle - 1
+        return f'{text[:low]}...'
+
+    @classmethod
+    def label(cls, name, width):
+        """Return (bitmap, mask) of the name label for a tile of this width, cached."""
+        key = (name, width)
+        if (cached := cls._labels.get(key)) is None:
+            text = cls.fit_text(name, width - 10)  # 5px padding on each side
+            text_w = cv2.getTextSize(text, LABEL_FONT, LABEL_SCALE, LABEL_THICKNESS)[0][0]
+            bitmap = np.zeros((LABEL_HEIGHT, width, 3), dtype=np.uint8)
+            origin = ((width - text_w) // 2, LABEL_HEIGHT - 5)
+            cv2.putText(bitmap, text, origin, LABEL_FONT, LABEL_SCALE, (1, 1, 1), LABEL_THICKNESS + 2,
+                        cv2.LINE_AA)  # outline, 1 to be part of the mask
+            cv2.putText(bitmap, text, origin, LABEL_FONT, LABEL_SCALE, (255, 255, 255), LABEL_THICKNESS,
+                        cv2.LINE_AA)
+            mask = bitmap.any(axis=2)
+            bitmap[bitmap == 1] = 0
+            if len(cls._labels) > 256:
+                cls._labels.clear()
+            cached = cls._labels[key] = (bitmap, mask)
+        return cached
+
+    @classmethod
+    def draw_tile(cls, canvas, x, y, image, tile_size, name=None):
+        """Composite one tile of tile_size (w, h), image + name label, at x, y of the canvas."""
+        tile_w, tile_h = tile_size
+        if image.shape[:2] != (tile_h, tile_w):
+            image = cv2.resize(image, (tile_w, tile_h), interpolation=cv2.INTER_AREA)
+        tile = canvas[y:y + tile_h, x:x + tile_w]
+        tile[:] = image[..., :3]
+        if name and tile_h > LABEL_HEIGHT + 5:
+            bitmap, mask = cls.label(name, tile_w)
+            strip = tile[tile_h - LABEL_HEIGHT - 5:tile_h - 5]
+            strip[mask] = bitmap[mask]
+
+    @staticmethod
+    def layout(names, tile_size, columns, gap):
+        """Return ({name: (x, y)} tile positions, (w, h) canvas size), columns <= 0 for a squarish layout."""
+        tile_w, tile_h = tile_size
+        if columns <= 0:
+            columns = int(np.ceil(np.sqrt(len(names))))
+        columns = max(1, min(columns, len(names)))
+        rows = int(np.ceil(len(names) / columns))
+        positions = {name: ((i % columns + 1) * gap + (i % columns) * tile_w,
+                            (i // columns + 1) * gap + (i // columns) * tile_h)
+                     for i, name in enumerate(names)}
+        return positions, (columns * tile_w + (columns + 1) * gap, rows * tile_h + (rows + 1) * gap)
+
+    @classmethod
+    def _publish(cls, canvas, quality):
+        ok, buffer = cv2.imencode('.jpg', cv2.cvtColor(canvas, cv2.COLOR_RGB2BGR),
+                                  [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if ok:
+            with cls._lock:
+                cls.jpeg = buffer.tobytes()
+                cls.seq += 1
+            cls._stats['renders'] += 1
+
+    @classmethod
+    def _watched(cls):
+        """Render thread: True while there are viewers, else release the thread slot (under lock)."""
+        with cls._lock:
+            if cls.subscribers > 0:
+                return True
+            cls._thread = None
+            return False
+
+    @classmethod
+    def _run(cls):
+        from src.utl.utils import CastAPI
+
+        interval = float(cfg_mgr.app_config.get('grid_view_refresh_interval', 0.1))
+        columns = int(cfg_mgr.app_config.get('grid_view_columns', 4))
+        gap = abs(int(cfg_mgr.app_config.get('grid_view_border', 2)))
+        quality = int(cfg_mgr.app_config.get('preview_quality', 70))
+        tile_size = (int(cfg_mgr.app_config.get('grid_preview_width', 240)),
+                     int(cfg_mgr.app_config.get('grid_preview_height', 135)))
+        cls._tile_size = tile_size
+
+        publishers = {}  # cast name -> subscribed PreviewPublisher
+        drawn = {}  # cast name -> seq of the thumbnail on the canvas
+        canvas = None
+        mosaic_logger.debug('Mosaic renderer started')
+
+        try:
+            while cls._watched():
+                start = time.monotonic()
+                previews = dict(CastAPI.previews)
+
+                if previews != publishers:
+                    # casts started / stopped: new layout, full redraw
+                    for name, publisher in publishers.items():
+                        if previews.get(name) is not publisher:
+                            publisher.unsubscribe()
+                    for name, publisher in previews.items():
+                        if publishers.get(name) is not publisher:
+                            publisher.subscribe()
+                    publishers = previews
+                    drawn = {}
+                    cls._stats['layouts'] += 1
+
+                    if publishers:
+                        cls._layout, size = cls.layout(sorted(publishers), tile_size, columns, gap)
+                        canvas = cls.background(*size).copy()
+                        for name, (x, y) in cls._layout.items():
+                            cls.draw_tile(canvas, x, y, cls.background(*tile_size), tile_size, name)
+                    else:
+                        cls._layout = {}
+                        canvas = cls.background(400, 225).copy()
+                    cls._publish(canvas, quality)
+
+                changed = False
+                for name, (x, y) in cls._layout.items():
+                    thumbnail, seq = publishers[name].get_thumbnail()
+                    if thumbnail is not None and drawn.get(name) != seq:
+                        cls.draw_tile(canvas, x, y, thumbnail, tile_size, name)
+                        drawn[name] = seq
+                        cls._stats['tiles'] += 1
+                        changed = True
+                if changed:
+                    cls._publish(canvas, quality)
+
+                time.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+        except Exception as er:
+            mosaic_logger.error(f'Mosaic renderer error : {er}')
+            with cls._lock:
+                cls._thread = None
+        finally:
+            for publisher in publishers.values():
+                publisher.unsubscribe()
+            mosaic_logger.debug('Mosaic renderer stopped')
@@ -0,0 +1,161 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file provides cheap content analysis helpers used by the casting threads to avoid useless work.
+Everything here works on a tiny downscaled copy of the frame (the "probe"), so the cost stays negligible compared to
+the resize / filter / send pipeline it protects.
+
+Key Architectural Components:
+
+1.  ChangeDetector Class:
+    -   **Purpose**: Tells if a frame differs from the last one that has been processed and sent to the devices.
+        Desktop casts of dashboards or static screens can then skip processing, reuse the previous device payload
+        and only send it again from time to time (keepalive) so devices do not leave realtime mode.
+    -   **`changed`**: Compares the probe of the new frame against the reference probe. The reference is only
+        updated when a change is detected, so a slow drift accumulates and is finally seen.
+        A `state` value (e.g. filter settings) can be given: any modification forces a change.
+    -   **`keepalive_due`**: True when the last payload has not been sent for `keepalive` seconds.
+
+2.  AdaptiveRate Class:
+    -   **Purpose**: Moves the effective send rate between a minimum and a maximum, according to the motion energy
+        (mean difference between two consecutive probes). Slow content uses less bandwidth and CPU, fast action
+        gets the highest rate.
+    -   **`update`**: Measures motion and returns the effective rate. Motion going up is taken immediately, motion
+        going down decays smoothly, and a hysteresis band avoids rate oscillation.
+    -   **`rate`**: Effective rate, given to the `FramePacer` when the cast owns the frame source (desktop).
+    -   **`due`**: Deadline based gating at the effective rate, when the source keeps its own timeline (media).
+
+Design Philosophy:
+-   **Max for change, mean for motion**: change detection uses the biggest difference of a probe cell, so a small
+    moving element (mouse, clock) on a large screen is not averaged away; motion energy uses the mean, so it
+    measures how much of the picture moves.
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+class ChangeDetector:
+    """Detect unchanged frames on a small downscaled probe."""
+
+    def __init__(self, probe_width: int = 64, probe_height: int = 64, threshold: float = 3, keepalive: float = 1.0):
+        """
+        Args:
+            probe_width (int): probe width, no need to go above the LED matrix resolution.
+            probe_height (int): probe height.
+            threshold (float): minimal difference (0-255) on one probe cell to consider the frame as changed.
+            keepalive (float): seconds between two sends of the same payload.
+        """
+        self.probe_size = (max(1, probe_width), max(1, probe_height))
+        self.threshold = threshold
+        self.keepalive = keepalive
+
+        # data of the last processed frame
+        self.payload = None
+        self.result = None
+
+        self._probe = None
+        self._state = None
+        self._last_send = 0.0
+
+    def changed(self, frame, state=None) -> bool:
+        """Return True if frame (or state) differs from the last processed one."""
+        probe = cv2.resize(frame, self.probe_size, interpolation=cv2.INTER_AREA)
+        if (self._probe is None
+                or self.result is None
+                or state != self._state
+                or probe.shape != self._probe.shape
+                or np.max(cv2.absdiff(probe, self._probe)) > self.threshold):
+            self._probe = probe
+            self._state = state
+            self._last_send = time.monotonic()
+            return True
+        return False
+
+    def keepalive_due(self) -> bool:
+        """Return True (and restart the delay) if the payload need to be sent again."""
+        now = time.monotonic()
+        if now - self._last_send >= self.keepalive:
+            self._last_send = now
+            return True
+        return False
+
+    def reset(self):
+        """Force next frame to be processed."""
+        self._probe = None
+        self.payload = None
+        self.result = None
+
+
+class AdaptiveRate:
+    """Content adaptive frame rate, based on motion energy measured on a small probe."""
+
+    def __init__(self, rate_min: int, rate_max: int, low: float = 1.0, high: float = 12.0,
+                 hysteresis: float = 0.25, decay: float = 0.1, probe_size: int = 32):
+        """
+        Args:
+            rate_min (int): rate (fps) used for static or slow-moving content.
+            rate_max (int): rate (fps) used for fast action.
+            low (float): motion energy (mean pixel difference 0-255) up to which rate_min is used.
+            high (float): motion energy from which rate_max is used.
+            hysteresis (float): relative change of the target rate needed to modify the effective rate.
+            decay (float): smoothing factor when motion goes down (motion up is taken immediately).
+            probe_size (int): width / height of the probe.
+        """
+        self.rate_min = max(1, min(rate_min, rate_max))
+        self.rate_max = max(1, rate_max, self.rate_min)
+        self.low = low
+        self.high = max(high, low + 1)
+        self.hysteresis = hysteresis
+        self.decay = decay
+        self.probe_size = (probe_size, probe_size)
+
+        self.rate = self.rate_max
+        self.energy = 0.0
+
+        self._probe = None
+        self._next_time = None
+
+    def update(self, frame) -> int:
+        """Measure motion between frame and the previous one, return the effective rate."""
+        probe = cv2.resize(frame, self.probe_size, interpolation=cv2.INTER_AREA)
+        if self._probe is None or probe.shape != self._probe.shape:
+            energy = self.high
+        else:
+            energy = float(cv2.absdiff(probe, self._probe).mean())
+        self._probe = probe
+
+        # fast attack, slow release: action is never delayed, rate goes down smoothly
+        if energy > self.energy:
+            self.energy = energy
+        else:
+            self.energy += self.decay * (energy - self.energy)
+
+        ratio = min(1.0, max(0.0, (self.energy - self.low) / (self.high - self.low)))
+        target = round(self.rate_min + ratio * (self.rate_max - self.rate_min))
+
+        # hysteresis: stay on current rate while the target is close, limits back and forth
+        if (abs(target - self.rate) > self.hysteresis * self.rate
+                or (target != self.rate and target in (self.rate_min, self.rate_max))):
+            self.rate = target
+
+        return self.rate
+
+    def _advance(self, now):
+        """Move the deadline one interval further, no catch-up when late."""
+        interval = 1.0 / self.rate
+        if self._next_time is None or now - self._next_time > interval:
+            self._next_time = now
+        self._next_time += interval
+
+    def due(self, now, tolerance: float = 0.0) -> bool:
+        """True if a frame need to be sent at now (frame source keeps its own rate)."""
+        if self._next_time is not None and now + tolerance < self._next_time:
+            return False
+        self._advance(now)
+        return True
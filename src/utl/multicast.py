@@ -38,6 +38,13 @@ Key Architectural Components:
     -   **Lifecycle**: The effects are started via the `start_*` methods and can be stopped by calling `stop()`, which
         terminates the background thread and restores the original IP address list.
 
+3.  MulticastSender Class:
+    -   **Purpose**: Sends the multicast images of each frame to their devices.
+    -   **Mechanism**: One long-lived worker thread per device, fed through a one-slot mailbox (latest frame wins),
+        and a barrier shared by the workers of a frame, so all devices receive their part at the same moment.
+        Devices are found with an IP -> device dict. Nothing is created per frame, which matters for large walls
+        at 30-60 fps.
+
 Design Philosophy:
 -   **Decoupling**: The `IPSwapper` is completely decoupled from the network sending logic. It only manipulates the
     list of target IPs; the casting thread is responsible for reading this modified list and sending the data.
@@ -48,7 +55,7 @@ Design Philosophy:
 import re
 from time import sleep
 from random import shuffle, randint
-from threading import Thread
+from threading import Thread, Event, Barrier, BrokenBarrierError
 
 from configmanager import LoggerManager
 
@@ -249,3 +256,113 @@ class IPSwapper:
         self.running = False
         sleep(0.1)  # Allow some time for the loop to stop
         self._update_list(self.initial_ip_list)  # Restore the initial IP list
+
+
+class _SendWorker(Thread):
+    """Long-lived worker owning one device, fed through a one-slot mailbox."""
+
+    def __init__(self, ip, device):
+        super().__init__(name=f'Multicast-{ip}', daemon=True)
+        self.ip = ip
+        self.device = device
+        self.mailbox = None
+        self.posted = Event()
+
+    def post(self, item):
+        # only the latest image is kept, a slow device never delays the next frame
+        self.mailbox = item
+        self.posted.set()
+
+    def run(self):
+        while True:
+            self.posted.wait()
+            self.posted.clear()
+            item = self.mailbox
+            if item is None:
+                break
+            images, barrier, retry_number = item
+            try:
+                # all workers of this frame are released at the same time
+                barrier.wait(timeout=.5)
+            except BrokenBarrierError:
+                continue
+            for image in images:
+                self.device.send_to_queue(image, retry_number)
+
+
+class MulticastSender:
+    """
+    Send multicast images to a set of devices using persistent per-device workers.
+
+    Workers are created once (on first use of a device) and reused for every frame: each frame only posts the
+    images into the worker mailboxes and waits on a barrier shared by the workers, so all devices receive their
+    part at the same moment. An IP given more than once gets all its images, in order, from its one worker.
+    The barrier is reused while the number of devices stays the same.
+
+    Example usage
+    sender = MulticastSender({'192.168.1.31': ddp_dev1, '192.168.1.32': ddp_dev2})
+    sender.send([('192.168.1.31', image1), ('192.168.1.32', image2)])
+    sender.stop()
+    """
+
+    def __init__(self, devices: dict, retry_number: int = 0):
+        """
+        Args:
+            devices (dict): IP -> device (object with send_to_queue(data, retry_number)).
+            retry_number (int): default retry number passed to the devices.
+        """
+        self.devices = devices
+        self.retry_number = retry_number
+        self._workers = {}
+        self._barrier = None
+
+    def _worker(self, ip):
+        worker = self._workers.get(ip)
+        if worker is None:
+            worker = _SendWorker(ip, self.devices[ip])
+            self._workers[ip] = worker
+            worker.start()
+        return worker
+
+    def send(self, pairs, retry_number=None):
+        """
+        Send images to devices.
+
+        Args:
+            pairs: iterable of (ip, image). IPs without device (e.g. '127.0.0.1' from IPSwapper) are ignored.
+            retry_number (int, optional): retry number for this frame.
+
+        Returns:
+            bool: False if the frame has been dropped (some workers not ready in time).
+        """
+        # images grouped by IP: duplicate IPs share one worker, so one mailbox post and one barrier party per device
+        targets = {}
+        for ip, image in pairs:
+            if ip in self.devices:
+                targets.setdefault(ip, []).append(image)
+        if not targets:
+            return True
+
+        if self._barrier is None or self._barrier.broken or self._barrier.parties != len(targets) + 1:
+            # a broken barrier is never reset: late workers still holding it fail immediately
+            self._barrier = Barrier(len(targets) + 1)
+
+        retry = self.retry_number if retry_number is None else retry_number
+        for ip, images in targets.items():
+            self._worker(ip).post((images, self._barrier, retry))
+
+        try:
+            self._barrier.wait(timeout=.5)
+        except BrokenBarrierError:
+            return False
+        return True
+
+    def packets(self):
+        """Total number of frames sent by all devices."""
+        return sum(getattr(device, 'frame_count', 0) for device in self.devices.values())
+
+    def stop(self):
+        """Stop all workers."""
+        for worker in self._workers.values():
+            worker.post(None)
+        self._workers = {}
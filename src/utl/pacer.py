@@ -0,0 +1,122 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `FramePacer` class, shared by the Desktop and Media casting threads to keep the requested
+frame rate. It replaces the previous `need_to_sleep` logic based on `time.time()` and
+`expected_time = start_time + frame_count * interval`, which had three weaknesses:
+a wall-clock change (NTP, manual) broke the pacing, a stall was followed by a burst of frames sent without any
+sleep to catch up, and there was no way to know how precise the pacing really was.
+
+Key Architectural Components:
+
+1.  FramePacer Class:
+    -   **Monotonic clock**: All computations use `time.perf_counter_ns()`, integer nanoseconds, no drift and no
+        wall-clock jump.
+    -   **Deadline based**: Each call to `wait()` moves the deadline one interval further (not "now + interval"),
+        so processing time does not accumulate into a drift.
+    -   **Hybrid sleep**: `time.sleep()` is used up to `spin` seconds before the deadline, then the remaining time
+        is spent in a short busy loop. OS sleep granularity (1-15 ms depending on the platform) does not impact the
+        accuracy, and the CPU cost stays limited to the spin window.
+    -   **Late frames policy**:
+        -   `skip`: when more than one interval late, missed slots are dropped and the schedule restarts from now.
+            `wait()` returns the number of missed slots: a Media cast reads (without sending) the frames of these
+            slots, so the video stays on time.
+        -   `burst`: missed slots are kept, frames are sent without sleep until the schedule is reached again
+            (previous behavior).
+    -   **Statistics**: wake-up jitter and lateness are stored into small histograms (milliseconds buckets),
+        available through `get_stats()` for the cast info.
+"""
+
+import time
+
+# upper bounds (ms) of the histogram buckets, last one is open
+HIST_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50)
+
+
+def _hist_key(value_ms: float) -> str:
+    for bound in HIST_BUCKETS_MS:
+        if value_ms <= bound:
+            return f'<={bound}'
+    return f'>{HIST_BUCKETS_MS[-1]}'
+
+
+class FramePacer:
+    """Drift free frame pacing on a monotonic clock."""
+
+    def __init__(self, rate: float, late_policy: str = 'skip', spin: float = 0.001):
+        """
+        Args:
+            rate (float): frames per second.
+            late_policy (str): 'skip' or 'burst', what to do with missed slots.
+            spin (float): seconds before the deadline where sleep is replaced by a busy loop.
+        """
+        self.late_policy = late_policy if late_policy in ('skip', 'burst') else 'skip'
+        self.spin_ns = int(spin * 1e9)
+        self.interval_ns = 0
+        self.set_rate(rate)
+
+        self.frames = 0
+        self.late_frames = 0
+        self.skipped_slots = 0
+        self.jitter_max_ms = 0.0
+        self.jitter_hist = {}
+        self.lateness_hist = {}
+
+        self._next_ns = None
+
+    def set_rate(self, rate: float):
+        """Change the rate, applied from the next interval."""
+        self.interval_ns = int(1e9 / max(rate, 0.001))
+
+    def reset(self):
+        """Restart the schedule from the next call to wait()."""
+        self._next_ns = None
+
+    def wait(self) -> int:
+        """Wait until the deadline of the current frame, return the number of slots dropped by the skip policy."""
+        now = time.perf_counter_ns()
+        if self._next_ns is None:
+            self._next_ns = now
+        self._next_ns += self.interval_ns
+        self.frames += 1
+
+        delay = self._next_ns - now
+        if delay <= 0:
+            # processing took longer than the interval
+            late_ms = -delay / 1e6
+            self.late_frames += 1
+            key = _hist_key(late_ms)
+            self.lateness_hist[key] = self.lateness_hist.get(key, 0) + 1
+            if self.late_policy == 'skip' and -delay > self.interval_ns:
+                missed = -delay // self.interval_ns
+                self.skipped_slots += missed
+                self._next_ns = now
+                return missed
+            return 0
+
+        # coarse sleep, then spin for the remaining time
+        if delay > self.spin_ns:
+            time.sleep((delay - self.spin_ns) / 1e9)
+        while time.perf_counter_ns() < self._next_ns:
+            pass
+
+        jitter_ms = (time.perf_counter_ns() - self._next_ns) / 1e6
+        self.jitter_max_ms = max(self.jitter_max_ms, jitter_ms)
+        key = _hist_key(jitter_ms)
+        self.jitter_hist[key] = self.jitter_hist.get(key, 0) + 1
+        return 0
+
+    def get_stats(self) -> dict:
+        """Pacing statistics, for info / API."""
+        return {
+            'policy': self.late_policy,
+            'frames': self.frames,
+            'late_frames': self.late_frames,
+            'skipped_slots': self.skipped_slots,
+            'jitter_max_ms': round(self.jitter_max_ms, 3),
+            'jitter_ms': dict(self.jitter_hist),
+            'lateness_ms': dict(self.lateness_hist)
+        }
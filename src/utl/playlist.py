@@ -0,0 +1,169 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `Playlist` and `PreparedSource` classes, used by a Media cast to play several media one after
+the other without stopping (`playlist` attribute of CASTMedia: media played after `viinput`).
+
+Chaining media with the scheduler stopped the cast and started a new one: devices were pinged again, WLED was set
+again in 'live' mode, the decoder was opened again, and LEDs stayed black meanwhile. Inside one cast, devices,
+senders and preview are kept, only the media changes.
+
+Key Architectural Components:
+
+1.  PreparedSource Class:
+    -   Opens a media (video file, stream, YouTube url, baked clip or slideshow) in a background thread and decodes
+        its first frames (`playlist_prefetch` in config), while the current media is still playing.
+    -   cv2.VideoCapture like API (`read`, `get`, `set`, `release`): pre-decoded frames are read first, then the
+        decoder. The cast loop uses it as the media it replaces.
+
+2.  Playlist Class:
+    -   **`prepare`**: Starts the `PreparedSource` of the next item (first one again when the playlist repeats).
+    -   **`advance`**: Returns the next source, ready to read, when the current media reaches its end. Items that can
+        not be opened are skipped. The cast reads its first frame in the same loop turn: no frame is missed.
+"""
+
+import threading
+
+from collections import deque
+
+import cv2
+
+from src.utl.bakeclip import BakedClip, CLIP_EXT
+from src.utl.keyindex import IndexedCapture
+from src.utl.slideshow import SlideshowSource
+from src.utl.ytstream import ProgressiveCapture, YtCache
+from configmanager import LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.playlist')
+playlist_logger = logger_manager.logger
+
+
+class PreparedSource:
+    """Media opened, and first frames decoded, in background."""
+
+    def __init__(self, viinput, prefetch=8, size=None, fps=0.0):
+        self.viinput = viinput
+        self.baked = str(viinput).lower().endswith(CLIP_EXT)
+        self.size = size
+        self.rate = fps
+        self.media = None
+        self.length = 0
+        self.fps = 0.0
+        self.error = None
+        self._frames = deque()
+        self._thread = threading.Thread(target=self._open, args=(prefetch,), daemon=True, name='PlaylistOpen')
+        self._thread.start()
+
+    def _open(self, prefetch):
+        try:
+            if self.baked:
+                media = BakedClip.open(self.viinput)
+            elif YtCache.is_youtube(self.viinput):
+                media = ProgressiveCapture.open(self.viinput) or ProgressiveCapture.stream(self.viinput)
+                if media is None:
+                    raise ValueError('unable to read YouTube video')
+            elif SlideshowSource.is_slideshow(self.viinput):
+                media = SlideshowSource(self.viinput, self.size, fps=self.rate)
+            else:
+                media = IndexedCapture.open(self.viinput) or cv2.VideoCapture(self.viinput)
+            if not media.isOpened():
+                raise ValueError('unable to open media')
+            self.length = int(media.get(cv2.CAP_PROP_FRAME_COUNT))
+            if self.length == 1:
+                media.release()
+                raise ValueError('image is not supported in playlist')
+            self.fps = media.get(cv2.CAP_PROP_FPS)
+            for _ in range(prefetch):
+                success, frame = media.read()
+                if not success:
+                    break
+                self._frames.append(frame)
+            self.media = media
+        except Exception as er:
+            self.error = str(er)
+
+    def wait(self, timeout=None):
+        """Wait until opened, return True if the media can be read."""
+        self._thread.join(timeout)
+        return self.media is not None and self.error is None
+
+    """
+    cv2.VideoCapture like API
+    """
+
+    def isOpened(self):
+        return self.media is not None
+
+    def read(self):
+        if self._frames:
+            return True, self._frames.popleft()
+        if self.media is None:
+            return False, None
+        return self.media.read()
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.media.get(prop) - len(self._frames)
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.media.get(prop) - len(self._frames) * 1000 / max(self.fps, 1)
+        return self.media.get(prop)
+
+    def set(self, prop, value):
+        if prop in (cv2.CAP_PROP_POS_FRAMES, cv2.CAP_PROP_POS_MSEC):
+            # seek: pre-decoded frames are no longer the next ones
+            self._frames.clear()
+        return self.media.set(prop, value)
+
+    def release(self):
+        self._thread.join()
+        self._frames.clear()
+        if self.media is not None:
+            self.media.release()
+            self.media = None
+
+
+class Playlist:
+    """Items of a cast, the next one prepared while the current one plays."""
+
+    def __init__(self, items, prefetch=8, size=None, fps=0.0):
+        self.items = [str(item) for item in items]
+        self.prefetch = prefetch
+        self.size = size  # cast size, for slideshows
+        self.fps = fps
+        self.index = 0  # current item, the first one is opened by the cast
+        self._next = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def has_next(self):
+        return self.index + 1 < len(self.items)
+
+    def prepare(self, wrap=False):
+        """Open the next item in background, the first one after the last if wrap."""
+        if self._next is None and (self.has_next() or wrap):
+            self._next = PreparedSource(self.items[(self.index + 1) % len(self.items)], self.prefetch,
+                                        self.size, self.fps)
+
+    def advance(self, wrap=False):
+        """Return the source of the next item ready to read, None if no more item could be opened."""
+        for _ in range(len(self.items)):
+            self.prepare(wrap)
+            source, self._next = self._next, None
+            if source is None:
+                return None
+            self.index = (self.index + 1) % len(self.items)
+            if source.wait():
+                playlist_logger.debug(f'Playlist item {self.index} : {source.viinput}')
+                return source
+            playlist_logger.error(f'Playlist item {source.viinput} skipped : {source.error}')
+            source.release()
+        return None
+
+    def close(self):
+        if self._next is not None:
+            self._next.release()
+            self._next = None
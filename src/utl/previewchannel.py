@@ -0,0 +1,205 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `PreviewChannel` class, the shared memory channel between a cast thread and its cv2 preview
+child process (`preview_proc = True`, mandatory on platforms where cv2.imshow() need to run from a Main thread).
+
+It replaces the 21 fields `ShareableList` used before: the frame was converted to bytes with one appended byte
+(https://github.com/python/cpython/issues/106939), its shape was sent as a string parsed with `ast.literal_eval`,
+and the child process was running a `while True` loop without any wait, using a full core even with a paused cast.
+
+Memory layout (one `SharedMemory` block, name is thread name + _p):
+
+    +----------------------------------------------------------------------------+
+    | header: one numpy record (HEADER_DTYPE), fixed size                        |
+    |   frame shape, sequence numbers, doorbell port, display settings and flags |
+    +----------------------------------------------------------------------------+
+    | frame slot: height * width * channels uint8                                |
+    +----------------------------------------------------------------------------+
+
+Key Architectural Components:
+
+1.  PreviewChannel Class:
+    -   **`create` / `attach`**: Cast side creates the block with the shape of the first frame, preview process
+        attaches by name.
+    -   **`write`**: Copies the frame into the slot (seqlock: `slot_seq` is odd during the copy) and updates the
+        display settings, then rings the doorbell. Frames with another shape are resized to the slot.
+    -   **`due`**: Rate cap of the cast side, the preview does not need more than `preview_window_fps`.
+    -   **`read`**: Copies the frame out of the slot, None if the producer was writing it at the same time.
+    -   **`wait`**: Preview side blocks (see `Doorbell` in framering.py) until a newer frame is published or the cast
+        thread changes something (e.g. asks to close the window) with `notify`. No frame, no CPU.
+    -   **`get` / `set`**: Typed access to the header fields; flags updated by the preview window (keys q, p, t)
+        go back to the cast thread through `preview`, `todo_stop` and `text`.
+"""
+
+import time
+
+from multiprocessing.shared_memory import SharedMemory
+
+import cv2
+import numpy as np
+
+from src.utl.framering import Doorbell
+
+MAGIC = 0x50535657  # 'WVSP'
+
+HEADER_DTYPE = np.dtype([
+    ('magic', '<u4'),
+    ('height', '<u4'),
+    ('width', '<u4'),
+    ('channels', '<u4'),
+    ('seq', '<u8'),
+    ('slot_seq', '<u8'),
+    ('doorbell', '<u4'),
+    ('server_port', '<u4'),
+    ('total_frames', '<u8'),
+    ('frame_count', '<u8'),
+    ('fps', '<f8'),
+    ('preview_w', '<u4'),
+    ('preview_h', '<u4'),
+    ('pixel_w', '<u4'),
+    ('pixel_h', '<u4'),
+    ('cast_x', '<u4'),
+    ('cast_y', '<u4'),
+    ('preview_top', 'u1'),
+    ('preview', 'u1'),
+    ('todo_stop', 'u1'),
+    ('text', 'u1'),
+    ('grid', 'u1'),
+    ('t_viinput', 'S256'),
+    ('t_name', 'S64'),
+    ('ip_addresses', 'S1024'),
+    ('custom_text', 'S256')
+], align=True)
+
+HEADER_SIZE = (HEADER_DTYPE.itemsize + 63) // 64 * 64
+BOOL_FIELDS = ('preview_top', 'preview', 'todo_stop', 'text', 'grid')
+
+
+class PreviewChannel:
+    """Frame slot and display settings shared with the cv2 preview process."""
+
+    def __init__(self, shm: SharedMemory, owner: bool = False):
+        self.shm = shm
+        self.name = shm.name
+        self.owner = owner
+
+        self._header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf, offset=0)
+        if int(self._header['magic']) != MAGIC:
+            raise ValueError(f'{shm.name} is not a preview channel')
+
+        self.shape = (int(self._header['height']), int(self._header['width']), int(self._header['channels']))
+        self._frame = np.ndarray(self.shape, dtype=np.uint8, buffer=shm.buf, offset=HEADER_SIZE)
+        self._doorbell = Doorbell()
+        self._next_write = 0.0
+
+    @classmethod
+    def create(cls, name, shape, **fields):
+        """Create the channel for frames of shape (h, w, c), an old block with the same name is replaced."""
+        size = HEADER_SIZE + int(np.prod(shape))
+        try:
+            shm = SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # left by a previous cast with the same thread name
+            stale = SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = SharedMemory(name=name, create=True, size=size)
+
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf, offset=0)
+        header[()] = np.zeros((), dtype=HEADER_DTYPE)
+        header['height'], header['width'], header['channels'] = shape
+        header['magic'] = MAGIC
+        del header
+
+        channel = cls(shm, owner=True)
+        channel._frame[:] = 111
+        channel.set(**fields)
+        return channel
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to an existing channel."""
+        return cls(SharedMemory(name=name))
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last published frame."""
+        return int(self._header['seq'])
+
+    def get(self, field):
+        """Value of a header field, as bool / str / number."""
+        value = self._header[field].item()
+        if field in BOOL_FIELDS:
+            return bool(value)
+        if isinstance(value, bytes):
+            return value.decode(errors='ignore')
+        return value
+
+    def set(self, **fields):
+        """Update header fields."""
+        for field, value in fields.items():
+            if HEADER_DTYPE[field].kind == 'S':
+                value = str(value).encode()[:HEADER_DTYPE[field].itemsize]
+            self._header[field] = value
+
+    def write(self, frame, **fields):
+        """Publish a new frame (cast side) with the display settings."""
+        if frame.shape != self.shape:
+            frame = cv2.resize(frame, (self.shape[1], self.shape[0]))
+            if frame.ndim == 2:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+        self.set(**fields)
+        seq = self.seq + 1
+        self._header['slot_seq'] = 2 * seq - 1  # odd: write in progress
+        np.copyto(self._frame, frame[..., :self.shape[2]], casting='unsafe')
+        self._header['slot_seq'] = 2 * seq
+        self._header['seq'] = seq
+        self.notify()
+
+    def due(self, rate) -> bool:
+        """Cast side: True if a frame can be written, to publish at most rate frames per second."""
+        now = time.monotonic()
+        if now < self._next_write:
+            return False
+        self._next_write = now + 1 / max(rate, 1)
+        return True
+
+    def notify(self):
+        """Wake up the preview process (new frame or flags changed)."""
+        self._doorbell.ring(int(self._header['doorbell']))
+
+    def read(self):
+        """Return (frame copy, seq) of the last frame, (None, seq) if it was overwritten during the copy."""
+        seq = self.seq
+        frame = self._frame.copy()
+        if int(self._header['slot_seq']) != 2 * seq:
+            return None, seq
+        return frame, seq
+
+    def enable_doorbell(self):
+        """Preview side: be notified by the cast thread."""
+        self._header['doorbell'] = self._doorbell.bind()
+
+    def wait(self, last_seq, timeout) -> bool:
+        """Wait up to timeout seconds for a frame newer than last_seq or a notification."""
+        if self.seq != last_seq:
+            return True
+        self._doorbell.wait(timeout)
+        return self.seq != last_seq
+
+    def close(self):
+        """Release the views and close the shared memory (unlink if owner)."""
+        if self._doorbell.bound:
+            self._header['doorbell'] = 0
+        self._doorbell.close()
+        self._header = self._frame = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+        if self.owner:
+            self.shm.unlink()
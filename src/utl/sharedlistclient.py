@@ -4,52 +4,39 @@ d: 25/02/2025
 v: 1.0.0.0
 
 Overview
-This Python code defines a client (SharedListClient) for interacting with a separate server process that manages
-shared memory lists. These shared lists, implemented using multiprocessing.shared_memory.ShareableList,
+This Python code defines a client (SharedListClient) for interacting with shared memory lists.
+These shared lists, implemented using SharedFrameRing (see framering.py),
 allow multiple processes (like a video processing pipeline and a WLED controller) to efficiently share data,
 such as LED frame information. The client provides methods to create, access, delete, and get information about
-these shared lists on the server.
+these shared lists.
+
+There is no more server behind the client: lists are found through the local FrameRegistry (see frameregistry.py),
+an index file mapped in memory. `connect()` only opens the registry for the port, and attaching to a list is an
+index lookup plus a SharedMemory attach, well below one millisecond.
 
 Key Components
-SharedListClient Class: This is the core of the file, providing the interface for client applications to interact with
-the shared list server.
+SharedListClient Class: This is the core of the file, providing the interface for client applications.
 
 Its key methods include:
 
-connect(): Establishes a connection to the server.
-create_shared_list(): Requests the server to create a new shared list with a specified name, width, and height.
-                    It returns a ShareableList object that can be used to access the shared memory.
-attach_to_shared_list(): Attaches to an existing shared list by name.
-get_shared_lists(): Retrieves a list of names of existing shared lists on the server.
-get_shared_lists_info(): Retrieves information (likely size and dimensions) about all shared lists.
+connect(): Opens the registry.
+create_shared_list(): Creates a new shared list with a specified name, width, and height.
+                    It returns a SharedFrameRing object that can be used to access the shared memory.
+attach_to_shared_list(): Attaches to an existing shared list by name, optionally checking its size.
+get_shared_lists(): Retrieves a list of names of existing shared lists.
+get_shared_lists_info(): Retrieves information (width and height) about all shared lists.
 get_shared_list_info(): Retrieves information about a specific shared list.
-delete_shared_list(): Requests the server to delete a specific shared list.
-stop_server(): Requests the server to shut down.
-
-SLManager Class:
-This class, inheriting from BaseManager, handles the remote procedure calls (RPC) to the server.
-It registers methods like create_shared_list, get_shared_lists, etc., which correspond to functions on the server side.
-This allows the client to call these functions remotely as if they were local.
-
-ShareableList:
-This class from the multiprocessing.shared_memory module is used to represent the actual shared memory lists.
-The client receives names/handles to these lists from the server and uses ShareableList to attach to and interact
-with the shared memory.
-
-Proxy Objects (AutoProxy):
-The code explicitly handles proxy objects returned by the manager.
-These proxies stand in for the actual return values from the server-side functions.
-The code uses f'{proxy_object}' to resolve the proxy and get the real string value.
-This is crucial for correctly interpreting the server's responses.
+delete_shared_list(): Deletes a specific shared list.
+stop_manager(): Deletes the shared lists created by this process.
 
 The 'if __name__ == "__main__"':
-block provides example usage of the SharedListClient, demonstrating how to connect to the server,
-create and manipulate shared lists, and finally clean up by deleting the list and closing the shared memory.
+block provides example usage of the SharedListClient, demonstrating how to create and manipulate shared lists,
+and finally clean up by deleting the list and closing the shared memory.
 
 """
-import ast
-from multiprocessing.managers import BaseManager
-from multiprocessing.shared_memory import ShareableList
+import time
+
+from src.utl.frameregistry import FrameRegistry
 
 from configmanager import LoggerManager
 
@@ -57,130 +44,85 @@ logger_manager = LoggerManager(logger_name='WLEDLogger.slclient')
 slclient_logger = logger_manager.logger
 
 
-class SLManager(BaseManager):
-    pass
-
-
 class SharedListClient:
-    """Client to interact with the SharedListManager."""
+    """Client to interact with shared lists."""
 
     def __init__(self, sl_ip_address="127.0.0.1", sl_port=50000, authkey=b"wledvideosync"):
         self.address = (sl_ip_address, sl_port)
         self.authkey = authkey
-        self.manager = None
+        self.registry = None
 
     def connect(self):
-        """Connects to the shared list manager."""
-
-        SLManager.register("create_shared_list")
-        SLManager.register("get_shared_lists")
-        SLManager.register("get_shared_lists_info")
-        SLManager.register("get_shared_list_info")
-        SLManager.register("get_server_status")
-        SLManager.register("delete_shared_list")
-        SLManager.register("stop_manager")
-
-        self.manager = SLManager(address=self.address, authkey=self.authkey)
+        """Opens the shared list registry."""
         try:
-            self.manager.connect()
-            slclient_logger.info(f"Connected to SharedListManager:{self.manager.address}")
+            self.registry = FrameRegistry.open(self.address[1])
+            slclient_logger.info(f"Connected to SharedList registry:{self.registry.path}")
             return True
-        except ConnectionRefusedError as con:
-            slclient_logger.error(f'No SL manager server: {con}')
-            return False
         except Exception as er:
             slclient_logger.error(f'Error with  SL client : {er}')
             return None
 
     def create_shared_list(self, name, w, h, start_time=0):
-        """Requests the server to create a shared list and returns a ShareableList.
-
-                    __str__() Method on Proxy Objects:
-            An important point about proxy objects (specifically, AutoProxy) is that they override the __str__() method.
-            The purpose of this method is to define how the object should be represented when it is coerced into
-            a string, such as with string formatting (f'{shm_name}').
-
-        """
+        """Creates a shared list and returns a SharedFrameRing attached to it."""
 
         try:
             slclient_logger.info(f"Request to create shared list '{name}'.")
-            # The manager returns a status string: 'success', 'exists', or 'error'
-            result_proxy = self.manager.create_shared_list(name, w, h, start_time)
-            status = str(result_proxy)  # Resolve the proxy to a string
+            # The registry returns a status string: 'success', 'exists', or 'error'
+            status = self.registry.create(name, w, h, start_time=start_time)
 
-            if 'success' in status:
-                slclient_logger.info(f"Successfully created '{name}' on server. Attaching client-side.")
-                return ShareableList(name=name)
+            if status == 'success':
+                slclient_logger.info(f"Successfully created '{name}'. Attaching client-side.")
+                return self.registry.attach(name)
 
-            elif 'exists' in status :
-                slclient_logger.warning(f"Shared list '{name}' already exists on server. Attaching client-side.")
+            elif status == 'exists':
+                slclient_logger.warning(f"Shared list '{name}' already exists. Attaching client-side.")
                 try:
-                    return ShareableList(name=name)
+                    return self.registry.attach(name, w, h)
 
                 except FileNotFoundError:
-                    slclient_logger.error(f"Server reported '{name}' exists, but it could not be found. It may have been deleted")
+                    slclient_logger.error(f"Registry reported '{name}' exists, but it could not be found. It may have been deleted")
                     return None
             else:
-                slclient_logger.error(f"Server failed to create shared list '{name}'. Status: {status}")
+                slclient_logger.error(f"Failed to create shared list '{name}'. Status: {status}")
                 return None
 
         except Exception as er:
             slclient_logger.error(f"An unexpected error occurred in create_shared_list: {er}", exc_info=True)
             return None
 
-    @staticmethod
-    def attach_to_shared_list(name):
-        return ShareableList(name=name)
+    def attach_to_shared_list(self, name, w=None, h=None):
+        """Attach to a shared list, ValueError if w / h given and not matching."""
+        return self.registry.attach(name, w, h)
 
     def get_shared_lists(self):
         """Retrieves all shared list names."""
         slclient_logger.info('Request to receive existing SLs list')
-        return f'{self.manager.get_shared_lists()}'
+        return f'{self.registry.names()}'
 
     def get_shared_lists_info(self):
         """Retrieves all shared list names with width and height."""
         slclient_logger.info('Request to receive existing SLs info dict')
-        shared_lists_info_proxy = self.manager.get_shared_lists_info()
-        shared_lists_info_str = f'{shared_lists_info_proxy}'
-        try:
-            return ast.literal_eval(shared_lists_info_str)
-        except (SyntaxError, ValueError) as er:
-            slclient_logger.error(f"Error parsing shared list info: {er}")
-            return None
+        return self.registry.infos()
 
     def get_shared_list_info(self, name):
         """Retrieves size information for a specific shared list."""
         slclient_logger.info(f'Request to receive existing SL info dict for: {name}')
-        try:
-            shared_list_info_proxy = self.manager.get_shared_list_info(name)
-        except Exception as er:
-            # The exception from the remote manager for a missing key is not always a `KeyError`.
-            # We catch the broader `Exception` and inspect its message to provide a specific error log.
-            if isinstance(er, KeyError) or 'KeyError' in repr(er):
-                slclient_logger.error(f"SL Does not exist : {name}")
-            else:
-                slclient_logger.error(f"Error from SL manager retrieving shared list info for '{name}': {er}")
-            return None
-
-        shared_list_info_str = f'{shared_list_info_proxy}'
-        try:
-            return ast.literal_eval(shared_list_info_str)
-        except (SyntaxError, ValueError) as er:
-            slclient_logger.error(f"Error parsing shared list info: {er}")
-            return None
+        info = self.registry.get_info(name)
+        if info is None:
+            slclient_logger.error(f"SL Does not exist : {name}")
+        return info
 
     def delete_shared_list(self, name):
         """Deletes a shared list."""
         slclient_logger.info(f"Request to delete SL '{name}'.")
-        self.manager.delete_shared_list(name)
+        self.registry.delete(name)
 
     def stop_manager(self):
-        """Requests the server to stop."""
+        """Deletes the shared lists created by this process."""
         try:
-            slclient_logger.info("SL manager shutdown request sent.")
-            self.manager.stop_manager()  # This method now shuts down the server
-        except ConnectionResetError:
-            pass
+            slclient_logger.info("SL cleanup request.")
+            for name in self.registry.owned():
+                self.registry.delete(name)
         except Exception as er:
             slclient_logger.error(f"Error stopping the SL manager: {er}")
 
@@ -188,10 +130,9 @@ if __name__ == "__main__":
 
     client = SharedListClient()
 
-    # for this to run successfully, SL manager must be UP and running
     try:
         client.connect()
-        if shared_list := client.create_shared_list("mylist", 128, 128, 3):
+        if shared_list := client.create_shared_list("mylist", 128, 128, time.time()):
             # List shared lists
             slclient_logger.info(f"Current SLs list: {client.get_shared_lists()}")
             # List shared lists info
@@ -199,7 +140,7 @@ if __name__ == "__main__":
             # List shared lists info
             slclient_logger.info(f"Current shared list info for 'mylist' : {client.get_shared_list_info('mylist')}")
             # Attach to SL
-            client.attach_to_shared_list('mylist')
+            client.attach_to_shared_list('mylist', 128, 128).close()
             slclient_logger.info("Attach to 'mylist': ok" )
             if mylist_info := client.get_shared_list_info('mylist'):
                 width = mylist_info['w']
@@ -207,11 +148,11 @@ if __name__ == "__main__":
                 slclient_logger.info(f"Size of 'mylist' (using get_shared_list_info): {width}x{height}")
 
             # Cleanup
+            shared_list.close()
             client.delete_shared_list("mylist")
-            shared_list.shm.close()  # Manually close shared memory
 
     except Exception as e:
-        slclient_logger.error("Client Error:", e)
+        slclient_logger.error(f"Client Error: {e}")
 
     finally:
         slclient_logger.info("Client shutting down.")
@@ -0,0 +1,174 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `SlideshowSource` class, the Media cast input for a folder of images (slideshow) or an image
+sequence pattern (e.g. media/image/img_%02d.jpg).
+
+Image sequences were read by cv2.VideoCapture on the cast thread, one full size image decoded after the other, and a
+folder could not be cast at all. A photo folder at 25 FPS means decoding 25 camera size JPEG per second for a
+matrix of a few hundred LEDs.
+
+Key Architectural Components:
+
+1.  SlideshowSource Class:
+    -   **Thread pool**: images are decoded by `slideshow_workers` threads (cv2.imread releases the GIL), ahead of
+        the cast position.
+    -   **Downsized at load**: each image is resized to the cast size as soon as decoded, only LED size frames are
+        kept in memory.
+    -   **LRU cache**: the last `slideshow_cache` ready frames are kept, a repeated slideshow or a sync / skip
+        back does not decode them again.
+    -   **cv2.VideoCapture like API** (`read`, `get`, `set`, `release`), one image per frame, so repeat, sync,
+        loop cache and playlist work as with a video.
+"""
+
+import os
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from src.utl.cv2utils import CV2Utils
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.slideshow')
+slideshow_logger = logger_manager.logger
+
+IMAGE_EXT = ('.jpg', '.jpeg', '.png', '.bmp', '.webp', '.tif', '.tiff')
+
+
+class SlideshowSource:
+    """Folder / image sequence decoded in a thread pool, read like a cv2.VideoCapture."""
+
+    def __init__(self, viinput, size=None, fps=0.0, workers=None, cache=None):
+        app_config = cfg_mgr.app_config or {}
+        workers = max(1, int(workers or app_config.get('slideshow_workers', 4)))
+        self.viinput = str(viinput)
+        self.files = self.list_files(self.viinput)
+        self.size = size  # (w, h) of the cast, None to keep image size
+        self.fps = fps  # no timing in images, cast rate
+        self.position = 0
+        self.capacity = max(workers * 2, int(cache or app_config.get('slideshow_cache', 256)))
+        self.ahead = workers * 2
+        self.hits = self.misses = 0
+        self._cache = OrderedDict()  # index -> frame, LRU
+        self._pending = {}  # index -> Future
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='Slideshow')
+
+    @staticmethod
+    def is_slideshow(viinput):
+        """True for a folder or an image sequence pattern (printf style, e.g. img_%02d.jpg)."""
+        value = str(viinput)
+        return os.path.isdir(value) or ('%' in value and '://' not in value and value.lower().endswith(IMAGE_EXT))
+
+    @staticmethod
+    def list_files(viinput):
+        """Image files of a folder (sorted by name) or of a sequence pattern (starting at 0 or 1)."""
+        if os.path.isdir(viinput):
+            return [os.path.join(viinput, name) for name in sorted(os.listdir(viinput))
+                    if name.lower().endswith(IMAGE_EXT)]
+        files = []
+        for start in (0, 1):
+            number = start
+            while os.path.isfile(viinput % number):
+                files.append(viinput % number)
+                number += 1
+            if files:
+                break
+        return files
+
+    def _load(self, index):
+        frame = cv2.imread(self.files[index])
+        if frame is None:
+            raise ValueError(f'Unable to read image {self.files[index]}')
+        if self.size is not None:
+            frame = CV2Utils.resize_image(frame, *self.size)
+        return frame
+
+    def _schedule(self, index):
+        """Decode index in background if not done / running (lock held)."""
+        if 0 <= index < len(self.files) and index not in self._cache and index not in self._pending:
+            self._pending[index] = self._pool.submit(self._load, index)
+
+    def frame(self, index):
+        """Return the frame of image index, start decoding the next ones."""
+        with self._lock:
+            frame = self._cache.get(index)
+            if frame is not None:
+                self._cache.move_to_end(index)
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._schedule(index)
+                future = self._pending[index]
+            # read ahead, forget what is no longer ahead (seek)
+            for stale in [i for i in self._pending if not index <= i <= index + self.ahead]:
+                self._pending.pop(stale).cancel()
+            for ahead in range(index + 1, index + self.ahead + 1):
+                self._schedule(ahead)
+
+        if frame is None:
+            try:
+                frame = future.result()
+            except Exception as er:
+                slideshow_logger.warning(er)
+                width, height = self.size or (64, 64)
+                frame = np.zeros((height, width, 3), dtype=np.uint8)
+            with self._lock:
+                self._pending.pop(index, None)
+                self._cache[index] = frame
+                while len(self._cache) > self.capacity:
+                    self._cache.popitem(last=False)
+        return frame
+
+    """
+    cv2.VideoCapture like API, used by CASTMedia
+    """
+
+    def isOpened(self):
+        return len(self.files) > 0
+
+    def read(self):
+        if self.position >= len(self.files):
+            return False, None
+        frame = self.frame(self.position)
+        self.position += 1
+        return True, frame
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return len(self.files)
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.position
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            # as cv2: timestamp of the last read frame
+            return max(self.position - 1, 0) / (self.fps or 25) * 1000
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.position = int(min(max(value, 0), len(self.files)))
+        elif prop == cv2.CAP_PROP_POS_MSEC:
+            self.position = int(min(max(value / 1000 * (self.fps or 25), 0), len(self.files)))
+        else:
+            return False
+        return True
+
+    def release(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._pending.clear()
+            self._cache.clear()
+
+    def get_stats(self):
+        """Loader status, for info / API."""
+        return {'images': len(self.files), 'cached': len(self._cache), 'decoding': len(self._pending),
+                'hits': self.hits, 'misses': self.misses}
@@ -58,6 +58,7 @@ Extensive use of try/except blocks and context managers to handle errors gracefu
 
 """
 import asyncio
+import base64
 import contextlib
 import urllib.parse
 import shelve
@@ -69,6 +70,7 @@ import traceback
 import json
 import re
 import subprocess
+import time
 import configparser
 import io
 import socket
@@ -77,7 +79,6 @@ import requests
 import aiohttp
 import av
 import cv2
-import numpy as np
 import tkinter as tk
 
 try:
@@ -97,6 +98,9 @@ from coldtype.text.reader import Font
 from wled.exceptions import WLEDConnectionError, WLEDError # Specific WLED errors
 from ping3 import ping as wled_ping
 
+from src.utl.mediacatalog import MediaCatalog
+from src.utl.giftranscode import GifTranscoder
+from src.utl.ytstream import YtCache
 from configmanager import cfg_mgr, PLATFORM, WLED_PID_TMP_FILE, LoggerManager
 
 logger_manager = LoggerManager(logger_name='WLEDLogger.utils')
@@ -149,22 +153,68 @@ def check_server():
 
     return srv_ip, srv_port
 
-class LatestFrame:
-    """A thread-safe class to hold the latest frame from a cast."""
+class PreviewPublisher:
+    """Latest UI preview (JPEG thumbnail) of a cast, thread-safe.
 
-    def __init__(self):
-        self.frame = None
+    Encoding only happens while someone is watching (subscribers > 0, see /ws/previews and MJPEG endpoints in api.py)
+    and at most at the preview rate, which is independent of the cast rate.
+    """
+
+    def __init__(self, width: int = 240, height: int = 135, quality: int = 70):
+        self.width = width
+        self.height = height
+        self.quality = quality
+        self.rate = 10
+        self.jpeg = None
+        self.thumbnail = None
+        self.seq = 0
+        self.subscribers = 0
         self.lock = Lock()
+        self._next_time = 0.0
 
-    def set(self, frame):
-        """Safely sets the latest frame."""
+    def subscribe(self):
         with self.lock:
-            self.frame = frame
+            self.subscribers += 1
 
-    def get(self):
-        """Safely gets the latest frame."""
+    def unsubscribe(self):
         with self.lock:
-            return self.frame
+            self.subscribers = max(0, self.subscribers - 1)
+
+    def offer(self, frame, rate=None) -> bool:
+        """Cast side: encode frame (RGB) if watched and due, return True if published."""
+        if self.subscribers == 0:
+            return False
+        if rate:
+            self.rate = rate
+        now = time.monotonic()
+        if now < self._next_time:
+            return False
+        self._next_time = now + 1 / max(self.rate, 0.1)
+
+        thumbnail = cv2.resize(frame, (self.width, self.height), interpolation=cv2.INTER_AREA)
+        ok, buffer = cv2.imencode('.jpg', cv2.cvtColor(thumbnail, cv2.COLOR_RGB2BGR),
+                                  [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+        if ok:
+            with self.lock:
+                self.jpeg = buffer.tobytes()
+                self.thumbnail = thumbnail
+                self.seq += 1
+        return ok
+
+    def get_jpeg(self):
+        """Return (jpeg bytes, seq) of the latest preview, (None, 0) if none."""
+        with self.lock:
+            return self.jpeg, self.seq
+
+    def get_thumbnail(self):
+        """Return (RGB array, seq) of the latest preview, (None, 0) if none. The array must not be modified."""
+        with self.lock:
+            return self.thumbnail, self.seq
+
+    def get(self):
+        """Return the latest preview as base64 string (data URI use), None if none."""
+        jpeg, _ = self.get_jpeg()
+        return base64.b64encode(jpeg).decode('utf-8') if jpeg is not None else None
 
 
 class CastAPI:
@@ -209,7 +259,7 @@ class CastAPI:
     grid_card = None
     control_panel = None
     loop = None
-    previews = {}  # Thread-safe dictionary to hold latest preview frames
+    previews = {}  # cast name -> PreviewPublisher, latest UI preview of each running cast
 
     def __init__(self):
         pass
@@ -588,7 +638,6 @@ class CASTUtils:
         try:
             file_path_size_kb = int(os.path.getsize(file_path) / 1024)
             filename = CASTUtils.wled_name_format(os.path.basename(file_path))
-            files = {'file': (filename, open(file_path, 'rb'), 'image/gif')}
 
             # check file space on MCU
             response = requests.get(info_url, timeout=2)  # Add timeout
@@ -597,7 +646,10 @@ class CASTUtils:
             remaining_space_kb = info_data['fs']['t'] - info_data['fs']['u']
 
             if file_path_size_kb < remaining_space_kb:
-                response = requests.post(url, files=files, timeout=10)  # Add timeout
+                # file streamed from disk, closed after upload
+                with open(file_path, 'rb') as file_in:
+                    files = {'file': (filename, file_in, 'image/gif')}
+                    response = requests.post(url, files=files, timeout=10)  # Add timeout
                 response.raise_for_status()
                 utils_logger.info(f"File uploaded successfully: {response.text} to: {url}")
             else:
@@ -627,28 +679,14 @@ class CASTUtils:
             new_h (int): New height.
         """
         try:
-            container_in = av.open(video_in)
-            if container_in.format.name == 'gif':
-                # For GIFs, resize frames individually and create a new GIF
-                frames = []
-                stream = container_in.streams.video[0]
-                for frame in container_in.decode(stream):
-                    img = frame.to_image()
-                    img = np.array(img)
-                    resized_frame = cv2.resize(img, (new_w, new_h))
-                    frames.append(Image.fromarray(resized_frame))
-
-                frames[0].save(video_out,
-                               save_all=True,
-                               append_images=frames[1:],
-                               loop=0,
-                               duration=stream.average_rate.denominator)
-
+            with av.open(video_in) as container_in:
+                is_gif = container_in.format.name == 'gif'
+            if is_gif:
+                # frames resized and written one by one (see giftranscode.py)
+                await run.io_bound(GifTranscoder.video_to_gif, video_in, video_out, width=new_w, height=new_h)
             else:
                 utils_logger.error(f'Not a GIF file : {video_in}')
 
-            container_in.close()
-
         except Exception as er:
             utils_logger.error(f"Error resizing GIF: {er}")
 
@@ -694,32 +732,13 @@ class CASTUtils:
     async def video_to_gif(video_file, gif_file, width = None, height = None, loop: int = 0, duration: int = 100):
         """Convert an MP4 file to a GIF.
 
-        Reads frames from an MP4 file using pyav, resize & converts them to RGB numpy arrays,
-        and then saves them as a GIF using Pillow.
+        Reads frames from an MP4 file using pyav, resizes and palettizes them, and writes them to the GIF as they come.
         duration : time frame display,default to 100ms. e.g: 10 images * 100 duration = 1 second = 10fps
         """
 
-        # Open the video file using pyav
-        container = av.open(video_file)
-
-        # Read the frames from the first video stream
-        frames = []
-        for frame in container.decode(video=0):
-            # resize
-            if width is not None and height is not None:
-                frame = frame.reformat(width=width, height=height)
-            # Convert the frame to numpy array (RGB format)
-            img = frame.to_image()
-            img = np.array(img)
-
-            # Append the frame to the list
-            frames.append(img)
-
-        # Create a GIF from the frames
-        frames_pil = [Image.fromarray(frame) for frame in frames]
-        frames_pil[0].save(gif_file, save_all=True, append_images=frames_pil[1:], loop=loop, duration=duration, disposal=2)
-        #
-        container.close()
+        # streaming pipeline: frames decoded, resized and palettized one by one (see giftranscode.py)
+        await run.io_bound(GifTranscoder.video_to_gif, video_file, gif_file, 1000 / duration,
+                           width=width, height=height, loop=loop)
 
     @staticmethod
     def get_video_dimensions(video_path):
@@ -732,11 +751,20 @@ class CASTUtils:
             tuple: A tuple containing the width and height of the video, or (None, None) if an error occurs.
         """
         try:
+            if MediaCatalog.is_local(video_path):
+                # probed once per file version (see mediacatalog.py)
+                info = MediaCatalog.info(video_path)
+                width, height = int(info['CV_CAP_PROP_FRAME_WIDTH']), int(info['CV_CAP_PROP_FRAME_HEIGHT'])
+                if width > 0 and height > 0:
+                    return width, height
+            # not readable by cv2 (or not local): PyAV
             container = av.open(video_path)
             video_stream = container.streams.video[0]
             width = video_stream.width
             height = video_stream.height
             container.close()
+            if not (width and height):
+                return None, None
             return width, height
         except Exception as er:
             utils_logger.error(f"Error getting video dimensions: {er}")
@@ -983,13 +1011,11 @@ class CASTUtils:
 
     @staticmethod
     def sl_clean(sl, sl_process, t_name):
-        """ clean ShareableList """
+        """ clean preview channel and its process """
         try:
             if sl is not None:
-                # close the shared memory
-                sl.shm.close()
-                # destroy the shared memory
-                sl.shm.unlink()
+                # close and destroy the shared memory
+                sl.close()
             if sl_process is not None:
                 utils_logger.debug(f'Stopping Child Process for Preview if any : {t_name}')
                 sl_process.kill()
@@ -1028,40 +1054,14 @@ class CASTUtils:
         Returns:
             str or None: The direct video URL if found, otherwise None.
         """
-        ydl_opts = {
-            'format': iformat,
-            'noplaylist': True,  # Prevents playlist processing
-            'quiet': True,
-            'extract_flat': False,  # Ensure we get detailed info
-        }
-
-        with YTdl(ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
-
-        # Ensure we return only one URL
-        if 'url' in info:
-            return info['url']
-        elif 'entries' in info and isinstance(info['entries'], list) and len(info['entries']) > 0:
-            return info['entries'][0].get('url', None)
-
-        return None  # If no URL found
+        # resolved once per video id / format, until the url expires (see ytstream.py)
+        return await run.io_bound(YtCache.resolve, video_url, iformat)
 
     @staticmethod
     async def list_yt_formats(url):
         """ List available format for an YT Url """
 
-        ydl_opts = {
-            'listformats': True,
-            'socket_timeout': 2,  # timeout try access Url
-            'noplaylist': True,  # Do not download playlists
-            'ignoreerrors': True,  # Ignore errors, such as unavailable formats
-            'quiet': True,  # Suppress unnecessary output
-        }
-
-        with YTdl(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-
-        return info
+        return await run.io_bound(YtCache.formats, url)
 
     @staticmethod
     async def youtube_download(yt_url: str = None, interactive: bool = True):
@@ -0,0 +1,202 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the `WorkerPool` class, a small set of pre-started helper processes used to run the cv2 preview
+windows (`CV2Utils.sl_main_proc_preview`) and the Coldtype scripts (`RUNColdtype`).
+
+`Utils.mp_setup` uses the 'spawn' start method on Linux / macOS (and Windows only has spawn): each new process starts
+a fresh interpreter and imports cv2, numpy, PIL, the config stack or Coldtype before doing anything. This took
+seconds, each time the preview was toggled or a script was started. Pool workers are spawned in advance, import these
+modules, then wait on a pipe for their job: the job starts at once.
+
+Key Architectural Components:
+
+1.  WorkerPool Class:
+    -   **`start`**: Spawns `size` workers (see `worker_pool` in the [app] config section), called at app init.
+    -   **`submit`**: Hands a job (picklable function + args) to a ready worker and returns its `Process` object, so
+        callers keep using `is_alive`, `kill`, `join`, `pid` ... A replacement worker is spawned in background.
+        Without ready worker (pool disabled or all used), a new process is started as before.
+    -   **One job per worker**: a worker exits with its job, cv2 windows or Coldtype state never leak to the next job.
+    -   **Console capture**: a multiprocessing Queue can only be given to a process at spawn time, so a worker gets the
+        pool log queue instead; lines are tagged with the worker PID and a relay thread forwards them to the
+        `log_queue` given with the job.
+    -   **`stop`**: Ends idle workers, called at app shutdown.
+"""
+
+import contextlib
+import importlib
+import multiprocessing
+import os
+import threading
+
+from configmanager import LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.workerpool')
+workerpool_logger = logger_manager.logger
+
+# imported by workers while waiting for a job
+PRELOAD = ('cv2', 'numpy', 'PIL.Image', 'src.utl.cv2utils', 'src.txt.coldtypemp')
+
+
+class _LogRelay:
+    """log_queue given to a pooled job: lines go to the pool queue, tagged with the worker PID."""
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    def put(self, message):
+        self.queue.put((os.getpid(), message))
+
+
+def _worker_main(conn, log_queue, preload):
+    """Worker process entry point: import modules, wait for one job, run it."""
+    for module in preload:
+        with contextlib.suppress(Exception):
+            importlib.import_module(module)
+
+    try:
+        job = conn.recv()
+    except (EOFError, OSError):
+        job = None
+    finally:
+        conn.close()
+
+    if job is None:
+        return
+
+    target, args, kwargs, capture = job
+    if capture:
+        kwargs['log_queue'] = _LogRelay(log_queue)
+    target(*args, **kwargs)
+
+
+class WorkerPool:
+    """Pre-started processes, ready to run preview / Coldtype jobs."""
+
+    size = 0
+    _idle = []  # (process, connection) waiting for a job
+    _routes = {}  # pid -> (process, log queue) of running jobs
+    _lock = threading.Lock()
+    _process = None
+    _log_queue = None
+
+    @classmethod
+    def start(cls, size=1):
+        """Spawn size workers, 0 disables the pool."""
+        from src.utl.utils import CASTUtils as Utils
+
+        with cls._lock:
+            cls.size = size
+            if size <= 0 or cls._process is not None:
+                return
+            cls._process, queue = Utils.mp_setup()
+            cls._log_queue = queue()
+            threading.Thread(target=cls._relay_logs, daemon=True, name='WorkerPoolLogs').start()
+
+        cls._refill()
+        workerpool_logger.info(f'Worker pool started with {size} process(es)')
+
+    @classmethod
+    def _refill(cls):
+        """Spawn workers until size are ready."""
+        with cls._lock:
+            if cls._process is None:
+                return
+            cls._idle = [(proc, conn) for proc, conn in cls._idle if proc.is_alive()]
+            cls._routes = {pid: route for pid, route in cls._routes.items() if route[0].is_alive()}
+            for _ in range(cls.size - len(cls._idle)):
+                parent_conn, child_conn = multiprocessing.Pipe()
+                proc = cls._process(target=_worker_main,
+                                    args=(child_conn, cls._log_queue, PRELOAD),
+                                    name='WorkerPool',
+                                    daemon=True)
+                proc.start()
+                child_conn.close()
+                cls._idle.append((proc, parent_conn))
+
+    @classmethod
+    def submit(cls, target, args=(), kwargs=None, log_queue=None):
+        """Run target(*args, **kwargs) in a ready worker (or a new process), return the process.
+
+        If log_queue is given, target receives it as 'log_queue' keyword argument.
+        """
+        kwargs = dict(kwargs or {})
+        worker = None
+
+        with cls._lock:
+            while cls._idle and worker is None:
+                proc, conn = cls._idle.pop(0)
+                try:
+                    if proc.is_alive():
+                        if log_queue is not None:
+                            cls._routes[proc.pid] = (proc, log_queue)
+                        conn.send((target, args, kwargs, log_queue is not None))
+                        worker = proc
+                except Exception as er:
+                    workerpool_logger.error(f'Error to hand job to worker {proc.pid} : {er}')
+                    cls._routes.pop(proc.pid, None)
+                finally:
+                    # worker without job exits on EOF
+                    conn.close()
+
+        if worker is not None:
+            workerpool_logger.debug(f'Job {getattr(target, "__qualname__", target)} run by worker {worker.pid}')
+            threading.Thread(target=cls._refill, daemon=True, name='WorkerPoolRefill').start()
+            return worker
+
+        # no ready worker: start a new process, as without pool
+        if cls._process is None:
+            from src.utl.utils import CASTUtils as Utils
+            process_class, _ = Utils.mp_setup()
+        else:
+            process_class = cls._process
+        if log_queue is not None:
+            kwargs['log_queue'] = log_queue
+        proc = process_class(target=target, args=args, kwargs=kwargs, daemon=True)
+        proc.start()
+        return proc
+
+    @classmethod
+    def _relay_logs(cls):
+        """Forward console lines of pooled jobs to their own log queue."""
+        while True:
+            try:
+                item = cls._log_queue.get()
+            except (EOFError, OSError, ValueError):
+                break
+            if item is None:
+                break
+            pid, message = item
+            if route := cls._routes.get(pid):
+                with contextlib.suppress(Exception):
+                    route[1].put(message)
+
+    @classmethod
+    def get_stats(cls):
+        """Pool status, for info / API."""
+        return {'size': cls.size,
+                'ready': sum(proc.is_alive() for proc, _ in cls._idle),
+                'captured_jobs': len(cls._routes)}
+
+    @classmethod
+    def stop(cls):
+        """End idle workers."""
+        with cls._lock:
+            for proc, conn in cls._idle:
+                with contextlib.suppress(Exception):
+                    conn.send(None)
+                conn.close()
+            for proc, _ in cls._idle:
+                proc.join(timeout=.5)
+                if proc.is_alive():
+                    proc.kill()
+            cls._idle = []
+            if cls._log_queue is not None:
+                with contextlib.suppress(Exception):
+                    cls._log_queue.put(None)
+            cls._process = None
+            cls._log_queue = None
+        workerpool_logger.debug('Worker pool stopped')
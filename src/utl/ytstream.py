@@ -0,0 +1,391 @@
+"""
+a: zak-45
+d: 18/10/2026
+v: 1.0.0
+
+Overview:
+This file defines the YouTube helpers of Media casts: `YtCache`, a TTL cache of yt_dlp results, and
+`ProgressiveCapture`, a cast input that starts decoding a YouTube video while it is still downloading.
+
+Each cast of a YouTube url resolved its formats again with yt_dlp (several seconds), and the download mode waited for
+the whole file before the first frame reached the LEDs: tens of seconds for a long video.
+
+Key Architectural Components:
+
+1.  YtCache Class:
+    -   Resolved stream urls, format lists and video info, keyed by video id (+ format), kept `yt_cache_ttl` seconds.
+    -   Stream urls are signed with an expiry time (`expire` parameter), an entry never outlives it.
+
+2.  YtDownload Class:
+    -   yt_dlp download of a single file format (`yt_progressive_format`, no merge step) in a background thread,
+        written under its final name (media/yt-tmp-<id>.<ext>). One download per video id, shared by all casts;
+        once finished, next casts read the local file.
+
+3.  GrowingFile / ProgressiveCapture Classes:
+    -   `GrowingFile` is the file object given to PyAV: a read at the current end of the partial file waits for the
+        download instead of returning end of file.
+    -   `ProgressiveCapture` decodes it as soon as `yt_progressive_kb` KB have arrived, with a cv2.VideoCapture like
+        API (`read`, `get`, `set`, `release`). The length is estimated from the yt_dlp info (duration * fps), then
+        set to the frames read once the end of the finished download is reached, so repeat and playlists see the
+        real end. Forward seeks decode forward, backward seeks restart from the file start.
+"""
+
+import os
+import re
+import threading
+import time
+
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qs
+
+import av
+import cv2
+
+try:
+    from yt_dlp import YoutubeDL as YTdl
+except Exception as e:
+    YTdl = None
+    print(f'INFO : this is Not a YT version: {e}')
+
+from src.utl.keyindex import IndexedCapture
+from configmanager import cfg_mgr, LoggerManager
+
+logger_manager = LoggerManager(logger_name='WLEDLogger.ytstream')
+ytstream_logger = logger_manager.logger
+
+YT_ID = re.compile(r'(?:v=|youtu\.be/|shorts/|embed/|live/)([\w-]{11})')
+CACHE_SIZE = 128
+EXPIRE_MARGIN = 60  # s, stream url not used in its last minute
+
+
+class YtCache:
+    """yt_dlp results by video id, with a time to live."""
+
+    _lock = threading.Lock()
+    _entries = OrderedDict()  # (kind, video id, format) -> (expires, value)
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def video_id(url):
+        """YouTube video id of url, url itself if not found."""
+        found = YT_ID.search(str(url))
+        return found.group(1) if found else str(url)
+
+    @staticmethod
+    def is_youtube(url):
+        value = str(url)
+        return '://' in value and 'youtu' in urlparse(value).netloc.lower()
+
+    @staticmethod
+    def url_expire(stream_url):
+        """Expiry time (epoch s) of a signed stream url, None if not given."""
+        try:
+            return int(parse_qs(urlparse(str(stream_url)).query)['expire'][0])
+        except (KeyError, IndexError, ValueError):
+            return None
+
+    @classmethod
+    def get(cls, kind, url, iformat=''):
+        key = (kind, cls.video_id(url), iformat)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry[0] > time.time():
+                cls._entries.move_to_end(key)
+                cls.hits += 1
+                return entry[1]
+            cls._entries.pop(key, None)
+            cls.misses += 1
+            return None
+
+    @classmethod
+    def put(cls, kind, url, value, iformat='', expire=None):
+        """Keep value yt_cache_ttl seconds, less if the stream url expires before."""
+        expires = time.time() + float(cfg_mgr.app_config.get('yt_cache_ttl', 3600))
+        if expire is not None:
+            expires = min(expires, expire - EXPIRE_MARGIN)
+        with cls._lock:
+            cls._entries[(kind, cls.video_id(url), iformat)] = (expires, value)
+            while len(cls._entries) > CACHE_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def resolve(cls, video_url, iformat='best'):
+        """Direct stream url of a YouTube video, from the cache or resolved by yt_dlp."""
+        stream_url = cls.get('url', video_url, iformat)
+        if stream_url is not None:
+            return stream_url
+
+        ydl_opts = {
+            'format': iformat,
+            'noplaylist': True,  # Prevents playlist processing
+            'quiet': True,
+            'extract_flat': False,  # Ensure we get detailed info
+        }
+        with YTdl(ydl_opts) as ydl:
+            info = ydl.extract_info(video_url, download=False)
+
+        # Ensure we return only one URL
+        if 'url' in info:
+            stream_url = info['url']
+        elif 'entries' in info and isinstance(info['entries'], list) and len(info['entries']) > 0:
+            stream_url = info['entries'][0].get('url', None)
+        if stream_url is not None:
+            cls.put('url', video_url, stream_url, iformat, cls.url_expire(stream_url))
+        return stream_url
+
+    @classmethod
+    def formats(cls, url):
+        """yt_dlp info with the available formats of url, from the cache or extracted."""
+        info = cls.get('formats', url)
+        if info is None:
+            ydl_opts = {
+                'listformats': True,
+                'socket_timeout': 2,  # timeout try access Url
+                'noplaylist': True,  # Do not download playlists
+                'ignoreerrors': True,  # Ignore errors, such as unavailable formats
+                'quiet': True,  # Suppress unnecessary output
+            }
+            with YTdl(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+            if info is not None:
+                cls.put('formats', url, info)
+        return info
+
+    @classmethod
+    def get_stats(cls):
+        return {'entries': len(cls._entries), 'hits': cls.hits, 'misses': cls.misses}
+
+
+class YtDownload:
+    """Background download of one YouTube video, readable while downloading."""
+
+    _lock = threading.Lock()
+    _downloads = {}  # video id -> YtDownload
+
+    def __init__(self, url):
+        self.url = url
+        self.path = None
+        self.downloaded = 0
+        self.total = 0
+        self.info = None
+        self.error = None
+        self.done = threading.Event()
+        self.started = threading.Event()  # path known
+        self._thread = threading.Thread(target=self._download, daemon=True, name='YtDownload')
+        self._thread.start()
+
+    @classmethod
+    def get(cls, url):
+        """Running or finished download of url, a new one if none or if its file is gone."""
+        video_id = YtCache.video_id(url)
+        with cls._lock:
+            download = cls._downloads.get(video_id)
+            if (download is None or download.error or
+                    download.done.is_set() and not (download.path and os.path.isfile(download.path))):
+                download = cls._downloads[video_id] = cls(url)
+            return download
+
+    def _hook(self, d):
+        if d['status'] in ('downloading', 'finished'):
+            self.path = d.get('filename', self.path)
+            self.downloaded = d.get('downloaded_bytes') or self.downloaded
+            self.total = d.get('total_bytes') or d.get('total_bytes_estimate') or self.total
+            self.started.set()
+
+    def _download(self):
+        ydl_opts = {
+            'format': cfg_mgr.app_config.get('yt_progressive_format', '18/best[vcodec!=none][acodec!=none]/best'),
+            'paths': {'temp': cfg_mgr.app_root_path('tmp')},
+            'outtmpl': cfg_mgr.app_root_path('media/yt-tmp-%(id)s.%(ext)s'),
+            'nopart': True,  # final name from the start, the file is read while written
+            'progress_hooks': [self._hook],
+            'noplaylist': True,
+            'quiet': True,
+        }
+        try:
+            with YTdl(ydl_opts) as ydl:
+                info = YtCache.get('info', self.url, ydl_opts['format'])
+                if info is None:
+                    info = ydl.extract_info(self.url, download=False)
+                    YtCache.put('info', self.url, info, ydl_opts['format'], YtCache.url_expire(info.get('url')))
+                self.info = info
+                ydl.process_ie_result(dict(info), download=True)
+        except Exception as er:
+            self.error = str(er)
+            ytstream_logger.error(f'YouTube download error {self.url} : {er}')
+        finally:
+            self.done.set()
+            self.started.set()
+
+    def wait_data(self, size, timeout):
+        """Wait until size bytes are on disk (or download end), return True if the file can be read."""
+        end = time.time() + timeout
+        self.started.wait(timeout)
+        while not self.done.is_set() and time.time() < end:
+            if self.path and os.path.isfile(self.path) and os.path.getsize(self.path) >= size:
+                return True
+            time.sleep(.05)
+        return self.error is None and self.path is not None and os.path.isfile(self.path)
+
+
+class GrowingFile:
+    """Partial download file: a read at its end waits for more data until the download ends."""
+
+    def __init__(self, download, timeout):
+        self.download = download
+        self.timeout = timeout
+        self._file = open(download.path, 'rb')
+
+    def read(self, size=-1):
+        end = time.time() + self.timeout
+        while True:
+            data = self._file.read(size)
+            if data or self.download.done.is_set() or time.time() > end:
+                return data
+            time.sleep(.02)
+
+    def close(self):
+        self._file.close()
+
+
+class ProgressiveCapture:
+    """YouTube video decoded by PyAV while downloading, read like a cv2.VideoCapture."""
+
+    def __init__(self, download):
+        self.download = download
+        self.timeout = float(cfg_mgr.app_config.get('yt_progressive_timeout', 30))
+        info = download.info or {}
+        self.fps = float(info.get('fps') or 25)
+        # estimate from the yt_dlp info, exact once read up to the end of the finished download
+        self.length = int(float(info.get('duration') or 0) * self.fps) or -1
+        self.exact = False
+        self.position = 0
+        self.last_ms = 0.0
+        self.file = None
+        self.container = None
+        try:
+            self._open()
+        except Exception:
+            self._close()
+            raise
+
+    @classmethod
+    def open(cls, url):
+        """Media for a YouTube url: local file if downloaded, else progressive capture, else the stream url.
+
+        None if it can not be opened (errors are logged), the caller falls back to `stream`.
+        """
+        if YTdl is None:
+            return None
+        if str(cfg_mgr.app_config.get('yt_progressive', 'True')).lower() not in ('true', '1', 'yes', 'on'):
+            return cls.stream(url)
+
+        download = YtDownload.get(url)
+        first_kb = float(cfg_mgr.app_config.get('yt_progressive_kb', 512))
+        if not download.wait_data(first_kb * 1024, float(cfg_mgr.app_config.get('yt_progressive_timeout', 30))):
+            ytstream_logger.error(f'No data for {url} : {download.error}')
+            return None
+        if download.done.is_set():
+            return IndexedCapture.open(download.path) or cv2.VideoCapture(download.path)
+        ytstream_logger.debug(f'Progressive cast of {url} from {download.path}')
+        try:
+            return cls(download)
+        except Exception as er:
+            # e.g. mp4 with its index at the end: not readable as a stream while downloading
+            ytstream_logger.error(f'Progressive cast of {url} not possible : {er}')
+            return None
+
+    @staticmethod
+    def stream(url):
+        """cv2.VideoCapture of the stream url resolved by yt_dlp (cached), None if not resolved."""
+        if YTdl is None:
+            return None
+        try:
+            stream_url = YtCache.resolve(url)
+        except Exception as er:
+            ytstream_logger.error(f'YouTube url not resolved {url} : {er}')
+            return None
+        return cv2.VideoCapture(stream_url) if stream_url else None
+
+    def _open(self):
+        """(Re)open the partial file from its start."""
+        self._close()
+        self.file = GrowingFile(self.download, self.timeout)
+        # file object without seek: read as a stream, the demuxer never jumps to a part not yet downloaded
+        self.container = av.open(self.file, 'r')
+        self.stream = self.container.streams.video[0]
+        self.stream.thread_type = 'AUTO'
+        self._frames = self.container.decode(self.stream)
+        self.position = 0
+
+    def _close(self):
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _next(self):
+        try:
+            return next(self._frames)
+        except (StopIteration, av.error.FFmpegError):
+            return None
+
+    def seek(self, number):
+        """Forward: decode up to number, backward: restart from the file start."""
+        number = max(int(number), 0)
+        if number < self.position:
+            self._open()
+        while self.position < number:
+            if self._next() is None:
+                return False
+            self.position += 1
+        return True
+
+    """
+    cv2.VideoCapture like API, used by CASTMedia
+    """
+
+    def isOpened(self):
+        return self.container is not None
+
+    def read(self):
+        frame = self._next()
+        if frame is None:
+            if self.download.done.is_set() and not self.exact:
+                self.length, self.exact = self.position, True
+            return False, None
+        self.position += 1
+        self.last_ms = float(frame.time) * 1000 if frame.time is not None else self.position * 1000 / self.fps
+        return True, frame.to_ndarray(format='bgr24')
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            if self.exact or self.length < 0:
+                return self.length
+            # estimate never below the frames already read: the cast does not stop before the real end
+            return max(self.length, self.position + 1)
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.position
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.last_ms
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.stream.codec_context.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.stream.codec_context.height
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self.seek(value)
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.seek(value / 1000 * self.fps)
+        return False
+
+    def release(self):
+        self._close()
+